@@ -0,0 +1,100 @@
+"""
+Benchmark Corpora
+Fixed, seeded text corpora for repeatable sentiment benchmarks
+"""
+
+import random
+from typing import List, Dict
+
+COMPANIES = [
+    'Apple', 'Microsoft', 'Amazon', 'Walmart', 'ExxonMobil', 'UnitedHealth',
+    'CVS Health', 'Berkshire Hathaway', 'Alphabet', 'McKesson', 'Chevron', 'JPMorgan'
+]
+
+POSITIVE_PHRASES = [
+    'beat analyst expectations', 'reported record revenue', 'raised full-year guidance',
+    'shares surged', 'announced a strong buyback', 'won a major contract',
+    'posted robust growth', 'expanded margins', 'delighted investors'
+]
+
+NEGATIVE_PHRASES = [
+    'missed earnings estimates', 'cut its outlook', 'shares plunged',
+    'faces a regulatory probe', 'announced layoffs', 'warned of weak demand',
+    'reported a surprise loss', 'recalled products', 'disappointed investors'
+]
+
+NEUTRAL_PHRASES = [
+    'will report results next week', 'held its annual meeting', 'named a new director',
+    'updated its website', 'filed a routine disclosure', 'opened a regional office',
+    'scheduled an investor call', 'published its sustainability report'
+]
+
+FILLER_SENTENCES = [
+    'Analysts said the quarter was closely watched by the market.',
+    'The company did not respond to a request for comment.',
+    'Trading volume was in line with the thirty-day average.',
+    'The results come amid broader uncertainty in the sector.',
+    'Executives discussed supply chain conditions on the call.',
+    'Several brokerages updated their price targets after the release.',
+    'The board is expected to review the strategy later this year.',
+    'Competitors have announced similar initiatives in recent months.'
+]
+
+HTML_TEMPLATES = [
+    '<p>{sentence}</p>',
+    '<div class="story-body"><span>{sentence}</span></div>',
+    '<a href="https://example.com/markets/{slug}?utm_source=rss&amp;id=123">{sentence}</a>',
+    '<p><strong>{company}</strong> &mdash; {sentence} <img src="https://cdn.example.com/{slug}.jpg"/></p>',
+    '<ul><li>{sentence}</li><li>Read more at https://news.example.com/{slug}</li></ul>'
+]
+
+def _headline(rng: random.Random) -> str:
+    """Build a single short headline"""
+    phrases = rng.choice([POSITIVE_PHRASES, NEGATIVE_PHRASES, NEUTRAL_PHRASES])
+    return f"{rng.choice(COMPANIES)} {rng.choice(phrases)}"
+
+def short_headlines(count: int = 1000, seed: int = 1) -> List[str]:
+    """Headline-length texts (roughly 5-12 words)"""
+    rng = random.Random(seed)
+    return [_headline(rng) for _ in range(count)]
+
+def long_summaries(count: int = 200, seed: int = 2, sentences: int = 40) -> List[str]:
+    """Long article summaries mixing sentiment-bearing and filler sentences"""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        parts = []
+        for _ in range(sentences):
+            if rng.random() < 0.3:
+                parts.append(_headline(rng) + '.')
+            else:
+                parts.append(rng.choice(FILLER_SENTENCES))
+        corpus.append(' '.join(parts))
+    return corpus
+
+def html_heavy(count: int = 300, seed: int = 3, blocks: int = 15) -> List[str]:
+    """RSS-style content with markup, entities and URLs for clean_text"""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        parts = []
+        for j in range(blocks):
+            sentence = _headline(rng) if rng.random() < 0.4 else rng.choice(FILLER_SENTENCES)
+            parts.append(rng.choice(HTML_TEMPLATES).format(
+                sentence=sentence,
+                company=rng.choice(COMPANIES),
+                slug=f"story-{i}-{j}"
+            ))
+        corpus.append(''.join(parts))
+    return corpus
+
+def get_corpora(scale: float = 1.0) -> Dict[str, List[str]]:
+    """All benchmark corpora, optionally scaled down for quick runs"""
+    def size(n: int) -> int:
+        return max(1, int(n * scale))
+
+    return {
+        'short_headlines': short_headlines(size(1000)),
+        'long_summaries': long_summaries(size(200)),
+        'html_heavy': html_heavy(size(300))
+    }
@@ -0,0 +1,121 @@
+"""
+Query Fetch Benchmark
+Compares tuple fetchall() against Arrow fetching for SnowflakeManager reads
+"""
+
+import sys
+import os
+import gc
+import json
+import time
+import argparse
+from datetime import datetime
+from typing import Dict, Any, Callable
+
+import pandas as pd
+import pyarrow as pa
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.snowflake_manager import SnowflakeManager
+
+DEFAULT_RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+def fetch_tuples(db_manager: SnowflakeManager, query: str) -> pd.DataFrame:
+    """The previous read path: Python tuples, then a DataFrame"""
+    cursor = db_manager.connection.cursor()
+    cursor.execute(query)
+    rows = cursor.fetchall()
+    columns = [desc[0].lower() for desc in cursor.description]
+    cursor.close()
+    return pd.DataFrame(rows, columns=columns)
+
+def fetch_arrow(db_manager: SnowflakeManager, query: str) -> pd.DataFrame:
+    """Arrow result batches straight into a DataFrame"""
+    return db_manager._fetch_dataframe(query)
+
+def fetch_streaming(db_manager: SnowflakeManager, query: str) -> int:
+    """Stream Arrow batches without materialising the whole result"""
+    return sum(batch.num_rows for batch in db_manager.iter_arrow_batches(query))
+
+def measure(func: Callable[[], Any], repeats: int) -> Dict[str, Any]:
+    """Best-of-N wall time plus Arrow memory allocated during the last run"""
+    timings = []
+    rows = 0
+    arrow_bytes = 0
+    for _ in range(repeats):
+        gc.collect()
+        before = pa.total_allocated_bytes()
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+        arrow_bytes = max(arrow_bytes, pa.total_allocated_bytes() - before)
+        rows = result if isinstance(result, int) else len(result)
+        if isinstance(result, pd.DataFrame):
+            result_bytes = int(result.memory_usage(deep=True).sum())
+        else:
+            result_bytes = 0
+        del result
+
+    return {
+        'rows': rows,
+        'best_seconds': min(timings),
+        'mean_seconds': sum(timings) / len(timings),
+        'dataframe_bytes': result_bytes,
+        'arrow_allocated_bytes': arrow_bytes
+    }
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description='SnowflakeManager read-path benchmark')
+    parser.add_argument('--windows', type=int, nargs='+', default=[30, 365], help='Day windows to benchmark')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per method (best is reported)')
+    parser.add_argument('--output', help='Path for machine-readable JSON results')
+
+    args = parser.parse_args()
+
+    print("=== Query Fetch Benchmark ===")
+
+    results: Dict[str, Any] = {}
+    with SnowflakeManager() as db_manager:
+        # Disable the result cache so every run does the same work
+        cursor = db_manager.connection.cursor()
+        cursor.execute("ALTER SESSION SET USE_CACHED_RESULT = FALSE")
+        cursor.close()
+
+        for days in args.windows:
+            queries = {
+                'daily_sentiment': db_manager.daily_sentiment_query(days),
+                'articles_raw': f"""
+                    SELECT article_id, company_id, title, url, source, published_date, scraped_date
+                    FROM NEWS_ARTICLES
+                    WHERE scraped_date >= DATEADD(day, -{int(days)}, CURRENT_DATE())
+                """
+            }
+
+            for name, query in queries.items():
+                key = f"{name}_{days}d"
+                print(f"\n📊 {key}")
+                results[key] = {
+                    'fetchall_tuples': measure(lambda: fetch_tuples(db_manager, query), args.repeats),
+                    'arrow_pandas_all': measure(lambda: fetch_arrow(db_manager, query), args.repeats),
+                    'arrow_streaming': measure(lambda: fetch_streaming(db_manager, query), args.repeats)
+                }
+                for method, stats in results[key].items():
+                    print(f"   - {method}: {stats['rows']:,} rows in {stats['best_seconds']:.3f}s "
+                          f"(df {stats['dataframe_bytes'] / 1024:,.0f} KB, "
+                          f"arrow {stats['arrow_allocated_bytes'] / 1024:,.0f} KB)")
+
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"query_fetch_{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({'generated_at': datetime.utcnow().isoformat(), 'results': results}, f, indent=2)
+    print(f"\n💾 Results written to {output}")
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
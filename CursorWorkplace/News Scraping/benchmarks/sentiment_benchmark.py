@@ -0,0 +1,224 @@
+"""
+Sentiment Engine Benchmark
+Per-engine throughput, latency percentiles and memory over fixed corpora
+"""
+
+import sys
+import os
+import gc
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+from datetime import datetime
+from typing import List, Dict, Any, Callable
+
+# Add project root to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.corpora import get_corpora
+from src.sentiment.sentiment_analyzer import SentimentAnalyzer
+from src.models.news_article import SentimentEngine
+
+DEFAULT_RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+def peak_memory_kb(run: Callable[[], Any]) -> float:
+    """Peak traced memory of one call, in its own pass so tracing never slows a timed pass"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+def measure(func: Callable[[str], Any], texts: List[str]) -> Dict[str, float]:
+    """Run func over texts, recording latency and throughput, then peak traced memory in a second pass"""
+    gc.collect()
+
+    latencies = []
+    start = time.perf_counter()
+    for text in texts:
+        call_start = time.perf_counter()
+        func(text)
+        latencies.append((time.perf_counter() - call_start) * 1000)
+    elapsed = time.perf_counter() - start
+
+    def run_all():
+        for text in texts:
+            func(text)
+
+    return {
+        'texts': len(texts),
+        'total_seconds': elapsed,
+        'throughput_per_sec': len(texts) / elapsed if elapsed else 0.0,
+        'latency_ms_p50': percentile(latencies, 50),
+        'latency_ms_p95': percentile(latencies, 95),
+        'latency_ms_p99': percentile(latencies, 99),
+        'latency_ms_max': max(latencies) if latencies else 0.0,
+        'peak_memory_kb': peak_memory_kb(run_all)
+    }
+
+def measure_batch(func: Callable[[List[str]], Any], texts: List[str]) -> Dict[str, float]:
+    """Time a single batch call over all texts, then measure its peak traced memory in a second pass"""
+    gc.collect()
+
+    start = time.perf_counter()
+    func(texts)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'texts': len(texts),
+        'total_seconds': elapsed,
+        'throughput_per_sec': len(texts) / elapsed if elapsed else 0.0,
+        'peak_memory_kb': peak_memory_kb(lambda: func(texts))
+    }
+
+def run_benchmarks(analyzer: SentimentAnalyzer, corpora: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Benchmark every available engine and preprocessing step on every corpus"""
+    engines = {
+        SentimentEngine.TEXTBLOB.value: analyzer.analyze_with_textblob,
+        SentimentEngine.VADER.value: analyzer.analyze_with_vader
+    }
+    if analyzer.nltk_analyzer:
+        engines[SentimentEngine.NLTK.value] = analyzer.analyze_with_nltk
+    if analyzer.linear_model:
+        engines[SentimentEngine.LINEAR.value] = analyzer.analyze_with_linear
+
+    results = {}
+    for corpus_name, texts in corpora.items():
+        print(f"\n📚 Corpus: {corpus_name} ({len(texts)} texts)")
+        cleaned = [analyzer.clean_text(text) for text in texts]
+        corpus_results = {
+            'steps': {
+                'clean_text': measure(analyzer.clean_text, texts),
+                'extract_keywords': measure(analyzer.extract_keywords, cleaned)
+            },
+            'engines': {}
+        }
+
+        for step, stats in corpus_results['steps'].items():
+            print(f"   - {step}: {stats['throughput_per_sec']:,.0f}/s, p95 {stats['latency_ms_p95']:.3f} ms")
+
+        for engine_name, analyze in engines.items():
+            # Keywords are passed in so engine numbers measure scoring only
+            stats = measure(lambda text: analyze(text, []), texts)
+            corpus_results['engines'][engine_name] = stats
+            print(f"   - {engine_name}: {stats['throughput_per_sec']:,.1f}/s, "
+                  f"p50 {stats['latency_ms_p50']:.2f} ms, p95 {stats['latency_ms_p95']:.2f} ms, "
+                  f"peak {stats['peak_memory_kb']:,.0f} KB")
+
+        if analyzer.linear_model:
+            stats = measure_batch(lambda batch: analyzer.analyze_batch_with_linear(batch, [[]] * len(batch)), texts)
+            corpus_results['engines']['linear_batch'] = stats
+            print(f"   - linear_batch: {stats['throughput_per_sec']:,.1f}/s")
+
+        results[corpus_name] = corpus_results
+
+    return results
+
+def compare_to_baseline(results: Dict[str, Any], baseline: Dict[str, Any],
+                        max_throughput_drop: float, max_latency_increase: float) -> List[str]:
+    """Return a description of every metric that regressed beyond the thresholds"""
+    regressions = []
+
+    for corpus_name, corpus_results in results.items():
+        baseline_corpus = baseline.get(corpus_name)
+        if not baseline_corpus:
+            continue
+
+        for group in ('steps', 'engines'):
+            for name, stats in corpus_results[group].items():
+                reference = baseline_corpus.get(group, {}).get(name)
+                if not reference:
+                    continue
+
+                label = f"{corpus_name}/{name}"
+                old_rate, new_rate = reference['throughput_per_sec'], stats['throughput_per_sec']
+                if old_rate and new_rate < old_rate * (1 - max_throughput_drop):
+                    regressions.append(
+                        f"{label}: throughput {new_rate:,.1f}/s vs baseline {old_rate:,.1f}/s"
+                    )
+
+                old_p95, new_p95 = reference.get('latency_ms_p95'), stats.get('latency_ms_p95')
+                if old_p95 and new_p95 and new_p95 > old_p95 * (1 + max_latency_increase):
+                    regressions.append(
+                        f"{label}: p95 latency {new_p95:.3f} ms vs baseline {old_p95:.3f} ms"
+                    )
+
+    return regressions
+
+def main():
+    """Main benchmark function"""
+    parser = argparse.ArgumentParser(description='Sentiment engine benchmark suite')
+    parser.add_argument('--scale', type=float, default=1.0, help='Scale corpus sizes (e.g. 0.1 for a quick run)')
+    parser.add_argument('--output', help='Path for machine-readable JSON results')
+    parser.add_argument('--baseline', help='Baseline results JSON to compare against')
+    parser.add_argument('--save-baseline', help='Also write these results as a new baseline')
+    parser.add_argument('--max-throughput-drop', type=float, default=0.20,
+                        help='Allowed fractional throughput drop before failing')
+    parser.add_argument('--max-latency-increase', type=float, default=0.30,
+                        help='Allowed fractional p95 latency increase before failing')
+
+    args = parser.parse_args()
+
+    print("=== Sentiment Engine Benchmark ===")
+
+    analyzer = SentimentAnalyzer()
+    results = run_benchmarks(analyzer, get_corpora(args.scale))
+
+    report = {
+        'generated_at': datetime.utcnow().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scale': args.scale,
+        'linear_model_version': analyzer.linear_model.model_version if analyzer.linear_model else None,
+        'results': results
+    }
+
+    output = args.output or os.path.join(
+        DEFAULT_RESULTS_DIR, f"sentiment_{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {output}")
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        if baseline.get('scale') != args.scale:
+            print(f"⚠️ Baseline scale {baseline.get('scale')} differs from run scale {args.scale}")
+
+        regressions = compare_to_baseline(
+            results, baseline.get('results', {}),
+            args.max_throughput_drop, args.max_latency_increase
+        )
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            return 1
+
+        print(f"\n✅ No regressions against {args.baseline}")
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
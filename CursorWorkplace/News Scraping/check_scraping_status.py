@@ -7,93 +7,72 @@ Script to verify if today's daily scraping ran successfully
 import os
 import sys
 from datetime import datetime, date
-from pathlib import Path
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-def check_logs():
-    """Check recent log entries for today's scraping"""
-    print("📋 Checking log files...")
+def check_pipeline_runs():
+    """Check today's runs in PIPELINE_RUNS (or the local run history)"""
+    print("📋 Checking pipeline run history...")
     
-    log_file = Path("logs/scraper.log")
-    if not log_file.exists():
-        print("❌ No log file found at logs/scraper.log")
-        return False
+    # Run timestamps are recorded in UTC
+    today_start = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    runs = []
     
-    # Read the last 50 lines of the log
-    with open(log_file, 'r') as f:
-        lines = f.readlines()
-        recent_lines = lines[-50:] if len(lines) > 50 else lines
+    try:
+        from src.database.storage_backend import get_storage_backend
+        
+        with get_storage_backend() as db_manager:
+            if db_manager.connection:
+                df = db_manager.get_pipeline_runs(limit=20, since=today_start)
+                runs = df.to_dict('records')
+    except Exception as e:
+        print(f"⚠️ Could not read PIPELINE_RUNS: {e}")
     
-    today = date.today()
-    today_str = today.strftime("%Y-%m-%d")
+    if not runs:
+        # Runs are also appended locally, so failures that never reached storage still show up
+        from src.pipeline.run_history import read_local_history
+        
+        runs = [
+            run for run in read_local_history(limit=20)
+            if str(run['started_at']) >= today_start.isoformat(sep=' ')
+        ]
     
-    # Look for today's successful runs
-    successful_runs = []
-    failed_runs = []
+    if not runs:
+        print("⚠️ No pipeline runs recorded today")
+        return False
     
-    for line in recent_lines:
-        if today_str in line:
-            if "Pipeline completed successfully!" in line:
-                successful_runs.append(line.strip())
-            elif "Pipeline error:" in line or "Failed" in line:
-                failed_runs.append(line.strip())
+    for run in runs[:3]:  # Show last 3 runs
+        icon = "✅" if run['status'] == 'succeeded' else "❌"
+        failed = f" at {run['failed_stage']}" if run.get('failed_stage') else ""
+        print(f"   {icon} {run['run_id']} {run['status']}{failed}: {run['duration_seconds']:.0f}s, "
+              f"{run['articles_stored']} stored, {run['error_count']} errors, peak RSS {run['peak_rss_mb']} MB")
     
+    successful_runs = [run for run in runs if run['status'] == 'succeeded']
     if successful_runs:
         print(f"✅ Found {len(successful_runs)} successful scraping run(s) today")
-        for run in successful_runs[-3:]:  # Show last 3 runs
-            print(f"   - {run}")
         return True
-    elif failed_runs:
-        print(f"❌ Found {len(failed_runs)} failed scraping run(s) today")
-        for run in failed_runs[-3:]:
-            print(f"   - {run}")
-        return False
-    else:
-        print("⚠️ No scraping activity found in today's logs")
-        return False
+    
+    print(f"❌ Found {len(runs)} failed scraping run(s) today")
+    return False
 
 def check_database():
     """Check database for today's data"""
     print("\n🗄️ Checking database for today's data...")
     
     try:
-        from src.database.snowflake_manager import SnowflakeManager
+        from src.database.storage_backend import get_storage_backend
         
-        with SnowflakeManager() as db_manager:
+        with get_storage_backend() as db_manager:
             if not db_manager.connection:
                 print("❌ No database connection available")
                 return False
-                
-            cursor = db_manager.connection.cursor()
-            
-            # Check for today's articles
-            today = date.today()
-            cursor.execute("""
-                SELECT COUNT(*) FROM NEWS_ARTICLES 
-                WHERE DATE(created_at) = %s
-            """, (today,))
-            result = cursor.fetchone()
-            today_articles = result[0] if result else 0
-            
-            # Check for today's sentiment analyses
-            cursor.execute("""
-                SELECT COUNT(*) FROM SENTIMENT_ANALYSIS 
-                WHERE DATE(created_at) = %s
-            """, (today,))
-            result = cursor.fetchone()
-            today_sentiments = result[0] if result else 0
-            
-            # Check for today's daily summaries
-            cursor.execute("""
-                SELECT COUNT(*) FROM DAILY_SENTIMENT_SUMMARY 
-                WHERE DATE(date) = %s
-            """, (today,))
-            result = cursor.fetchone()
-            today_summaries = result[0] if result else 0
             
-            cursor.close()
+            # Half-open created_at ranges keep partition pruning
+            counts = db_manager.get_daily_counts(date.today())
+            today_articles = counts['articles']
+            today_sentiments = counts['sentiments']
+            today_summaries = counts['summaries']
             
             print(f"   📰 Articles today: {today_articles}")
             print(f"   🧠 Sentiment analyses today: {today_sentiments}")
@@ -179,8 +158,8 @@ def main():
     print("🔍 Fortune 100 News Sentiment Scraping Status Check")
     print("=" * 50)
     
-    # Check logs
-    logs_ok = check_logs()
+    # Check run history
+    runs_ok = check_pipeline_runs()
     
     # Check database
     db_ok = check_database()
@@ -196,16 +175,16 @@ def main():
     print("📊 SUMMARY")
     print("=" * 50)
     
-    if logs_ok and db_ok:
+    if runs_ok and db_ok:
         print("✅ TODAY'S SCRAPING: SUCCESSFUL")
-        print("   - Logs show successful completion")
+        print("   - Run history shows successful completion")
         print("   - Database contains today's data")
-    elif logs_ok and not db_ok:
+    elif runs_ok and not db_ok:
         print("⚠️ TODAY'S SCRAPING: PARTIAL SUCCESS")
-        print("   - Logs show completion but database check failed")
-    elif not logs_ok and db_ok:
+        print("   - Run history shows completion but database check failed")
+    elif not runs_ok and db_ok:
         print("⚠️ TODAY'S SCRAPING: UNCLEAR")
-        print("   - Database has data but no recent logs")
+        print("   - Database has data but no successful run recorded")
     else:
         print("❌ TODAY'S SCRAPING: NOT RUN OR FAILED")
         print("   - No evidence of successful scraping today")
@@ -0,0 +1,40 @@
+"""
+Article Content Retention
+Moves article bodies older than the retention window to compressed Parquet archives
+"""
+
+import sys
+import os
+import argparse
+from dotenv import load_dotenv
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.storage_backend import get_storage_backend
+
+# Load environment variables
+load_dotenv()
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Archive old article content out of the hot table')
+    parser.add_argument('--days', type=int, default=int(os.getenv('CONTENT_RETENTION_DAYS', '90')),
+                        help='Archive content of articles scraped more than this many days ago')
+
+    args = parser.parse_args()
+
+    print(f"Archiving article content older than {args.days} days...")
+
+    with get_storage_backend() as db_manager:
+        if not db_manager.setup_database():
+            print("Database setup failed!")
+            return 1
+
+        archived = db_manager.archive_article_content(args.days)
+
+    print(f"Archived content of {archived} articles")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
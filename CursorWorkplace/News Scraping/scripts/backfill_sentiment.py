@@ -0,0 +1,89 @@
+"""
+Sentiment Backfill
+Re-scores historical articles (e.g. after adding or changing an engine) and rebuilds their daily summaries
+"""
+
+import sys
+import os
+import argparse
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.storage_backend import get_storage_backend
+from src.pipeline.backfill import SentimentBackfill, BackfillProgress
+from src.sentiment.sentiment_analyzer import get_configured_engines
+from src.models.news_article import SentimentEngine
+
+# Load environment variables
+load_dotenv()
+
+def parse_date(value: str):
+    """YYYY-MM-DD argument"""
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Re-score stored articles and merge the results into SENTIMENT_ANALYSIS')
+    parser.add_argument('--engines', type=str, default=None,
+                        help='Comma-separated engines to score with (default: SENTIMENT_ENGINES)')
+    parser.add_argument('--job', type=str, default='backfill',
+                        help='Job name; progress is kept per job so an interrupted run resumes where it stopped')
+    parser.add_argument('--restart', action='store_true', help='Discard saved progress and start from the first article')
+    parser.add_argument('--since', type=parse_date, default=None, help='Only articles scraped on or after this date')
+    parser.add_argument('--until', type=parse_date, default=None, help='Only articles scraped on or before this date')
+    parser.add_argument('--chunk-size', type=int, default=500, help='Articles per page and per scoring task')
+    parser.add_argument('--workers', type=int, default=None, help='Scoring processes (default: CPU count - 1)')
+    parser.add_argument('--limit', type=int, default=None, help='Stop after this many articles')
+    parser.add_argument('--target-company', action='store_true',
+                        help='Score only the sentences around company mentions')
+    parser.add_argument('--skip-summaries', action='store_true', help='Do not rebuild affected daily summaries')
+
+    args = parser.parse_args()
+
+    if args.engines:
+        try:
+            engines = [SentimentEngine(name.strip().lower()) for name in args.engines.split(',')]
+        except ValueError as e:
+            print(f"Unknown engine: {e}")
+            return 1
+    else:
+        engines = get_configured_engines()
+
+    progress = BackfillProgress(args.job)
+    if args.restart:
+        progress.reset()
+        progress = BackfillProgress(args.job)
+
+    print(f"Backfilling sentiment with {', '.join(engine.value for engine in engines)} "
+          f"(job '{args.job}', resuming after article {progress.last_article_id})...")
+
+    with get_storage_backend() as db_manager:
+        if not db_manager.setup_database():
+            print("Database setup failed!")
+            return 1
+
+        backfill = SentimentBackfill(db_manager, engines, chunk_size=args.chunk_size, workers=args.workers,
+                                     target_company_sentences=args.target_company)
+        try:
+            state = backfill.run(progress, since=args.since, until=args.until, max_articles=args.limit,
+                                 rebuild_summaries=not args.skip_summaries)
+        except Exception as e:
+            print(f"Backfill stopped after article {progress.last_article_id}: {e}")
+            print(f"Rerun with --job {args.job} to resume")
+            return 1
+
+    if state.get('engines') != [engine.value for engine in engines]:
+        print(f"Job '{args.job}' was started with engines {state.get('engines')}; use --restart or another --job")
+        return 1
+
+    print(f"Scored {state['articles_scored']} articles into {state['analyses_written']} analyses "
+          f"through article {state['last_article_id']}")
+    if state.get('completed'):
+        print(f"Rebuilt {state.get('summaries_refreshed', 0)} daily summaries")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
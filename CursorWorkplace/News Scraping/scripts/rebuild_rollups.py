@@ -0,0 +1,53 @@
+"""
+Sentiment Rollup Rebuild
+Populates SENTIMENT_ROLLUP from stored articles (after upgrading, or to repair a date range)
+"""
+
+import sys
+import os
+import argparse
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.storage_backend import get_storage_backend
+
+# Load environment variables
+load_dotenv()
+
+def parse_date(value: str):
+    """YYYY-MM-DD argument"""
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Rebuild the hour/day/week/month sentiment rollup cube')
+    parser.add_argument('--since', type=parse_date, default=None, help='Only company/days on or after this date')
+    parser.add_argument('--until', type=parse_date, default=None, help='Only company/days on or before this date')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Company/day keys rebuilt per refresh')
+
+    args = parser.parse_args()
+
+    with get_storage_backend() as db_manager:
+        if not db_manager.setup_database():
+            print("Database setup failed!")
+            return 1
+
+        keys = sorted(db_manager.get_rollup_keys(args.since, args.until), key=lambda key: (key[1], key[0]))
+        print(f"Rebuilding rollups for {len(keys)} company/days...")
+
+        written = 0
+        for offset in range(0, len(keys), args.batch_size):
+            cells = db_manager.refresh_rollups(keys[offset:offset + args.batch_size])
+            if not cells:
+                print(f"Rollup refresh failed at keys {offset}-{offset + args.batch_size}")
+                return 1
+            written += cells
+
+    print(f"Wrote {written} rollup cells")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
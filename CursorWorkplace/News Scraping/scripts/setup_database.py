@@ -10,7 +10,7 @@ from dotenv import load_dotenv
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.database.snowflake_manager import SnowflakeManager
+from src.database.storage_backend import get_storage_backend
 from config.companies import FORTUNE_100_COMPANIES
 
 # Load environment variables
@@ -22,7 +22,7 @@ def setup_database():
     
     try:
         # Initialize database manager
-        db_manager = SnowflakeManager()
+        db_manager = get_storage_backend()
         
         # Connect to Snowflake
         if not db_manager.connect():
@@ -38,8 +38,9 @@ def setup_database():
             
             # Populate companies table
             print("Populating companies table...")
+            company_ids = db_manager.insert_companies(FORTUNE_100_COMPANIES)
             for company in FORTUNE_100_COMPANIES:
-                company_id = db_manager.insert_company(company)
+                company_id = company_ids.get(company['ticker'].upper())
                 if company_id:
                     print(f"Added company: {company['name']} (ID: {company_id})")
                 else:
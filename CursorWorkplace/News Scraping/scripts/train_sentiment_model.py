@@ -0,0 +1,189 @@
+"""
+Linear Sentiment Model Training
+Trains the hashing-vectorizer linear engine on stored consensus labels
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+from typing import List, Dict, Any, Tuple
+from dotenv import load_dotenv
+
+# Add src to path for imports
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.storage_backend import StorageBackend, get_storage_backend
+from src.sentiment.sentiment_analyzer import SentimentAnalyzer, DEFAULT_ENGINES
+from src.sentiment.linear_model import LinearSentimentModel, DEFAULT_MODEL_DIR
+from src.models.news_article import SentimentAnalysis, SentimentEngine, SentimentLabel
+
+# Load environment variables
+load_dotenv()
+
+def load_training_data(db_manager: StorageBackend, analyzer: SentimentAnalyzer,
+                       limit: int = None) -> Tuple[List[str], List[str]]:
+    """Load article texts with their consensus label across the stored engines"""
+    engines = ", ".join(f"'{engine.value}'" for engine in DEFAULT_ENGINES)
+
+    # Limit articles, not engine rows: an article may have fewer (or repeated) engine results
+    articles_source = "NEWS_ARTICLES na"
+    if limit:
+        articles_source = f"""(
+        SELECT DISTINCT article_id
+        FROM SENTIMENT_ANALYSIS
+        WHERE engine IN ({engines})
+        ORDER BY article_id
+        LIMIT {int(limit)}
+    ) picked
+    JOIN NEWS_ARTICLES na ON na.article_id = picked.article_id"""
+
+    query = f"""
+    SELECT
+        na.article_id,
+        na.title,
+        na.content,
+        sa.engine,
+        sa.sentiment_score,
+        sa.sentiment_label
+    FROM {articles_source}
+    JOIN SENTIMENT_ANALYSIS sa ON sa.article_id = na.article_id
+    WHERE sa.engine IN ({engines})
+    ORDER BY na.article_id
+    """
+
+    cursor = db_manager.connection.cursor()
+    cursor.execute(query)
+    rows = cursor.fetchall()
+    cursor.close()
+
+    # Group engine rows per article
+    articles: Dict[int, Dict[str, Any]] = {}
+    for article_id, title, content, engine, score, label in rows:
+        entry = articles.setdefault(article_id, {'title': title, 'content': content, 'analyses': []})
+        entry['analyses'].append(SentimentAnalysis(
+            engine=SentimentEngine(engine),
+            sentiment_score=float(score),
+            sentiment_label=SentimentLabel(label)
+        ))
+
+    # Content past the retention window is read back from the archive
+    missing = [article_id for article_id, entry in articles.items() if entry['content'] is None]
+    if missing:
+        for article_id, content in db_manager.get_article_contents(missing).items():
+            articles[article_id]['content'] = content
+
+    texts, labels = [], []
+    for entry in articles.values():
+        consensus = analyzer.get_consensus_sentiment(entry['analyses'])
+        if not consensus:
+            continue
+
+        text = entry['title']
+        if entry['content']:
+            text += " " + entry['content']
+
+        texts.append(analyzer.clean_text(text))
+        labels.append(consensus['consensus_label'].value)
+
+    return texts, labels
+
+def split_data(texts: List[str], labels: List[str], test_size: float) -> Tuple[list, list, list, list]:
+    """Deterministic shuffled train/test split"""
+    indices = list(range(len(texts)))
+    random.Random(42).shuffle(indices)
+
+    cut = int(len(indices) * (1 - test_size))
+    train, test = indices[:cut], indices[cut:]
+
+    return ([texts[i] for i in train], [labels[i] for i in train],
+            [texts[i] for i in test], [labels[i] for i in test])
+
+def evaluate(model: LinearSentimentModel, texts: List[str], labels: List[str]) -> float:
+    """Accuracy against held-out consensus labels"""
+    if not texts:
+        return 0.0
+
+    probabilities = model.predict_proba(texts)
+    predicted = [model.classes[row.argmax()] for row in probabilities]
+    return sum(p == l for p, l in zip(predicted, labels)) / len(labels)
+
+def compare_throughput(analyzer: SentimentAnalyzer, texts: List[str]) -> Dict[str, float]:
+    """Texts per second for each engine; the linear engine scores the batch in one call"""
+    results = {}
+
+    per_text_engines = {
+        SentimentEngine.TEXTBLOB: analyzer.analyze_with_textblob,
+        SentimentEngine.VADER: analyzer.analyze_with_vader,
+        SentimentEngine.NLTK: analyzer.analyze_with_nltk
+    }
+
+    for engine, analyze in per_text_engines.items():
+        start = time.perf_counter()
+        for text in texts:
+            analyze(text)
+        elapsed = time.perf_counter() - start
+        results[engine.value] = len(texts) / elapsed if elapsed else float('inf')
+
+    if analyzer.linear_model:
+        start = time.perf_counter()
+        analyzer.analyze_batch_with_linear(texts)
+        elapsed = time.perf_counter() - start
+        results[SentimentEngine.LINEAR.value] = len(texts) / elapsed if elapsed else float('inf')
+
+    return results
+
+def main():
+    """Main training function"""
+    parser = argparse.ArgumentParser(description='Train the linear sentiment engine')
+    parser.add_argument('--limit', type=int, help='Maximum number of articles to load')
+    parser.add_argument('--output-dir', default=DEFAULT_MODEL_DIR, help='Directory for model artifacts')
+    parser.add_argument('--n-features', type=int, default=2 ** 18, help='Hashing vectorizer width')
+    parser.add_argument('--epochs', type=int, default=20, help='SGD training epochs')
+    parser.add_argument('--test-size', type=float, default=0.2, help='Held-out fraction for evaluation')
+    parser.add_argument('--benchmark', action='store_true', help='Compare throughput against existing engines')
+    parser.add_argument('--benchmark-size', type=int, default=500, help='Number of texts for the throughput comparison')
+
+    args = parser.parse_args()
+
+    print("=== Linear Sentiment Model Training ===")
+
+    analyzer = SentimentAnalyzer()
+
+    with get_storage_backend() as db_manager:
+        texts, labels = load_training_data(db_manager, analyzer, args.limit)
+
+    print(f"Loaded {len(texts)} labelled articles")
+    if len(texts) < 10:
+        print("❌ Not enough labelled articles to train on")
+        return 1
+
+    train_texts, train_labels, test_texts, test_labels = split_data(texts, labels, args.test_size)
+
+    model = LinearSentimentModel(n_features=args.n_features)
+    try:
+        model.fit(train_texts, train_labels, epochs=args.epochs)
+    except ValueError as e:
+        print(f"❌ Training failed: {e}")
+        return 1
+
+    accuracy = evaluate(model, test_texts, test_labels)
+    model.metadata['holdout_accuracy'] = accuracy
+    model.metadata['holdout_samples'] = len(test_texts)
+    print(f"Held-out consensus accuracy: {accuracy:.3f} on {len(test_texts)} articles")
+
+    path = model.save(args.output_dir)
+    print(f"✅ Saved model version {model.model_version} to {path}")
+
+    if args.benchmark:
+        analyzer.linear_model = model
+        sample = texts[:args.benchmark_size]
+        print(f"\nThroughput on {len(sample)} articles (texts/sec):")
+        for engine, rate in compare_throughput(analyzer, sample).items():
+            print(f"   - {engine}: {rate:,.1f}")
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
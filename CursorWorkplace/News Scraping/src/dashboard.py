@@ -14,7 +14,7 @@ import os
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.database.snowflake_manager import SnowflakeManager
+from src.database.storage_backend import get_storage_backend
 from config.companies import FORTUNE_100_COMPANIES
 
 # Page configuration
@@ -70,18 +70,14 @@ def main():
     
     # Load data
     try:
-        with SnowflakeManager() as db_manager:
-            # Get daily sentiment data
-            daily_data = db_manager.get_daily_sentiment_data(days_back)
+        with get_storage_backend() as db_manager:
+            # The four datasets are independent, so they run concurrently
+            data = db_manager.get_dashboard_data(days_back, 10)
             
-            # Get top companies
-            top_companies = db_manager.get_top_companies_by_sentiment(days_back, 10)
-            
-            # Get sector sentiment
-            sector_data = db_manager.get_sector_sentiment(days_back)
-            
-            # Get article count by source
-            source_data = db_manager.get_article_count_by_source(days_back)
+            daily_data = data['daily_data']
+            top_companies = data['top_companies']
+            sector_data = data['sector_data']
+            source_data = data['source_data']
             
     except Exception as e:
         st.error(f"❌ Database connection failed: {e}")
@@ -188,8 +184,8 @@ def main():
             source_data,
             x='source',
             y='article_count',
-            title="Articles by News Source",
-            labels={'article_count': 'Number of Articles', 'source': 'News Source'}
+            title="Company Articles by News Source (by publication date)",
+            labels={'article_count': 'Number of Company Articles', 'source': 'News Source'}
         )
         fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
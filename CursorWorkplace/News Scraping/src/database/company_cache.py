@@ -0,0 +1,76 @@
+"""
+Company Dimension Cache
+In-memory ticker -> company lookup loaded from COMPANIES with one query
+"""
+
+import os
+import time
+import threading
+from typing import Dict, Any, Optional, List
+from loguru import logger
+
+class CompanyCache:
+    """Process-wide cache of the COMPANIES dimension with TTL and explicit refresh"""
+
+    def __init__(self, ttl_seconds: float = 3600):
+        """Initialize an empty cache"""
+        self.ttl_seconds = ttl_seconds
+        self._by_ticker: Dict[str, Dict[str, Any]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the cache needs loading or has outlived its TTL"""
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    def refresh(self, connection) -> int:
+        """Reload every company in one query; returns the number cached"""
+        cursor = connection.cursor()
+        cursor.execute("SELECT company_id, ticker, name, sector FROM COMPANIES")
+        rows = cursor.fetchall()
+        cursor.close()
+
+        by_ticker = {
+            ticker.upper(): {'company_id': company_id, 'ticker': ticker.upper(), 'name': name, 'sector': sector}
+            for company_id, ticker, name, sector in rows if ticker
+        }
+
+        with self._lock:
+            self._by_ticker = by_ticker
+            self._loaded_at = time.monotonic()
+
+        logger.info(f"Loaded {len(by_ticker)} companies into cache")
+        return len(by_ticker)
+
+    def get(self, connection, ticker: str) -> Optional[Dict[str, Any]]:
+        """Company for a ticker, loading the cache first if it is stale"""
+        if not ticker:
+            return None
+
+        if self.is_stale:
+            self.refresh(connection)
+
+        return self._by_ticker.get(ticker.upper())
+
+    def all(self, connection) -> List[Dict[str, Any]]:
+        """Every cached company, loading the cache first if it is stale"""
+        if self.is_stale:
+            self.refresh(connection)
+
+        return list(self._by_ticker.values())
+
+    def add(self, company_id: int, ticker: str, name: str, sector: Optional[str]):
+        """Record a newly inserted company without a reload"""
+        with self._lock:
+            self._by_ticker[ticker.upper()] = {
+                'company_id': company_id, 'ticker': ticker.upper(), 'name': name, 'sector': sector
+            }
+
+    def invalidate(self):
+        """Force a reload on the next lookup"""
+        with self._lock:
+            self._loaded_at = None
+
+# Shared by every SnowflakeManager in the process
+company_cache = CompanyCache(ttl_seconds=float(os.getenv('COMPANY_CACHE_TTL_SECONDS', '3600')))
@@ -0,0 +1,203 @@
+"""
+Snowflake Connection Pool
+Process-wide pool of keep-alive Snowflake connections shared by every manager
+"""
+
+import os
+import time
+import threading
+from typing import Dict, Any, List, Optional, Callable
+from loguru import logger
+
+import snowflake.connector
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+
+class SnowflakeConnectionPool:
+    """Bounded pool of Snowflake connections with health checks and metrics
+
+    Logging in to Snowflake takes seconds, so connections are kept alive
+    (client_session_keep_alive) and handed back out instead of closed.
+    """
+
+    def __init__(self, connect_params: Callable[[], Dict[str, Any]], max_size: int = 4,
+                 acquire_timeout: float = 30.0, health_check_interval: float = 300.0):
+        """Initialize an empty pool"""
+        self._connect_params = connect_params
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+
+        self._idle: List[Dict[str, Any]] = []
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self._engine: Optional[Engine] = None
+
+        self._metrics = {
+            'connects': 0,
+            'reuses': 0,
+            'health_check_failures': 0,
+            'discards': 0,
+            'waits': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0
+        }
+
+    def _open(self):
+        """Open a new keep-alive connection"""
+        params = dict(self._connect_params())
+        params.setdefault('client_session_keep_alive', True)
+
+        start = time.perf_counter()
+        connection = snowflake.connector.connect(**params)
+        logger.info(f"Opened pooled Snowflake connection in {time.perf_counter() - start:.2f}s")
+        return connection
+
+    def _is_healthy(self, entry: Dict[str, Any]) -> bool:
+        """Cheap local check, plus a round trip if the connection sat idle for long"""
+        connection = entry['connection']
+        try:
+            if connection.is_closed():
+                return False
+
+            if time.monotonic() - entry['released_at'] > self.health_check_interval:
+                cursor = connection.cursor()
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+                cursor.close()
+
+            return True
+
+        except Exception as e:
+            logger.warning(f"Pooled connection failed health check: {e}")
+            return False
+
+    def acquire(self, timeout: Optional[float] = None):
+        """Check out a healthy connection, opening or waiting as needed
+
+        An idle connection is taken off the pool under the lock and health
+        checked after releasing it, so a SELECT 1 round trip never blocks
+        other threads acquiring or releasing connections.
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        wait_start = None
+
+        while True:
+            with self._condition:
+                while not self._idle and self._in_use >= self.max_size:
+                    if wait_start is None:
+                        wait_start = time.monotonic()
+                        self._metrics['waits'] += 1
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._record_wait(wait_start)
+                        raise TimeoutError(f"Timed out after {timeout}s waiting for a Snowflake connection")
+                    self._condition.wait(remaining)
+
+                entry = self._idle.pop() if self._idle else None
+                # Reserve the slot before releasing the lock to health check or connect
+                self._in_use += 1
+
+            if entry is None:
+                break
+
+            if self._is_healthy(entry):
+                with self._condition:
+                    self._metrics['reuses'] += 1
+                    self._record_wait(wait_start)
+                return entry['connection']
+
+            self._close_quietly(entry['connection'])
+            with self._condition:
+                self._metrics['health_check_failures'] += 1
+                # Hand the slot back and look again; another idle connection beats a new login
+                self._in_use -= 1
+                self._condition.notify()
+
+        with self._condition:
+            self._record_wait(wait_start)
+
+        try:
+            connection = self._open()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._metrics['connects'] += 1
+        return connection
+
+    def release(self, connection, discard: bool = False):
+        """Return a connection to the pool (or close it when discard is set)"""
+        with self._condition:
+            self._in_use = max(0, self._in_use - 1)
+
+            if discard or connection.is_closed():
+                self._metrics['discards'] += 1
+                self._close_quietly(connection)
+            else:
+                self._idle.append({'connection': connection, 'released_at': time.monotonic()})
+
+            self._condition.notify()
+
+    def get_engine(self, connection_string: str) -> Engine:
+        """Shared SQLAlchemy engine for pandas operations, created once per pool"""
+        with self._condition:
+            if self._engine is None:
+                self._engine = create_engine(connection_string, pool_size=self.max_size, pool_pre_ping=True)
+            return self._engine
+
+    def _record_wait(self, wait_start: Optional[float]):
+        """Accumulate time spent waiting for a free connection"""
+        if wait_start is None:
+            return
+        waited = time.monotonic() - wait_start
+        self._metrics['wait_seconds_total'] += waited
+        self._metrics['wait_seconds_max'] = max(self._metrics['wait_seconds_max'], waited)
+
+    @staticmethod
+    def _close_quietly(connection):
+        """Close a connection, ignoring errors"""
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool counters plus current sizes"""
+        with self._condition:
+            return {**self._metrics, 'idle': len(self._idle), 'in_use': self._in_use, 'max_size': self.max_size}
+
+    def close_all(self):
+        """Close idle connections and dispose of the shared engine"""
+        with self._condition:
+            for entry in self._idle:
+                self._close_quietly(entry['connection'])
+            self._idle.clear()
+
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
+
+        logger.info("Closed Snowflake connection pool")
+
+_pool: Optional[SnowflakeConnectionPool] = None
+_pool_lock = threading.Lock()
+
+def get_connection_pool(config) -> SnowflakeConnectionPool:
+    """Process-wide pool shared by pipeline stages, scheduler runs and the dashboard"""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = SnowflakeConnectionPool(
+                config.get_connection_params,
+                max_size=int(os.getenv('SNOWFLAKE_POOL_MAX_SIZE', '4')),
+                acquire_timeout=float(os.getenv('SNOWFLAKE_POOL_TIMEOUT', '30')),
+                health_check_interval=float(os.getenv('SNOWFLAKE_POOL_HEALTH_CHECK_SECONDS', '300'))
+            )
+        return _pool
@@ -0,0 +1,526 @@
+"""
+DuckDB Database Manager
+Embedded local storage backend with the same tables, view and methods as Snowflake
+"""
+
+import os
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, date, timedelta
+import pandas as pd
+from loguru import logger
+
+import duckdb
+
+from src.database.storage_backend import StorageBackend, content_hash
+from src.database.company_cache import company_cache
+from src.database.query_instrumentation import query_instrumentation, InstrumentedConnection
+from src.database.migrations import MigrationRunner, sql_steps, SCHEMA_VERSION_TABLE
+from src.database.rollup import ROLLUP_GRANULARITIES, touched_buckets, rollup_delete_query, rollup_insert_query
+from src.models.news_article import NewsArticle, SentimentAnalysis, DailySentimentSummary
+
+DEFAULT_DUCKDB_PATH = os.getenv('DUCKDB_PATH', 'data/news_sentiment.duckdb')
+DEFAULT_ARCHIVE_DIR = os.getenv('ARCHIVE_DIR', 'data/archive')
+
+# Local schema; mirrors the Snowflake tables column for column
+LOCAL_MIGRATIONS = [
+    (1, "Baseline tables and views", sql_steps(
+        "CREATE SEQUENCE IF NOT EXISTS COMPANIES_ID_SEQ START 1",
+        "CREATE SEQUENCE IF NOT EXISTS NEWS_ARTICLES_ID_SEQ START 1",
+        "CREATE SEQUENCE IF NOT EXISTS SENTIMENT_ANALYSIS_ID_SEQ START 1",
+        "CREATE SEQUENCE IF NOT EXISTS DAILY_SENTIMENT_SUMMARY_ID_SEQ START 1",
+        """
+        CREATE TABLE IF NOT EXISTS COMPANIES (
+            company_id INTEGER PRIMARY KEY DEFAULT nextval('COMPANIES_ID_SEQ'),
+            rank INTEGER,
+            name VARCHAR NOT NULL,
+            ticker VARCHAR NOT NULL UNIQUE,
+            sector VARCHAR,
+            created_at TIMESTAMP DEFAULT current_timestamp
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS NEWS_ARTICLES (
+            article_id INTEGER PRIMARY KEY DEFAULT nextval('NEWS_ARTICLES_ID_SEQ'),
+            company_id INTEGER,
+            title VARCHAR NOT NULL,
+            content VARCHAR,
+            url VARCHAR UNIQUE,
+            source VARCHAR,
+            published_date TIMESTAMP,
+            scraped_date TIMESTAMP,
+            created_at TIMESTAMP DEFAULT current_timestamp
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS SENTIMENT_ANALYSIS (
+            sentiment_id INTEGER PRIMARY KEY DEFAULT nextval('SENTIMENT_ANALYSIS_ID_SEQ'),
+            article_id INTEGER,
+            company_id INTEGER,
+            engine VARCHAR NOT NULL,
+            sentiment_score DOUBLE,
+            sentiment_label VARCHAR,
+            confidence_score DOUBLE,
+            keywords VARCHAR,
+            additional_data VARCHAR,
+            created_at TIMESTAMP DEFAULT current_timestamp,
+            UNIQUE (article_id, engine)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS DAILY_SENTIMENT_SUMMARY (
+            summary_id INTEGER PRIMARY KEY DEFAULT nextval('DAILY_SENTIMENT_SUMMARY_ID_SEQ'),
+            company_id INTEGER,
+            date DATE NOT NULL,
+            avg_sentiment_score DOUBLE,
+            sentiment_label VARCHAR,
+            article_count INTEGER,
+            positive_count INTEGER,
+            negative_count INTEGER,
+            neutral_count INTEGER,
+            created_at TIMESTAMP DEFAULT current_timestamp,
+            UNIQUE (company_id, date)
+        )
+        """,
+        """
+        CREATE OR REPLACE VIEW DAILY_SUMMARY_VIEW AS
+        SELECT
+            ds.company_id,
+            c.name AS company_name,
+            c.ticker,
+            c.sector,
+            ds.date,
+            ds.avg_sentiment_score,
+            ds.sentiment_label,
+            ds.article_count,
+            ds.positive_count,
+            ds.negative_count,
+            ds.neutral_count
+        FROM DAILY_SENTIMENT_SUMMARY ds
+        JOIN COMPANIES c ON ds.company_id = c.company_id
+        """
+    )),
+    (2, "Article content archive", sql_steps(
+        "ALTER TABLE NEWS_ARTICLES ADD COLUMN IF NOT EXISTS content_hash VARCHAR",
+        "ALTER TABLE NEWS_ARTICLES ADD COLUMN IF NOT EXISTS content_archive_path VARCHAR"
+    )),
+    (3, "Pipeline run history", sql_steps(
+        """
+        CREATE TABLE IF NOT EXISTS PIPELINE_RUNS (
+            run_id VARCHAR NOT NULL,
+            started_at TIMESTAMP NOT NULL,
+            finished_at TIMESTAMP,
+            status VARCHAR NOT NULL,
+            mode VARCHAR,
+            resumed BOOLEAN,
+            failed_stage VARCHAR,
+            duration_seconds DOUBLE,
+            articles_scraped INTEGER,
+            articles_scored INTEGER,
+            articles_stored INTEGER,
+            summaries_refreshed INTEGER,
+            error_count INTEGER,
+            articles_per_second DOUBLE,
+            peak_rss_mb DOUBLE,
+            peak_worker_rss_mb DOUBLE,
+            stages VARCHAR,
+            error_message VARCHAR,
+            PRIMARY KEY (run_id, started_at)
+        )
+        """
+    )),
+    (4, "Sentiment rollup cube", sql_steps(
+        """
+        CREATE TABLE IF NOT EXISTS SENTIMENT_ROLLUP (
+            granularity VARCHAR NOT NULL,
+            bucket_start TIMESTAMP NOT NULL,
+            company_id INTEGER NOT NULL,
+            source VARCHAR NOT NULL,
+            article_count INTEGER,
+            scored_article_count INTEGER,
+            sentiment_sum DOUBLE,
+            sentiment_count INTEGER,
+            positive_count INTEGER,
+            negative_count INTEGER,
+            neutral_count INTEGER,
+            scored_days INTEGER,
+            daily_avg_sum DOUBLE,
+            updated_at TIMESTAMP DEFAULT current_timestamp,
+            PRIMARY KEY (granularity, company_id, source, bucket_start)
+        )
+        """
+    )),
+    (5, "Feed partition leases", sql_steps(
+        """
+        CREATE TABLE IF NOT EXISTS FEED_LEASES (
+            partition_key VARCHAR NOT NULL PRIMARY KEY,
+            worker_id VARCHAR,
+            previous_worker_id VARCHAR,
+            claim_id VARCHAR,
+            claimed_at TIMESTAMP,
+            renewed_at TIMESTAMP,
+            lease_expires_at TIMESTAMP,
+            claim_count INTEGER DEFAULT 0,
+            last_completed_at TIMESTAMP,
+            last_completed_by VARCHAR
+        )
+        """
+    )),
+]
+
+LOCAL_SCHEMA_VERSION_DDL = f"""
+CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+    version INTEGER PRIMARY KEY,
+    description VARCHAR,
+    applied_at TIMESTAMP DEFAULT current_timestamp,
+    duration_seconds DOUBLE
+)
+"""
+
+# Local schema, shared by every DuckDBManager in the process
+local_migration_runner = MigrationRunner(LOCAL_MIGRATIONS, placeholder='?', version_table_ddl=LOCAL_SCHEMA_VERSION_DDL)
+
+class DuckDBManager(StorageBackend):
+    """Manages an embedded DuckDB database file (STORAGE_BACKEND=duckdb)"""
+
+    placeholder = '?'
+    json_placeholder = '?'
+
+    def __init__(self, database_path: str = DEFAULT_DUCKDB_PATH, archive_dir: str = DEFAULT_ARCHIVE_DIR):
+        """Initialize DuckDB manager"""
+        super().__init__()
+        self.database_path = database_path
+        self.archive_dir = archive_dir
+        self.database_key: Optional[str] = None
+
+    def connect(self) -> bool:
+        """Open the database file (no-op if already open)"""
+        if self.connection:
+            return True
+
+        try:
+            if self.database_path != ':memory:':
+                os.makedirs(os.path.dirname(self.database_path) or '.', exist_ok=True)
+
+            self.connection = InstrumentedConnection(duckdb.connect(self.database_path), query_instrumentation)
+            # Identifies the database to the migration runner; every in-memory connection is a new database
+            self.database_key = (uuid.uuid4().hex if self.database_path == ':memory:'
+                                 else os.path.abspath(self.database_path))
+            logger.debug(f"Opened DuckDB database {self.database_path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to open DuckDB database {self.database_path}: {e}")
+            return False
+
+    def disconnect(self):
+        """Close the database file"""
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+            logger.debug("Closed DuckDB database")
+
+    def setup_database(self) -> bool:
+        """Setup database tables and views"""
+        try:
+            if not self.connection:
+                if not self.connect():
+                    return False
+
+            applied = local_migration_runner.migrate(self.connection, self.database_key)
+            logger.info(f"Database setup completed successfully ({applied} migrations applied)")
+            return True
+
+        except Exception as e:
+            logger.error(f"Database setup failed: {e}")
+            return False
+
+    def insert_companies(self, companies: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert missing companies in one statement; returns ticker -> company_id"""
+        try:
+            df = pd.DataFrame([{
+                'rank': company['rank'],
+                'name': company['name'],
+                'ticker': company['ticker'].upper(),
+                'sector': company['sector']
+            } for company in companies]).drop_duplicates(subset=['ticker'])
+
+            cursor = self.connection.cursor()
+            cursor.register('company_batch', df)
+            cursor.execute("""
+            INSERT INTO COMPANIES (rank, name, ticker, sector)
+            SELECT rank, name, ticker, sector FROM company_batch
+            ON CONFLICT (ticker) DO NOTHING
+            """)
+            inserted = cursor.fetchone()[0]
+            cursor.close()
+
+            if inserted:
+                logger.info(f"Inserted {inserted} companies")
+
+            company_cache.refresh(self.connection)
+            return {
+                company['ticker'].upper(): company_cache.get(self.connection, company['ticker'])['company_id']
+                for company in companies
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to insert companies: {e}")
+            return {}
+
+    def get_company(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Get company id, name and sector by ticker from the company cache"""
+        try:
+            return company_cache.get(self.connection, ticker)
+
+        except Exception as e:
+            logger.error(f"Failed to get company for {ticker}: {e}")
+            return None
+
+    def _upsert(self, table: str, id_column: str, key_columns: List[str],
+                rows: List[Optional[Dict[str, Any]]]) -> List[Optional[int]]:
+        """INSERT ... ON CONFLICT DO UPDATE a batch on its natural key; returns ids aligned with rows"""
+        df = pd.DataFrame([row for row in rows if row])
+        if df.empty:
+            return [None] * len(rows)
+
+        # A single statement may not update the same row twice; the last row per key wins
+        df = df.drop_duplicates(subset=key_columns, keep='last')
+        columns = list(df.columns)
+        update_columns = [column for column in columns if column not in key_columns]
+
+        cursor = self.connection.cursor()
+        cursor.register('batch_rows', df)
+        cursor.execute(f"""
+        INSERT INTO {table} ({", ".join(columns)})
+        SELECT {", ".join(columns)} FROM batch_rows
+        ON CONFLICT ({", ".join(key_columns)}) DO UPDATE SET
+            {", ".join(f"{column} = excluded.{column}" for column in update_columns)}
+        RETURNING {id_column}, {", ".join(key_columns)}
+        """)
+        key_ids = {tuple(row[1:]): row[0] for row in cursor.fetchall()}
+        cursor.close()
+
+        logger.info(f"Upserted {len(df)} rows into {table}")
+        return [key_ids.get(tuple(row[column] for column in key_columns)) if row else None for row in rows]
+
+    def upsert_news_articles(self, articles: List[NewsArticle]) -> List[Optional[int]]:
+        """Idempotently upsert articles on url"""
+        if not articles:
+            return []
+
+        try:
+            return self._upsert('NEWS_ARTICLES', 'article_id', ['url'],
+                                [self._article_row(article) for article in articles])
+        except Exception as e:
+            logger.error(f"Failed to upsert articles: {e}")
+            return [None] * len(articles)
+
+    def upsert_sentiment_analyses(self, sentiments: List[SentimentAnalysis]) -> List[Optional[int]]:
+        """Idempotently upsert sentiment results on (article_id, engine)"""
+        if not sentiments:
+            return []
+
+        try:
+            return self._upsert('SENTIMENT_ANALYSIS', 'sentiment_id', ['article_id', 'engine'],
+                                [self._sentiment_row(sentiment) for sentiment in sentiments])
+        except Exception as e:
+            logger.error(f"Failed to upsert sentiment analyses: {e}")
+            return [None] * len(sentiments)
+
+    def upsert_daily_summaries(self, summaries: List[DailySentimentSummary]) -> List[Optional[int]]:
+        """Idempotently upsert daily summaries on (company_id, date)"""
+        if not summaries:
+            return []
+
+        try:
+            return self._upsert('DAILY_SENTIMENT_SUMMARY', 'summary_id', ['company_id', 'date'],
+                                [self._summary_row(summary) for summary in summaries])
+        except Exception as e:
+            logger.error(f"Failed to upsert daily summaries: {e}")
+            return [None] * len(summaries)
+
+    def refresh_daily_summaries(self, keys: List[Tuple[int, date]]) -> int:
+        """Recompute DAILY_SENTIMENT_SUMMARY for the given (company_id, date) keys only"""
+        keys = sorted(set(keys))
+        if not keys:
+            return 0
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.register('touched', pd.DataFrame(keys, columns=['company_id', 'date']))
+            cursor.execute("""
+            INSERT INTO DAILY_SENTIMENT_SUMMARY
+                (company_id, date, avg_sentiment_score, sentiment_label,
+                 article_count, positive_count, negative_count, neutral_count)
+            SELECT
+                d.company_id,
+                d.date,
+                AVG(sa.sentiment_score),
+                CASE
+                    WHEN AVG(sa.sentiment_score) > 0.1 THEN 'positive'
+                    WHEN AVG(sa.sentiment_score) < -0.1 THEN 'negative'
+                    ELSE 'neutral'
+                END,
+                COUNT(DISTINCT sa.article_id),
+                SUM(CASE WHEN sa.sentiment_label = 'positive' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN sa.sentiment_label = 'negative' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN sa.sentiment_label = 'neutral' THEN 1 ELSE 0 END)
+            FROM touched d
+            JOIN NEWS_ARTICLES na
+                ON na.company_id = d.company_id
+                AND COALESCE(na.published_date, na.scraped_date) >= d.date
+                AND COALESCE(na.published_date, na.scraped_date) < d.date + INTERVAL 1 DAY
+            JOIN SENTIMENT_ANALYSIS sa ON sa.article_id = na.article_id
+            GROUP BY d.company_id, d.date
+            ON CONFLICT (company_id, date) DO UPDATE SET
+                avg_sentiment_score = excluded.avg_sentiment_score,
+                sentiment_label = excluded.sentiment_label,
+                article_count = excluded.article_count,
+                positive_count = excluded.positive_count,
+                negative_count = excluded.negative_count,
+                neutral_count = excluded.neutral_count
+            """)
+            affected = cursor.fetchone()[0]
+            cursor.close()
+
+            logger.info(f"Refreshed daily summaries for {len(keys)} touched keys ({affected} rows merged)")
+            return affected
+
+        except Exception as e:
+            logger.error(f"Failed to refresh daily summaries: {e}")
+            return 0
+
+    def refresh_rollups(self, keys: List[Tuple[int, date]]) -> int:
+        """Rebuild SENTIMENT_ROLLUP cells holding the given (company_id, date) keys, finest level first"""
+        keys = sorted(set(keys))
+        if not keys:
+            return 0
+
+        try:
+            cursor = self.connection.cursor()
+            written = 0
+
+            for granularity in ROLLUP_GRANULARITIES:
+                cells = touched_buckets(keys, granularity)
+                touched = f"touched_{granularity}"
+                cursor.register(touched, pd.DataFrame(cells, columns=['company_id', 'bucket_start', 'bucket_end']))
+
+                cursor.execute(rollup_delete_query(granularity, touched))
+                cursor.execute(rollup_insert_query(granularity, touched, min(cell[1] for cell in cells),
+                                                   max(cell[2] for cell in cells)))
+                written += cursor.fetchone()[0]
+                cursor.unregister(touched)
+
+            cursor.close()
+
+            logger.info(f"Refreshed sentiment rollups for {len(keys)} touched keys ({written} cells written)")
+            return written
+
+        except Exception as e:
+            logger.error(f"Failed to refresh sentiment rollups: {e}")
+            return 0
+
+    def ensure_feed_partitions(self, partition_keys: List[str]) -> bool:
+        """Add FEED_LEASES rows for partitions that have none"""
+        if not partition_keys:
+            return True
+
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"INSERT INTO FEED_LEASES (partition_key, claim_count) "
+                f"VALUES {', '.join(['(?, 0)'] * len(partition_keys))} ON CONFLICT DO NOTHING",
+                list(partition_keys)
+            )
+            cursor.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to add feed partitions: {e}")
+            return False
+
+    def archive_article_content(self, older_than_days: int) -> int:
+        """Write old article content to a zstd Parquet file under archive_dir and clear it in place"""
+        cutoff = datetime.combine(date.today() - timedelta(days=older_than_days), datetime.min.time())
+
+        try:
+            df = self._fetch_dataframe(
+                "SELECT article_id, url, content FROM NEWS_ARTICLES WHERE scraped_date < ? AND content IS NOT NULL",
+                (cutoff,)
+            )
+            if df.empty:
+                logger.info(f"No article content older than {older_than_days} days to archive")
+                return 0
+
+            df['content_hash'] = df['content'].map(content_hash)
+
+            os.makedirs(self.archive_dir, exist_ok=True)
+            archive_path = os.path.join(self.archive_dir, f"content_{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.parquet")
+            df.to_parquet(archive_path, compression='zstd', index=False)
+
+            # Only clear rows whose content is still what was written to the archive
+            cursor = self.connection.cursor()
+            cursor.register('archived', df[['article_id', 'content', 'content_hash']])
+            cursor.execute("""
+            UPDATE NEWS_ARTICLES
+            SET content = NULL, content_hash = a.content_hash, content_archive_path = ?
+            FROM archived a
+            WHERE NEWS_ARTICLES.article_id = a.article_id AND NEWS_ARTICLES.content = a.content
+            """, (archive_path,))
+            archived = cursor.fetchone()[0]
+            cursor.close()
+
+            logger.info(f"Archived content of {archived} articles older than {older_than_days} days to {archive_path}")
+            return archived
+
+        except Exception as e:
+            logger.error(f"Failed to archive article content: {e}")
+            return 0
+
+    def get_article_contents(self, article_ids: List[int]) -> Dict[int, str]:
+        """Article content by id; archived content is read back from its Parquet file"""
+        if not article_ids:
+            return {}
+
+        try:
+            placeholders = ", ".join(["?"] * len(article_ids))
+            df = self._fetch_dataframe(f"""
+                SELECT article_id, content, content_hash, content_archive_path
+                FROM NEWS_ARTICLES
+                WHERE article_id IN ({placeholders})
+                """, tuple(article_ids))
+
+            contents: Dict[int, str] = {}
+            archived: Dict[str, Dict[int, str]] = {}
+            # NULLs come back as NaN, which is truthy; only strings are content or archive paths
+            for row in df.itertuples(index=False):
+                if isinstance(row.content, str):
+                    contents[int(row.article_id)] = row.content
+                elif isinstance(row.content_archive_path, str) and row.content_archive_path:
+                    archived.setdefault(row.content_archive_path, {})[int(row.article_id)] = row.content_hash
+
+            for archive_path, hashes in archived.items():
+                archived_df = pd.read_parquet(archive_path, columns=['article_id', 'content'],
+                                              filters=[('article_id', 'in', list(hashes))])
+                for article_id, content in zip(archived_df['article_id'], archived_df['content']):
+                    content = self._verified_content(int(article_id), content, hashes[int(article_id)])
+                    if content is not None:
+                        contents[int(article_id)] = content
+
+            return contents
+
+        except Exception as e:
+            logger.error(f"Failed to get article contents: {e}")
+            return {}
+
+    def _fetch_dataframe(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """Run a query and return a DataFrame with lower-case column names"""
+        cursor = self.connection.cursor()
+        try:
+            df = cursor.execute(query, params).df() if params else cursor.execute(query).df()
+        finally:
+            cursor.close()
+
+        df.columns = [column.lower() for column in df.columns]
+        return df
@@ -0,0 +1,81 @@
+"""
+Client-Side ID Allocation
+Reserves blocks of ids from Snowflake sequences so inserts carry explicit ids
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, Deque
+from loguru import logger
+
+# table -> (sequence, id column)
+ID_SEQUENCES = {
+    'COMPANIES': ('COMPANIES_ID_SEQ', 'company_id'),
+    'NEWS_ARTICLES': ('NEWS_ARTICLES_ID_SEQ', 'article_id'),
+    'SENTIMENT_ANALYSIS': ('SENTIMENT_ANALYSIS_ID_SEQ', 'sentiment_id'),
+    'DAILY_SENTIMENT_SUMMARY': ('DAILY_SENTIMENT_SUMMARY_ID_SEQ', 'summary_id')
+}
+
+class IdAllocator:
+    """Hands out ids from blocks reserved with a single sequence query
+
+    Reserved ids are globally unique even if unused, so blocks survive
+    reconnects and are shared by every manager in the process. All writers
+    must insert explicit ids from these sequences rather than relying on
+    the tables' identity defaults.
+    """
+
+    def __init__(self, block_size: int = 1000):
+        """Initialize with empty id pools"""
+        self.block_size = block_size
+        self._pools: Dict[str, Deque[int]] = {table: deque() for table in ID_SEQUENCES}
+        self._lock = threading.Lock()
+
+    def allocate(self, connection, table: str, count: int) -> List[int]:
+        """Return `count` fresh ids for a table, reserving a new block if needed"""
+        if count <= 0:
+            return []
+
+        with self._lock:
+            pool = self._pools[table]
+            if len(pool) < count:
+                pool.extend(self._reserve(connection, table, max(self.block_size, count - len(pool))))
+            return [pool.popleft() for _ in range(count)]
+
+    def next_id(self, connection, table: str) -> int:
+        """Return a single fresh id for a table"""
+        return self.allocate(connection, table, 1)[0]
+
+    def _reserve(self, connection, table: str, count: int) -> List[int]:
+        """Pull `count` values from the table's sequence in one round trip"""
+        sequence, _ = ID_SEQUENCES[table]
+
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT {sequence}.NEXTVAL FROM TABLE(GENERATOR(ROWCOUNT => {int(count)}))")
+        ids = sorted(row[0] for row in cursor.fetchall())
+        cursor.close()
+
+        logger.debug(f"Reserved {len(ids)} ids from {sequence}")
+        return ids
+
+    def ensure_sequences(self, connection):
+        """Create any missing sequences, starting above the current max id"""
+        cursor = connection.cursor()
+
+        cursor.execute("SHOW SEQUENCES")
+        name_index = [column[0].lower() for column in cursor.description].index('name')
+        existing = {row[name_index].upper() for row in cursor.fetchall()}
+
+        for table, (sequence, id_column) in ID_SEQUENCES.items():
+            if sequence in existing:
+                continue
+
+            cursor.execute(f"SELECT COALESCE(MAX({id_column}), 0) + 1 FROM {table}")
+            start = cursor.fetchone()[0]
+            cursor.execute(f"CREATE SEQUENCE IF NOT EXISTS {sequence} START = {int(start)} INCREMENT = 1")
+            logger.info(f"Created sequence {sequence} starting at {start}")
+
+        cursor.close()
+
+# Shared by every SnowflakeManager in the process
+id_allocator = IdAllocator()
@@ -0,0 +1,201 @@
+"""
+Schema Migrations
+Versioned DDL applied once and recorded in SCHEMA_VERSION
+"""
+
+import time
+import threading
+from typing import List, Tuple, Callable, Set, Hashable
+from loguru import logger
+
+SCHEMA_VERSION_TABLE = "SCHEMA_VERSION"
+
+# Version table DDL in Snowflake's dialect; other backends pass their own to MigrationRunner
+SCHEMA_VERSION_DDL = f"""
+CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+    version INTEGER PRIMARY KEY,
+    description VARCHAR(500),
+    applied_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+    duration_seconds FLOAT
+)
+"""
+
+def _baseline_schema(cursor):
+    """Tables and views from the original setup script (all idempotent)"""
+    from config.snowflake_config import get_all_setup_queries
+
+    for query in get_all_setup_queries():
+        cursor.execute(query)
+        logger.debug(f"Executed query: {query[:100]}...")
+
+def _id_sequences(cursor):
+    """Sequences backing client-side id allocation"""
+    from src.database.id_allocator import id_allocator
+
+    id_allocator.ensure_sequences(cursor.connection)
+
+def sql_steps(*queries: str) -> Callable:
+    """Migration step that runs plain DDL statements in order"""
+    def apply(cursor):
+        for query in queries:
+            cursor.execute(query)
+            logger.debug(f"Executed query: {query[:100]}...")
+    return apply
+
+# (version, description, apply(cursor)); append new migrations, never edit applied ones
+MIGRATIONS: List[Tuple[int, str, Callable]] = [
+    (1, "Baseline tables and views", _baseline_schema),
+    (2, "Id sequences", _id_sequences),
+    # Load order already clusters scraped_date/created_at; published_date
+    # drifts for late feeds, so keep it clustered for summary refreshes
+    (3, "Date clustering keys", sql_steps(
+        "ALTER TABLE NEWS_ARTICLES CLUSTER BY (TO_DATE(published_date))",
+        "ALTER TABLE SENTIMENT_ANALYSIS CLUSTER BY (TO_DATE(created_at))",
+        "ALTER TABLE DAILY_SENTIMENT_SUMMARY CLUSTER BY (date)"
+    )),
+    (4, "Spool load stage", sql_steps(
+        "CREATE STAGE IF NOT EXISTS NEWS_SPOOL_STAGE FILE_FORMAT = (TYPE = PARQUET)"
+    )),
+    (5, "Article content archive", sql_steps(
+        "ALTER TABLE NEWS_ARTICLES ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64)",
+        "ALTER TABLE NEWS_ARTICLES ADD COLUMN IF NOT EXISTS content_archive_path VARCHAR(500)",
+        "CREATE FILE FORMAT IF NOT EXISTS NEWS_PARQUET_FORMAT TYPE = PARQUET",
+        "CREATE STAGE IF NOT EXISTS NEWS_ARCHIVE_STAGE FILE_FORMAT = NEWS_PARQUET_FORMAT"
+    )),
+    (6, "Pipeline run history", sql_steps(
+        """
+        CREATE TABLE IF NOT EXISTS PIPELINE_RUNS (
+            run_id VARCHAR(50) NOT NULL,
+            started_at TIMESTAMP_NTZ NOT NULL,
+            finished_at TIMESTAMP_NTZ,
+            status VARCHAR(20) NOT NULL,
+            mode VARCHAR(20),
+            resumed BOOLEAN,
+            failed_stage VARCHAR(20),
+            duration_seconds FLOAT,
+            articles_scraped INTEGER,
+            articles_scored INTEGER,
+            articles_stored INTEGER,
+            summaries_refreshed INTEGER,
+            error_count INTEGER,
+            articles_per_second FLOAT,
+            peak_rss_mb FLOAT,
+            peak_worker_rss_mb FLOAT,
+            stages VARIANT,
+            error_message VARCHAR(1000),
+            PRIMARY KEY (run_id, started_at)
+        )
+        """
+    )),
+    # Populate an existing database with scripts/rebuild_rollups.py
+    (7, "Sentiment rollup cube", sql_steps(
+        """
+        CREATE TABLE IF NOT EXISTS SENTIMENT_ROLLUP (
+            granularity VARCHAR(10) NOT NULL,
+            bucket_start TIMESTAMP_NTZ NOT NULL,
+            company_id INTEGER NOT NULL,
+            source VARCHAR(100) NOT NULL,
+            article_count INTEGER,
+            scored_article_count INTEGER,
+            sentiment_sum FLOAT,
+            sentiment_count INTEGER,
+            positive_count INTEGER,
+            negative_count INTEGER,
+            neutral_count INTEGER,
+            scored_days INTEGER,
+            daily_avg_sum FLOAT,
+            updated_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+            PRIMARY KEY (granularity, company_id, source, bucket_start)
+        )
+        """,
+        "ALTER TABLE SENTIMENT_ROLLUP CLUSTER BY (granularity, TO_DATE(bucket_start))"
+    )),
+    (8, "Feed partition leases", sql_steps(
+        """
+        CREATE TABLE IF NOT EXISTS FEED_LEASES (
+            partition_key VARCHAR(200) NOT NULL PRIMARY KEY,
+            worker_id VARCHAR(200),
+            previous_worker_id VARCHAR(200),
+            claim_id VARCHAR(50),
+            claimed_at TIMESTAMP_NTZ,
+            renewed_at TIMESTAMP_NTZ,
+            lease_expires_at TIMESTAMP_NTZ,
+            claim_count INTEGER DEFAULT 0,
+            last_completed_at TIMESTAMP_NTZ,
+            last_completed_by VARCHAR(200)
+        )
+        """
+    )),
+]
+
+class MigrationRunner:
+    """Applies pending migrations; a current schema costs one version query"""
+
+    def __init__(self, migrations: List[Tuple[int, str, Callable]], placeholder: str = '%s',
+                 version_table_ddl: str = SCHEMA_VERSION_DDL):
+        """Initialize with migrations ordered by version, the driver's bind placeholder and version-table DDL"""
+        self.placeholder = placeholder
+        self.version_table_ddl = version_table_ddl
+        self.migrations = sorted(migrations, key=lambda migration: migration[0])
+        self.latest_version = self.migrations[-1][0] if self.migrations else 0
+        # Databases already checked in this process (one per Snowflake account, one per DuckDB file)
+        self._verified: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def current_version(self, connection) -> int:
+        """Highest applied version, creating the version table on first use"""
+        cursor = connection.cursor()
+        try:
+            # Checked explicitly so a failing query is never mistaken for an unversioned database
+            cursor.execute(f"""
+            SELECT COUNT(*) FROM information_schema.tables
+            WHERE UPPER(table_name) = '{SCHEMA_VERSION_TABLE}'
+                AND UPPER(table_schema) = UPPER(CURRENT_SCHEMA())
+            """)
+            if not cursor.fetchone()[0]:
+                # An unversioned (or empty) database
+                cursor.execute(self.version_table_ddl)
+                return 0
+
+            cursor.execute(f"SELECT COALESCE(MAX(version), 0) FROM {SCHEMA_VERSION_TABLE}")
+            return int(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+
+    def migrate(self, connection, database: Hashable = None) -> int:
+        """Apply every pending migration to a database in order; returns how many ran"""
+        with self._lock:
+            if database in self._verified:
+                return 0
+
+            current = self.current_version(connection)
+            pending = [migration for migration in self.migrations if migration[0] > current]
+
+            if not pending:
+                logger.info(f"Schema is current at version {current}")
+                self._verified.add(database)
+                return 0
+
+            logger.info(f"Schema at version {current}; applying {len(pending)} migration(s)")
+
+            cursor = connection.cursor()
+            try:
+                for version, description, apply in pending:
+                    start = time.perf_counter()
+                    apply(cursor)
+                    duration = time.perf_counter() - start
+
+                    cursor.execute(
+                        f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, description, duration_seconds) "
+                        f"VALUES ({self.placeholder}, {self.placeholder}, {self.placeholder})",
+                        (version, description, duration)
+                    )
+                    logger.info(f"Applied migration {version} ({description}) in {duration:.2f}s")
+            finally:
+                cursor.close()
+
+            self._verified.add(database)
+            return len(pending)
+
+# Snowflake schema, shared by every SnowflakeManager in the process
+migration_runner = MigrationRunner(MIGRATIONS)
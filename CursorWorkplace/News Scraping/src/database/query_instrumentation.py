@@ -0,0 +1,222 @@
+"""
+Query Instrumentation
+Times every cursor execution and reports the slowest statements per run
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import heapq
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional
+from loguru import logger
+
+from src.utils.metrics import MetricsSink, get_metrics_sink
+
+_COMMENTS = re.compile(r'--[^\n]*|/\*.*?\*/', re.S)
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_LISTS = re.compile(r'\(\s*(?:(?:%s|\?)\s*,\s*)+(?:%s|\?)\s*\)')
+_VALUE_LISTS = re.compile(r'(\(\?\+\))(?:\s*,\s*\(\?\+\))+')
+_WHITESPACE = re.compile(r'\s+')
+
+def normalize_statement(statement: str) -> str:
+    """Statement text with literals, bind lists and whitespace collapsed"""
+    text = _COMMENTS.sub(' ', statement)
+    text = _STRINGS.sub('?', text)
+    text = _NUMBERS.sub('?', text)
+    text = _PLACEHOLDER_LISTS.sub('(?+)', text)
+    text = _VALUE_LISTS.sub(r'\1, ...', text)
+    return _WHITESPACE.sub(' ', text).strip()
+
+def fingerprint(statement: str) -> str:
+    """Short stable id shared by every execution of the same statement shape"""
+    return hashlib.sha1(normalize_statement(statement).encode('utf-8')).hexdigest()[:12]
+
+class QueryInstrumentation:
+    """Per-statement timings, rows, query ids and callers for every database cursor
+
+    Each execution costs two perf_counter() calls, a regex fingerprint and a
+    dict update. Aggregates cover the current run until reset().
+    """
+
+    def __init__(self, sink: Optional[MetricsSink] = None, keep_slowest: int = 50):
+        """Initialize with a metrics sink"""
+        self._sink = sink
+        self.keep_slowest = keep_slowest
+        self.run_id = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def sink(self) -> MetricsSink:
+        """Metrics sink, resolved from METRICS_SINK on first use"""
+        if self._sink is None:
+            self._sink = get_metrics_sink()
+        return self._sink
+
+    def reset(self):
+        """Start a new reporting window"""
+        with self._lock:
+            self._statements: Dict[str, Dict[str, Any]] = {}
+            self._slowest: List[tuple] = []
+            self._sequence = 0
+
+    def set_run_id(self, run_id: str):
+        """Label subsequent statements (and QUERY_TAGs) with a pipeline run id"""
+        self.run_id = run_id
+
+    def query_tag(self) -> str:
+        """Session QUERY_TAG value that lets QUERY_HISTORY rows be joined back to a run"""
+        return json.dumps({'app': 'news_sentiment', 'run_id': self.run_id, 'pid': os.getpid()})
+
+    @staticmethod
+    def caller() -> str:
+        """Module, function and line of the nearest frame outside this module"""
+        frame = sys._getframe(1)
+        while frame and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+        if not frame:
+            return 'unknown'
+        module = frame.f_globals.get('__name__', '?')
+        return f"{module}.{frame.f_code.co_name}:{frame.f_lineno}"
+
+    def record(self, statement: str, seconds: float, rows: Optional[int] = None,
+               query_id: Optional[str] = None, caller: Optional[str] = None, error: Optional[str] = None):
+        """Record one statement execution"""
+        statement_id = fingerprint(statement)
+        caller = caller or self.caller()
+        rows = rows if rows is not None and rows >= 0 else 0
+        tags = {'statement': statement_id}
+
+        self.sink.record_timing('db_query_seconds', seconds, tags)
+        self.sink.increment('db_query_rows', rows, tags)
+        if error:
+            self.sink.increment('db_query_errors', 1, tags)
+
+        with self._lock:
+            stats = self._statements.get(statement_id)
+            if stats is None:
+                stats = {
+                    'fingerprint': statement_id,
+                    'statement': normalize_statement(statement)[:200],
+                    'calls': 0, 'errors': 0, 'rows': 0,
+                    'total_seconds': 0.0, 'max_seconds': 0.0,
+                    'callers': set()
+                }
+                self._statements[statement_id] = stats
+            stats['calls'] += 1
+            stats['rows'] += rows
+            stats['total_seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['callers'].add(caller)
+            if error:
+                stats['errors'] += 1
+
+            execution = {
+                'fingerprint': statement_id, 'seconds': seconds, 'rows': rows,
+                'query_id': query_id, 'caller': caller, 'error': error
+            }
+            self._sequence += 1
+            entry = (seconds, self._sequence, execution)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, entry)
+            elif seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def report(self, top_n: int = 10) -> Dict[str, Any]:
+        """Top-N statements by total time plus the top-N slowest single executions"""
+        with self._lock:
+            statements = sorted(self._statements.values(), key=lambda s: s['total_seconds'], reverse=True)
+            slowest = sorted(self._slowest, reverse=True)[:top_n]
+            return {
+                'run_id': self.run_id,
+                'statements': len(self._statements),
+                'executions': sum(s['calls'] for s in statements),
+                'total_seconds': sum(s['total_seconds'] for s in statements),
+                'top_statements': [{**s, 'callers': sorted(s['callers'])} for s in statements[:top_n]],
+                'slowest_executions': [execution for _, _, execution in slowest]
+            }
+
+    def log_report(self, top_n: int = 10):
+        """Log the per-run report and end the run's query metrics window in the sink"""
+        report = self.report(top_n)
+        self.sink.flush('db_query_')
+        logger.info(f"[queries] run {report['run_id']}: {report['executions']} executions of "
+                    f"{report['statements']} statements in {report['total_seconds']:.2f}s")
+
+        for stats in report['top_statements']:
+            logger.info(
+                f"[queries] {stats['fingerprint']} calls={stats['calls']} total={stats['total_seconds']:.3f}s "
+                f"max={stats['max_seconds']:.3f}s rows={stats['rows']} errors={stats['errors']} "
+                f"callers={','.join(stats['callers'])} :: {stats['statement'][:120]}"
+            )
+        for execution in report['slowest_executions']:
+            logger.info(
+                f"[queries] slow {execution['fingerprint']} {execution['seconds']:.3f}s rows={execution['rows']} "
+                f"sfqid={execution['query_id']} caller={execution['caller']}"
+            )
+
+class InstrumentedCursor:
+    """DB-API cursor proxy that records every execute()"""
+
+    def __init__(self, cursor, instrumentation: QueryInstrumentation):
+        """Wrap a driver cursor"""
+        self._cursor = cursor
+        self._instrumentation = instrumentation
+
+    def execute(self, statement, *args, **kwargs):
+        """Execute and record elapsed time, rows, query id and caller"""
+        caller = self._instrumentation.caller()
+        start = time.perf_counter()
+        try:
+            result = self._cursor.execute(statement, *args, **kwargs)
+        except Exception as e:
+            self._instrumentation.record(statement, time.perf_counter() - start,
+                                         query_id=getattr(self._cursor, 'sfqid', None),
+                                         caller=caller, error=type(e).__name__)
+            raise
+
+        self._instrumentation.record(statement, time.perf_counter() - start,
+                                     rows=getattr(self._cursor, 'rowcount', None),
+                                     query_id=getattr(self._cursor, 'sfqid', None), caller=caller)
+        return result
+
+    def __getattr__(self, name):
+        """Delegate everything else to the driver cursor"""
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        """Iterate the driver cursor"""
+        return iter(self._cursor)
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the driver cursor"""
+        self._cursor.close()
+
+class InstrumentedConnection:
+    """Connection proxy whose cursors are instrumented; `raw` is the driver connection"""
+
+    def __init__(self, connection, instrumentation: QueryInstrumentation):
+        """Wrap a driver connection"""
+        self.raw = connection
+        self._instrumentation = instrumentation
+
+    def cursor(self, *args, **kwargs) -> InstrumentedCursor:
+        """Instrumented cursor on the driver connection"""
+        return InstrumentedCursor(self.raw.cursor(*args, **kwargs), self._instrumentation)
+
+    def __getattr__(self, name):
+        """Delegate everything else to the driver connection"""
+        return getattr(self.raw, name)
+
+# Shared by every storage backend in the process
+query_instrumentation = QueryInstrumentation()
@@ -0,0 +1,211 @@
+"""
+Sentiment Rollup Cube
+Bucket arithmetic for SENTIMENT_ROLLUP: hour, day, week and month cells per company and source
+"""
+
+from datetime import datetime, date, timedelta
+from typing import List, Tuple, Iterable, Optional
+
+# Finest to coarsest; day and coarser cells are rebuilt from the level below
+ROLLUP_GRANULARITIES = ('hour', 'day', 'week', 'month')
+
+# Source value of the per-company cells that roll up every source
+ROLLUP_ALL_SOURCES = '*'
+
+def bucket_start(granularity: str, moment: datetime) -> datetime:
+    """Start of the bucket containing a moment (weeks start on Monday)"""
+    if granularity == 'hour':
+        return moment.replace(minute=0, second=0, microsecond=0)
+
+    day = datetime.combine(moment.date(), datetime.min.time())
+    if granularity == 'day':
+        return day
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    raise ValueError(f"Unknown rollup granularity: {granularity}")
+
+def bucket_end(granularity: str, start: datetime) -> datetime:
+    """End (exclusive) of the bucket starting at start"""
+    if granularity == 'hour':
+        return start + timedelta(hours=1)
+    if granularity == 'day':
+        return start + timedelta(days=1)
+    if granularity == 'week':
+        return start + timedelta(days=7)
+    if granularity == 'month':
+        return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+    raise ValueError(f"Unknown rollup granularity: {granularity}")
+
+def touched_buckets(keys: Iterable[Tuple[int, date]], granularity: str) -> List[Tuple[int, datetime, datetime]]:
+    """(company_id, bucket_start, bucket_end) cells holding the touched (company_id, date) keys
+
+    Hour cells are rebuilt a whole day at a time, so their ranges are days.
+    """
+    level = 'day' if granularity == 'hour' else granularity
+    starts = {(company_id, bucket_start(level, datetime.combine(day, datetime.min.time()))) for company_id, day in keys}
+    return sorted((company_id, start, bucket_end(level, start)) for company_id, start in starts)
+
+def choose_granularity(days: int) -> str:
+    """Time-series granularity for a window of N days (about 24-100 points per series)"""
+    if days <= 2:
+        return 'hour'
+    if days <= 90:
+        return 'day'
+    if days <= 365:
+        return 'week'
+    return 'month'
+
+def window_bounds(days: int, today: Optional[date] = None) -> Tuple[datetime, datetime]:
+    """[start, end) of the last N days up to and including today"""
+    today = today or date.today()
+    end = datetime.combine(today + timedelta(days=1), datetime.min.time())
+    return end - timedelta(days=int(days) + 1), end
+
+def cover_window(start: datetime, end: datetime) -> List[Tuple[str, datetime, datetime]]:
+    """Fewest day/week/month buckets tiling [start, end), as (granularity, from, to) runs
+
+    Whole months are read from month cells, whole weeks around them from week
+    cells and the ragged edges from day cells, so a 90-day window reads about
+    a dozen cells per company instead of 90. Bounds inside a day widen to the
+    whole day, the finest cell these runs read; an empty window reads nothing.
+    """
+    runs: List[Tuple[str, datetime, datetime]] = []
+    if end <= start:
+        return runs
+    position = bucket_start('day', start)
+    while position < end:
+        next_month = bucket_end('month', bucket_start('month', position))
+        if position.day == 1 and next_month <= end:
+            granularity = 'month'
+        elif position.weekday() == 0 and position + timedelta(days=7) <= end and not (
+                next_month < position + timedelta(days=7) and bucket_end('month', next_month) <= end):
+            granularity = 'week'
+        else:
+            # Step by days up to the next Monday, or to a month boundary a whole month fits after
+            granularity = 'day'
+        step_end = bucket_end(granularity, position)
+
+        if runs and runs[-1][0] == granularity and runs[-1][2] == position:
+            runs[-1] = (granularity, runs[-1][1], step_end)
+        else:
+            runs.append((granularity, position, step_end))
+        position = step_end
+    return runs
+
+def timestamp_literal(moment: datetime) -> str:
+    """SQL timestamp literal understood by Snowflake and DuckDB"""
+    return f"'{moment:%Y-%m-%d %H:%M:%S}'::TIMESTAMP"
+
+def window_filter(days: int, alias: str = 'r') -> str:
+    """WHERE clause selecting the cells that tile the last N days"""
+    runs = cover_window(*window_bounds(days))
+    return "(" + " OR ".join(
+        f"({alias}.granularity = '{granularity}' AND {alias}.bucket_start >= {timestamp_literal(start)} "
+        f"AND {alias}.bucket_start < {timestamp_literal(end)})"
+        for granularity, start, end in runs
+    ) + ")"
+
+def series_filter(days: int, granularity: str, alias: str = 'r') -> str:
+    """WHERE clause selecting one granularity's cells over the last N days"""
+    start, end = window_bounds(days)
+    return (f"({alias}.granularity = '{granularity}' "
+            f"AND {alias}.bucket_start >= {timestamp_literal(bucket_start(granularity, start))} "
+            f"AND {alias}.bucket_start < {timestamp_literal(end)})")
+
+# Additive measures every level carries; averages are sums over counts so cells merge exactly
+_MEASURES = ('article_count', 'scored_article_count', 'sentiment_sum', 'sentiment_count',
+             'positive_count', 'negative_count', 'neutral_count')
+
+ROLLUP_COLUMNS = ('granularity', 'bucket_start', 'company_id', 'source') + _MEASURES + ('scored_days', 'daily_avg_sum')
+
+def rollup_delete_query(granularity: str, touched: str) -> str:
+    """DELETE of a level's cells inside the touched (company_id, bucket_start, bucket_end) ranges"""
+    return f"""
+        DELETE FROM SENTIMENT_ROLLUP
+        USING {touched} t
+        WHERE SENTIMENT_ROLLUP.granularity = '{granularity}'
+            AND SENTIMENT_ROLLUP.company_id = t.company_id
+            AND SENTIMENT_ROLLUP.bucket_start >= t.bucket_start
+            AND SENTIMENT_ROLLUP.bucket_start < t.bucket_end
+        """
+
+def rollup_insert_query(granularity: str, touched: str, start: datetime, end: datetime) -> str:
+    """INSERT rebuilding a level's cells in the touched ranges
+
+    Hour cells aggregate NEWS_ARTICLES and SENTIMENT_ANALYSIS directly, with a
+    per-company cell (source '*') alongside each source's; day cells sum hour
+    cells and week/month cells sum day cells. start and end bound the touched
+    ranges so the raw scan can prune on article dates.
+    """
+    columns = ", ".join(ROLLUP_COLUMNS)
+
+    if granularity == 'hour':
+        return f"""
+        INSERT INTO SENTIMENT_ROLLUP ({columns})
+        SELECT
+            'hour',
+            bucket_start,
+            company_id,
+            CASE WHEN GROUPING(source) = 1 THEN '{ROLLUP_ALL_SOURCES}' ELSE source END,
+            COUNT(DISTINCT article_id),
+            COUNT(DISTINCT scored_article_id),
+            SUM(sentiment_score),
+            COUNT(sentiment_score),
+            SUM(CASE WHEN sentiment_label = 'positive' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN sentiment_label = 'negative' THEN 1 ELSE 0 END),
+            SUM(CASE WHEN sentiment_label = 'neutral' THEN 1 ELSE 0 END),
+            NULL,
+            NULL
+        FROM (
+            SELECT
+                na.company_id,
+                DATE_TRUNC('hour', COALESCE(na.published_date, na.scraped_date)) AS bucket_start,
+                COALESCE(na.source, 'unknown') AS source,
+                na.article_id,
+                sa.article_id AS scored_article_id,
+                sa.sentiment_score,
+                sa.sentiment_label
+            FROM {touched} t
+            JOIN NEWS_ARTICLES na
+                ON na.company_id = t.company_id
+                AND COALESCE(na.published_date, na.scraped_date) >= t.bucket_start
+                AND COALESCE(na.published_date, na.scraped_date) < t.bucket_end
+            LEFT JOIN SENTIMENT_ANALYSIS sa ON sa.article_id = na.article_id
+            WHERE (na.published_date >= {timestamp_literal(start)} AND na.published_date < {timestamp_literal(end)})
+                OR (na.published_date IS NULL
+                    AND na.scraped_date >= {timestamp_literal(start)} AND na.scraped_date < {timestamp_literal(end)})
+        ) base
+        GROUP BY GROUPING SETS ((company_id, bucket_start, source), (company_id, bucket_start))
+        """
+
+    if granularity == 'day':
+        # A day cell is the first level that knows whether its day had scored articles
+        child = 'hour'
+        scored_days = "CASE WHEN SUM(r.scored_article_count) > 0 THEN 1 ELSE 0 END"
+        daily_avg_sum = "SUM(r.sentiment_sum) / NULLIF(SUM(r.sentiment_count), 0)"
+    else:
+        child = 'day'
+        scored_days = "SUM(r.scored_days)"
+        daily_avg_sum = "SUM(r.daily_avg_sum)"
+
+    sums = ",\n            ".join(f"SUM(r.{measure})" for measure in _MEASURES)
+    return f"""
+        INSERT INTO SENTIMENT_ROLLUP ({columns})
+        SELECT
+            '{granularity}',
+            t.bucket_start,
+            r.company_id,
+            r.source,
+            {sums},
+            {scored_days},
+            {daily_avg_sum}
+        FROM {touched} t
+        JOIN SENTIMENT_ROLLUP r
+            ON r.granularity = '{child}'
+            AND r.company_id = t.company_id
+            AND r.bucket_start >= t.bucket_start
+            AND r.bucket_start < t.bucket_end
+        GROUP BY t.bucket_start, r.company_id, r.source
+        """
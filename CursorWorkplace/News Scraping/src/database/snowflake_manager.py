@@ -4,48 +4,110 @@ Handles Snowflake database connections and operations
 """
 
 import os
+import re
 import json
-from typing import List, Dict, Any, Optional
-from datetime import datetime, date
+import time
+import uuid
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Union
+from datetime import datetime, date, timedelta
 import pandas as pd
 from loguru import logger
 
-import snowflake.connector
 from snowflake.connector.pandas_tools import write_pandas
-from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
 
-from config.snowflake_config import SnowflakeConfig, get_all_setup_queries
+from config.snowflake_config import SnowflakeConfig
+from src.database.id_allocator import id_allocator, ID_SEQUENCES
+from src.database.company_cache import company_cache
+from src.database.connection_pool import get_connection_pool
+from src.database.migrations import migration_runner
+from src.database.storage_backend import StorageBackend
+from src.database.query_instrumentation import query_instrumentation, InstrumentedConnection
+from src.database.rollup import (
+    ROLLUP_GRANULARITIES,
+    choose_granularity,
+    touched_buckets,
+    rollup_delete_query,
+    rollup_insert_query
+)
 from src.models.news_article import (
     NewsArticle, 
     SentimentAnalysis, 
-    NewsArticleWithSentiment,
     DailySentimentSummary
 )
 
-class SnowflakeManager:
+# Staging column types for the bulk MERGE paths, keyed by table column
+ARTICLE_COLUMNS = {
+    'company_id': 'INTEGER', 'title': 'VARCHAR', 'content': 'VARCHAR', 'url': 'VARCHAR',
+    'source': 'VARCHAR', 'published_date': 'TIMESTAMP_NTZ', 'scraped_date': 'TIMESTAMP_NTZ'
+}
+
+SENTIMENT_COLUMNS = {
+    'article_id': 'INTEGER', 'company_id': 'INTEGER', 'engine': 'VARCHAR', 'sentiment_score': 'FLOAT',
+    'sentiment_label': 'VARCHAR', 'confidence_score': 'FLOAT', 'keywords': 'VARCHAR'
+}
+
+# Statements with a row result Snowflake returns as Arrow; DML, DDL and SHOW/DESCRIBE results come back as JSON
+ARROW_RESULT_PATTERN = re.compile(r'^\s*(?:(?:--[^\n]*\n|/\*.*?\*/)\s*)*\(*\s*(?:SELECT|WITH)\b',
+                                  re.IGNORECASE | re.DOTALL)
+
+# Internal stage and session tables for loading the Parquet spool with PUT / COPY INTO
+SPOOL_STAGE = 'NEWS_SPOOL_STAGE'
+
+# Internal stage holding archived article content (see archive_article_content)
+ARCHIVE_STAGE = 'NEWS_ARCHIVE_STAGE'
+ARCHIVE_FILE_FORMAT = 'NEWS_PARQUET_FORMAT'
+
+SPOOL_ARTICLE_COLUMNS = {
+    'batch_id': 'VARCHAR', 'batch_row': 'INTEGER', 'ticker': 'VARCHAR', 'title': 'VARCHAR',
+    'content': 'VARCHAR', 'url': 'VARCHAR', 'source': 'VARCHAR', 'published_date': 'TIMESTAMP_NTZ',
+    'scraped_date': 'TIMESTAMP_NTZ'
+}
+
+SPOOL_SENTIMENT_COLUMNS = {
+    'batch_id': 'VARCHAR', 'batch_row': 'INTEGER', 'url': 'VARCHAR', 'engine': 'VARCHAR',
+    'sentiment_score': 'FLOAT', 'sentiment_label': 'VARCHAR', 'confidence_score': 'FLOAT', 'keywords': 'VARCHAR'
+}
+
+SUMMARY_COLUMNS = {
+    'company_id': 'INTEGER', 'date': 'DATE', 'avg_sentiment_score': 'FLOAT', 'sentiment_label': 'VARCHAR',
+    'article_count': 'INTEGER', 'positive_count': 'INTEGER', 'negative_count': 'INTEGER',
+    'neutral_count': 'INTEGER'
+}
+
+class SnowflakeManager(StorageBackend):
     """Manages Snowflake database operations"""
     
+    json_placeholder = 'PARSE_JSON(%s)'
+    
     def __init__(self):
         """Initialize Snowflake manager"""
+        super().__init__()
         self.config = SnowflakeConfig()
-        self.connection = None
         self.engine = None
         
         if not self.config.validate_config():
             raise ValueError("Invalid Snowflake configuration. Check your environment variables.")
+        
+        self.pool = get_connection_pool(self.config)
     
     def connect(self) -> bool:
-        """Establish connection to Snowflake"""
+        """Check out a pooled Snowflake connection (no-op if one is already held)"""
+        if self.connection:
+            return True
+        
         try:
-            self.connection = snowflake.connector.connect(
-                **self.config.get_connection_params()
-            )
+            self.connection = InstrumentedConnection(self.pool.acquire(), query_instrumentation)
             
-            # Create SQLAlchemy engine for pandas operations
-            self.engine = create_engine(self.config.get_connection_string())
+            # Tag the session so QUERY_HISTORY (bytes scanned, queueing) joins back to this run
+            if os.getenv('SNOWFLAKE_QUERY_TAG', 'false').lower() == 'true':
+                cursor = self.connection.cursor()
+                cursor.execute("ALTER SESSION SET QUERY_TAG = %s", (query_instrumentation.query_tag(),))
+                cursor.close()
             
-            logger.info("Successfully connected to Snowflake")
+            # Shared SQLAlchemy engine for pandas operations
+            self.engine = self.pool.get_engine(self.config.get_connection_string())
+            
+            logger.debug("Acquired Snowflake connection from pool")
             return True
             
         except Exception as e:
@@ -53,13 +115,17 @@ class SnowflakeManager:
             return False
     
     def disconnect(self):
-        """Close Snowflake connection"""
+        """Return the Snowflake connection to the pool"""
         if self.connection:
-            self.connection.close()
-            logger.info("Disconnected from Snowflake")
+            self.pool.release(self.connection.raw)
+            self.connection = None
+            logger.debug("Released Snowflake connection to pool")
         
-        if self.engine:
-            self.engine.dispose()
+        self.engine = None
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Connection pool counters (connects, reuses, waits, wait time)"""
+        return self.pool.metrics()
     
     def setup_database(self) -> bool:
         """Setup database tables and views"""
@@ -68,15 +134,9 @@ class SnowflakeManager:
                 if not self.connect():
                     return False
             
-            cursor = self.connection.cursor()
-            
-            # Execute all setup queries
-            for query in get_all_setup_queries():
-                cursor.execute(query)
-                logger.debug(f"Executed query: {query[:100]}...")
-            
-            cursor.close()
-            logger.info("Database setup completed successfully")
+            # A current schema costs a single version check
+            applied = migration_runner.migrate(self.connection)
+            logger.info(f"Database setup completed successfully ({applied} migrations applied)")
             return True
             
         except Exception as e:
@@ -86,25 +146,27 @@ class SnowflakeManager:
     def insert_company(self, company_data: Dict[str, Any]) -> Optional[int]:
         """Insert a company into the database"""
         try:
+            company_id = id_allocator.next_id(self.connection, 'COMPANIES')
             cursor = self.connection.cursor()
             
+            # Stored upper-case, as insert_companies does, so case-insensitive lookups find it
+            ticker = company_data['ticker'].upper()
             query = """
-            INSERT INTO COMPANIES (rank, name, ticker, sector)
-            VALUES (%s, %s, %s, %s)
+            INSERT INTO COMPANIES (company_id, rank, name, ticker, sector)
+            VALUES (%s, %s, %s, %s, %s)
             """
             
             cursor.execute(query, (
+                company_id,
                 company_data['rank'],
                 company_data['name'],
-                company_data['ticker'],
+                ticker,
                 company_data['sector']
             ))
-            # Fetch the company_id by ticker (unique)
-            cursor.execute("SELECT company_id FROM COMPANIES WHERE ticker = %s", (company_data['ticker'],))
-            result = cursor.fetchone()
-            company_id = result[0] if result else None
             cursor.close()
             
+            company_cache.add(company_id, ticker, company_data['name'], company_data['sector'])
+            
             logger.info(f"Inserted company: {company_data['name']} (ID: {company_id})")
             return company_id
             
@@ -112,18 +174,65 @@ class SnowflakeManager:
             logger.error(f"Failed to insert company {company_data['name']}: {e}")
             return None
     
+    def insert_companies(self, companies: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert companies missing from the cache with a single multi-row INSERT
+        
+        Returns ticker -> company_id for every input company, including ones
+        that already existed.
+        """
+        try:
+            new_companies = []
+            seen = set()
+            for company in companies:
+                ticker = company['ticker'].upper()
+                if ticker not in seen and not company_cache.get(self.connection, ticker):
+                    new_companies.append(company)
+                seen.add(ticker)
+            
+            if new_companies:
+                ids = id_allocator.allocate(self.connection, 'COMPANIES', len(new_companies))
+                
+                placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(new_companies))
+                params = []
+                for company_id, company in zip(ids, new_companies):
+                    params.extend([company_id, company['rank'], company['name'],
+                                   company['ticker'].upper(), company['sector']])
+                
+                cursor = self.connection.cursor()
+                cursor.execute(
+                    f"INSERT INTO COMPANIES (company_id, rank, name, ticker, sector) VALUES {placeholders}",
+                    params
+                )
+                cursor.close()
+                
+                for company_id, company in zip(ids, new_companies):
+                    company_cache.add(company_id, company['ticker'], company['name'], company['sector'])
+                
+                logger.info(f"Inserted {len(new_companies)} companies")
+            
+            return {
+                company['ticker'].upper(): company_cache.get(self.connection, company['ticker'])['company_id']
+                for company in companies
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to insert companies: {e}")
+            return {}
+    
     def insert_news_article(self, article: NewsArticle) -> Optional[int]:
         """Insert a news article into the database"""
         try:
+            article_id = id_allocator.next_id(self.connection, 'NEWS_ARTICLES')
             cursor = self.connection.cursor()
             
             query = """
             INSERT INTO NEWS_ARTICLES 
-            (company_id, title, content, url, source, published_date, scraped_date)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            (article_id, company_id, title, content, url, source, published_date, scraped_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """
             
             cursor.execute(query, (
+                article_id,
                 article.company_id,
                 article.title,
                 article.content,
@@ -132,10 +241,6 @@ class SnowflakeManager:
                 article.published_date,
                 article.scraped_date
             ))
-            # Fetch the article_id by url (unique)
-            cursor.execute("SELECT article_id FROM NEWS_ARTICLES WHERE url = %s", (article.url,))
-            result = cursor.fetchone()
-            article_id = result[0] if result else None
             cursor.close()
             
             logger.debug(f"Inserted article: {article.title[:50]}... (ID: {article_id})")
@@ -148,18 +253,20 @@ class SnowflakeManager:
     def insert_sentiment_analysis(self, sentiment: SentimentAnalysis) -> Optional[int]:
         """Insert sentiment analysis result into the database"""
         try:
+            sentiment_id = id_allocator.next_id(self.connection, 'SENTIMENT_ANALYSIS')
             cursor = self.connection.cursor()
             
             query = """
             INSERT INTO SENTIMENT_ANALYSIS 
-            (article_id, company_id, engine, sentiment_score, sentiment_label, 
+            (sentiment_id, article_id, company_id, engine, sentiment_score, sentiment_label, 
              confidence_score, keywords)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
             """
             
             keywords_json = json.dumps(sentiment.keywords) if sentiment.keywords else None
             
             cursor.execute(query, (
+                sentiment_id,
                 sentiment.article_id,
                 sentiment.company_id,
                 sentiment.engine.value,
@@ -168,14 +275,6 @@ class SnowflakeManager:
                 sentiment.confidence_score,
                 keywords_json
             ))
-            # Fetch the sentiment_id by article_id, company_id, engine (composite unique)
-            cursor.execute("SELECT sentiment_id FROM SENTIMENT_ANALYSIS WHERE article_id = %s AND company_id = %s AND engine = %s", (
-                sentiment.article_id,
-                sentiment.company_id,
-                sentiment.engine.value
-            ))
-            result = cursor.fetchone()
-            sentiment_id = result[0] if result else None
             cursor.close()
             
             logger.debug(f"Inserted sentiment analysis (ID: {sentiment_id})")
@@ -188,16 +287,18 @@ class SnowflakeManager:
     def insert_daily_summary(self, summary: DailySentimentSummary) -> Optional[int]:
         """Insert daily sentiment summary into the database"""
         try:
+            summary_id = id_allocator.next_id(self.connection, 'DAILY_SENTIMENT_SUMMARY')
             cursor = self.connection.cursor()
             
             query = """
             INSERT INTO DAILY_SENTIMENT_SUMMARY 
-            (company_id, date, avg_sentiment_score, sentiment_label, 
+            (summary_id, company_id, date, avg_sentiment_score, sentiment_label, 
              article_count, positive_count, negative_count, neutral_count)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
             """
             
             cursor.execute(query, (
+                summary_id,
                 summary.company_id,
                 summary.date.date(),
                 summary.avg_sentiment_score,
@@ -207,13 +308,6 @@ class SnowflakeManager:
                 summary.negative_count,
                 summary.neutral_count
             ))
-            # Fetch the summary_id by company_id and date (composite unique)
-            cursor.execute("SELECT summary_id FROM DAILY_SENTIMENT_SUMMARY WHERE company_id = %s AND date = %s", (
-                summary.company_id,
-                summary.date.date()
-            ))
-            result = cursor.fetchone()
-            summary_id = result[0] if result else None
             cursor.close()
             
             logger.info(f"Inserted daily summary for {summary.company_name} on {summary.date.date()}")
@@ -223,191 +317,687 @@ class SnowflakeManager:
             logger.error(f"Failed to insert daily summary: {e}")
             return None
     
-    def get_company_id(self, ticker: str) -> Optional[int]:
-        """Get company ID by ticker symbol"""
+    def _stage_dataframe(self, cursor, stage_table: str, columns_ddl: str, df: pd.DataFrame) -> bool:
+        """Create a session-scoped staging table and bulk upload a DataFrame into it"""
+        cursor.execute(f"CREATE OR REPLACE TEMPORARY TABLE {stage_table} ({columns_ddl})")
+        
+        success, chunks, rows, _ = write_pandas(
+            self.connection,
+            df,
+            stage_table,
+            quote_identifiers=False,
+            use_logical_type=True
+        )
+        
+        if not success:
+            logger.error(f"Bulk upload to {stage_table} failed")
+            return False
+        
+        logger.debug(f"Uploaded {rows} rows to {stage_table} in {chunks} chunk(s)")
+        return True
+    
+    def _bulk_merge(self, table: str, id_column: str, key_columns: List[str], columns: Dict[str, str],
+                    rows: List[Optional[Dict[str, Any]]], update_existing: bool) -> List[Optional[int]]:
+        """Stage rows and MERGE them into `table` on its natural key in one statement
+        
+        `columns` maps every non-id column to its staging type and `rows` is
+        aligned with the caller's input (None rows are skipped). The MERGE is
+        authoritative: new keys take ids from the table's sequence, existing
+        keys keep theirs (and are updated when update_existing is set), and
+        ids are read back by batch row in the same transaction. Returns ids
+        aligned with rows.
+        """
+        df = pd.DataFrame([
+            {'BATCH_ROW': i, **{column.upper(): row[column] for column in columns}}
+            for i, row in enumerate(rows) if row
+        ])
+        if df.empty:
+            return [None] * len(rows)
+        
+        stage_table = f"{table}_STAGE"
+        columns_ddl = ", ".join(
+            ["batch_row INTEGER"] + [f"{column} {column_type}" for column, column_type in columns.items()]
+        )
+        join_condition = " AND ".join(f"t.{column} = s.{column}" for column in key_columns)
+        update_columns = [column for column in columns if column not in key_columns]
+        
+        cursor = self.connection.cursor()
+        
+        if not self._stage_dataframe(cursor, stage_table, columns_ddl, df):
+            cursor.close()
+            return [None] * len(rows)
+        
+        matched_clause = ""
+        if update_existing and update_columns:
+            matched_clause = "WHEN MATCHED THEN UPDATE SET " + ", ".join(
+                f"{column} = s.{column}" for column in update_columns
+            )
+        
+        ids: List[Optional[int]] = [None] * len(rows)
+        cursor.execute("BEGIN")
+        try:
+            # The last row per key wins; rows sharing a key all get that key's id
+            cursor.execute(f"""
+            MERGE INTO {table} t
+            USING (
+                SELECT * FROM {stage_table}
+                QUALIFY ROW_NUMBER() OVER (PARTITION BY {", ".join(key_columns)} ORDER BY batch_row DESC) = 1
+            ) s
+            ON {join_condition}
+            {matched_clause}
+            WHEN NOT MATCHED THEN INSERT ({", ".join([id_column] + list(columns))})
+            VALUES ({ID_SEQUENCES[table][0]}.NEXTVAL, {", ".join(f"s.{column}" for column in columns)})
+            """)
+            affected = cursor.rowcount
+            
+            cursor.execute(f"""
+            SELECT s.batch_row, t.{id_column}
+            FROM {stage_table} s
+            JOIN {table} t ON {join_condition}
+            """)
+            for batch_row, row_id in cursor.fetchall():
+                ids[batch_row] = row_id
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.close()
+        
+        logger.info(f"Merged {len(df)} rows into {table} ({affected} affected)")
+        return ids
+    
+    def insert_news_articles_bulk(self, articles: List[NewsArticle]) -> List[Optional[int]]:
+        """Insert a batch of articles with one upload and one MERGE
+        
+        Returns article ids aligned with the input list (None where an article
+        has no URL or failed to load). Articles whose URL already exists keep
+        their id and stored values.
+        """
+        if not articles:
+            return []
+        
+        try:
+            return self._bulk_merge('NEWS_ARTICLES', 'article_id', ['url'], ARTICLE_COLUMNS,
+                                    [self._article_row(article) for article in articles], update_existing=False)
+        except Exception as e:
+            logger.error(f"Failed to bulk insert articles: {e}")
+            return [None] * len(articles)
+    
+    def insert_sentiment_bulk(self, sentiments: List[SentimentAnalysis]) -> List[Optional[int]]:
+        """Insert a batch of sentiment analyses keyed on (article_id, engine)
+        
+        Returns sentiment ids aligned with the input list.
+        """
+        if not sentiments:
+            return []
+        
+        try:
+            return self._bulk_merge('SENTIMENT_ANALYSIS', 'sentiment_id', ['article_id', 'engine'],
+                                    SENTIMENT_COLUMNS, [self._sentiment_row(s) for s in sentiments],
+                                    update_existing=False)
+        except Exception as e:
+            logger.error(f"Failed to bulk insert sentiment analyses: {e}")
+            return [None] * len(sentiments)
+    
+    def upsert_news_articles(self, articles: List[NewsArticle]) -> List[Optional[int]]:
+        """Idempotently upsert articles on url with one MERGE"""
+        if not articles:
+            return []
+        
+        try:
+            return self._bulk_merge('NEWS_ARTICLES', 'article_id', ['url'], ARTICLE_COLUMNS,
+                                    [self._article_row(article) for article in articles], update_existing=True)
+        except Exception as e:
+            logger.error(f"Failed to upsert articles: {e}")
+            return [None] * len(articles)
+    
+    def upsert_sentiment_analyses(self, sentiments: List[SentimentAnalysis]) -> List[Optional[int]]:
+        """Idempotently upsert sentiment results on (article_id, engine) with one MERGE"""
+        if not sentiments:
+            return []
+        
+        try:
+            return self._bulk_merge('SENTIMENT_ANALYSIS', 'sentiment_id', ['article_id', 'engine'],
+                                    SENTIMENT_COLUMNS, [self._sentiment_row(s) for s in sentiments],
+                                    update_existing=True)
+        except Exception as e:
+            logger.error(f"Failed to upsert sentiment analyses: {e}")
+            return [None] * len(sentiments)
+    
+    def upsert_daily_summaries(self, summaries: List[DailySentimentSummary]) -> List[Optional[int]]:
+        """Idempotently upsert daily summaries on (company_id, date) with one MERGE"""
+        if not summaries:
+            return []
+        
+        try:
+            return self._bulk_merge('DAILY_SENTIMENT_SUMMARY', 'summary_id', ['company_id', 'date'],
+                                    SUMMARY_COLUMNS, [self._summary_row(summary) for summary in summaries],
+                                    update_existing=True)
+        except Exception as e:
+            logger.error(f"Failed to upsert daily summaries: {e}")
+            return [None] * len(summaries)
+    
+    def refresh_daily_summaries(self, keys: List[Tuple[int, date]], chunk_size: int = 5000) -> int:
+        """Recompute DAILY_SENTIMENT_SUMMARY for the given (company_id, date) keys only
+        
+        Dates are article publication dates (falling back to scrape time when
+        unpublished). Each chunk of keys is recomputed and merged with a single
+        set-based statement; new rows take ids from the summary sequence.
+        Returns the number of summary rows inserted or updated.
+        """
+        keys = sorted(set(keys))
+        if not keys:
+            return 0
+        
         try:
             cursor = self.connection.cursor()
+            affected = 0
+            
+            for offset in range(0, len(keys), chunk_size):
+                chunk = keys[offset:offset + chunk_size]
+                values = ", ".join(["(%s, %s)"] * len(chunk))
+                start, _ = self.day_bounds(min(day for _, day in chunk))
+                _, end = self.day_bounds(max(day for _, day in chunk))
+                params = [value for key in chunk for value in key] + [start, end, start, end]
+                
+                cursor.execute(f"""
+                MERGE INTO DAILY_SENTIMENT_SUMMARY t
+                USING (
+                    WITH touched AS (
+                        SELECT column1::INTEGER AS company_id, column2::DATE AS date
+                        FROM VALUES {values}
+                    )
+                    SELECT
+                        d.company_id,
+                        d.date,
+                        AVG(sa.sentiment_score) AS avg_sentiment_score,
+                        CASE
+                            WHEN AVG(sa.sentiment_score) > 0.1 THEN 'positive'
+                            WHEN AVG(sa.sentiment_score) < -0.1 THEN 'negative'
+                            ELSE 'neutral'
+                        END AS sentiment_label,
+                        COUNT(DISTINCT sa.article_id) AS article_count,
+                        SUM(CASE WHEN sa.sentiment_label = 'positive' THEN 1 ELSE 0 END) AS positive_count,
+                        SUM(CASE WHEN sa.sentiment_label = 'negative' THEN 1 ELSE 0 END) AS negative_count,
+                        SUM(CASE WHEN sa.sentiment_label = 'neutral' THEN 1 ELSE 0 END) AS neutral_count
+                    FROM touched d
+                    JOIN NEWS_ARTICLES na
+                        ON na.company_id = d.company_id
+                        AND (
+                            (na.published_date >= d.date AND na.published_date < DATEADD(day, 1, d.date))
+                            OR (na.published_date IS NULL
+                                AND na.scraped_date >= d.date AND na.scraped_date < DATEADD(day, 1, d.date))
+                        )
+                    JOIN SENTIMENT_ANALYSIS sa ON sa.article_id = na.article_id
+                    -- Literal bounds let Snowflake prune NEWS_ARTICLES partitions up front
+                    WHERE (na.published_date >= %s AND na.published_date < %s)
+                        OR (na.published_date IS NULL AND na.scraped_date >= %s AND na.scraped_date < %s)
+                    GROUP BY d.company_id, d.date
+                ) s
+                ON t.company_id = s.company_id AND t.date = s.date
+                WHEN MATCHED THEN UPDATE SET
+                    avg_sentiment_score = s.avg_sentiment_score,
+                    sentiment_label = s.sentiment_label,
+                    article_count = s.article_count,
+                    positive_count = s.positive_count,
+                    negative_count = s.negative_count,
+                    neutral_count = s.neutral_count
+                WHEN NOT MATCHED THEN INSERT
+                    (summary_id, company_id, date, avg_sentiment_score, sentiment_label,
+                     article_count, positive_count, negative_count, neutral_count)
+                VALUES
+                    ({ID_SEQUENCES['DAILY_SENTIMENT_SUMMARY'][0]}.NEXTVAL, s.company_id, s.date,
+                     s.avg_sentiment_score, s.sentiment_label, s.article_count,
+                     s.positive_count, s.negative_count, s.neutral_count)
+                """, params)
+                affected += cursor.rowcount
             
-            query = "SELECT company_id FROM COMPANIES WHERE ticker = %s"
-            cursor.execute(query, (ticker.upper(),))
-            
-            result = cursor.fetchone()
             cursor.close()
             
-            return result[0] if result else None
+            logger.info(f"Refreshed daily summaries for {len(keys)} touched keys ({affected} rows merged)")
+            return affected
             
         except Exception as e:
-            logger.error(f"Failed to get company ID for {ticker}: {e}")
-            return None
+            logger.error(f"Failed to refresh daily summaries: {e}")
+            return 0
     
-    def get_daily_sentiment_data(self, days: int = 7) -> pd.DataFrame:
-        """Get daily sentiment data for the last N days"""
+    def refresh_rollups(self, keys: List[Tuple[int, date]], chunk_size: int = 3000) -> int:
+        """Rebuild SENTIMENT_ROLLUP cells holding the given (company_id, date) keys at every granularity
+        
+        Levels are rebuilt finest first: hour cells from the touched days'
+        articles, then day cells from hours and week/month cells from days,
+        so each refresh reads only the touched companies' cells.
+        Returns the number of cells written.
+        """
+        keys = sorted(set(keys))
+        if not keys:
+            return 0
+        
         try:
-            query = f"""
-            SELECT 
-                company_name,
-                ticker,
-                sector,
-                date,
-                avg_sentiment_score,
-                sentiment_label,
-                article_count,
-                positive_count,
-                negative_count,
-                neutral_count
-            FROM DAILY_SUMMARY_VIEW
-            WHERE date >= DATEADD(day, -{days}, CURRENT_DATE())
-            ORDER BY date DESC, avg_sentiment_score DESC
-            """
-            
             cursor = self.connection.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
+            written = 0
+            
+            for granularity in ROLLUP_GRANULARITIES:
+                cells = touched_buckets(keys, granularity)
+                for offset in range(0, len(cells), chunk_size):
+                    chunk = cells[offset:offset + chunk_size]
+                    touched = (
+                        "(SELECT column1::INTEGER AS company_id, column2::TIMESTAMP_NTZ AS bucket_start, "
+                        f"column3::TIMESTAMP_NTZ AS bucket_end FROM VALUES {', '.join(['(%s, %s, %s)'] * len(chunk))})"
+                    )
+                    params = [value for cell in chunk for value in cell]
+                    
+                    # One transaction per chunk: the DELETE's table lock keeps workers
+                    # refreshing the same cells from interleaving and duplicating them
+                    cursor.execute("BEGIN")
+                    try:
+                        cursor.execute(rollup_delete_query(granularity, touched), params)
+                        cursor.execute(rollup_insert_query(granularity, touched, min(cell[1] for cell in chunk),
+                                                           max(cell[2] for cell in chunk)), params)
+                        written += cursor.rowcount
+                        cursor.execute("COMMIT")
+                    except Exception:
+                        cursor.execute("ROLLBACK")
+                        raise
+            
             cursor.close()
             
-            if results:
-                columns = ['company_name', 'ticker', 'sector', 'date', 'avg_sentiment_score', 
-                          'sentiment_label', 'article_count', 'positive_count', 'negative_count', 'neutral_count']
-                df = pd.DataFrame(results, columns=columns)
-                logger.info(f"Retrieved {len(df)} daily sentiment records")
-                return df
-            else:
-                logger.warning("No daily sentiment data found")
-                return pd.DataFrame()
+            logger.info(f"Refreshed sentiment rollups for {len(keys)} touched keys ({written} cells written)")
+            return written
             
         except Exception as e:
-            logger.error(f"Failed to get daily sentiment data: {e}")
-            return pd.DataFrame()
+            logger.error(f"Failed to refresh sentiment rollups: {e}")
+            return 0
     
-    def get_top_companies_by_sentiment(self, days: int = 30, limit: int = 10) -> pd.DataFrame:
-        """Get top companies by average sentiment"""
+    def ensure_feed_partitions(self, partition_keys: List[str]) -> bool:
+        """Add FEED_LEASES rows for partitions that have none (MERGE, so racing workers add each once)"""
+        if not partition_keys:
+            return True
+        
         try:
-            query = f"""
-            SELECT 
-                company_name,
-                ticker,
-                sector,
-                AVG(avg_sentiment_score) as avg_sentiment,
-                COUNT(*) as days_analyzed,
-                SUM(article_count) as total_articles
-            FROM DAILY_SUMMARY_VIEW
-            WHERE date >= DATEADD(day, -{days}, CURRENT_DATE())
-            GROUP BY company_name, ticker, sector
-            HAVING COUNT(*) >= 5
-            ORDER BY avg_sentiment DESC
-            LIMIT {limit}
-            """
-            
             cursor = self.connection.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
+            cursor.execute(f"""
+            MERGE INTO FEED_LEASES t
+            USING (SELECT column1 AS partition_key FROM VALUES {', '.join(['(%s)'] * len(partition_keys))}) s
+            ON t.partition_key = s.partition_key
+            WHEN NOT MATCHED THEN INSERT (partition_key, claim_count) VALUES (s.partition_key, 0)
+            """, list(partition_keys))
             cursor.close()
-            
-            if results:
-                columns = ['company_name', 'ticker', 'sector', 'avg_sentiment', 'days_analyzed', 'total_articles']
-                df = pd.DataFrame(results, columns=columns)
-                logger.info(f"Retrieved top {len(df)} companies by sentiment")
-                return df
-            else:
-                logger.warning("No top companies data found")
-                return pd.DataFrame()
+            return True
             
         except Exception as e:
-            logger.error(f"Failed to get top companies: {e}")
-            return pd.DataFrame()
+            logger.error(f"Failed to add feed partitions: {e}")
+            return False
     
-    def get_sector_sentiment(self, days: int = 7) -> pd.DataFrame:
-        """Get sentiment analysis by sector"""
+    def load_spooled_batches(self, spool, batch_ids: List[str]) -> Optional[List[Tuple[int, date]]]:
+        """Bulk load spooled batches: PUT the Parquet files, COPY INTO session tables, then MERGE
+        
+        Every pending batch goes through one COPY and one MERGE per table, so
+        a backlog drains in bulk. Company and article ids are resolved in the
+        warehouse from ticker and url. Returns the touched summary keys, or
+        None if the load failed and the batches should stay spooled.
+        """
+        if not batch_ids:
+            return []
+        
+        prefix = f"@{SPOOL_STAGE}/{uuid.uuid4().hex}"
+        
         try:
-            query = f"""
-            SELECT 
-                sector,
-                AVG(avg_sentiment_score) as sector_sentiment,
-                COUNT(DISTINCT company_name) as company_count,
-                SUM(article_count) as total_articles
-            FROM DAILY_SUMMARY_VIEW
-            WHERE date >= DATEADD(day, -{days}, CURRENT_DATE())
-            GROUP BY sector
-            ORDER BY sector_sentiment DESC
-            """
-            
             cursor = self.connection.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
+            
+            for batch_id in batch_ids:
+                for kind, path in spool.batch_paths(batch_id).items():
+                    if not os.path.exists(path):
+                        continue
+                    # Files are already compressed Parquet
+                    local_path = os.path.abspath(path).replace('\\', '/')
+                    cursor.execute(f"PUT 'file://{local_path}' {prefix}/{kind}/ "
+                                   f"AUTO_COMPRESS = FALSE OVERWRITE = TRUE")
+            
+            for kind, columns in (('articles', SPOOL_ARTICLE_COLUMNS), ('sentiment', SPOOL_SENTIMENT_COLUMNS)):
+                spool_table = f"SPOOL_{kind.upper()}"
+                columns_ddl = ", ".join(f"{column} {column_type}" for column, column_type in columns.items())
+                cursor.execute(f"CREATE OR REPLACE TEMPORARY TABLE {spool_table} ({columns_ddl})")
+                cursor.execute(f"""
+                COPY INTO {spool_table}
+                FROM {prefix}/{kind}/
+                FILE_FORMAT = (TYPE = PARQUET USE_LOGICAL_TYPE = TRUE)
+                MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE
+                PURGE = TRUE
+                """)
+            
+            # Later batches win when the same url was spooled more than once
+            cursor.execute(f"""
+            MERGE INTO NEWS_ARTICLES t
+            USING (
+                SELECT c.company_id, s.title, s.content, s.url, s.source, s.published_date, s.scraped_date
+                FROM SPOOL_ARTICLES s
+                JOIN COMPANIES c ON c.ticker = s.ticker
+                QUALIFY ROW_NUMBER() OVER (PARTITION BY s.url ORDER BY s.batch_id DESC, s.batch_row DESC) = 1
+            ) s
+            ON t.url = s.url
+            WHEN MATCHED THEN UPDATE SET
+                company_id = s.company_id, title = s.title, content = s.content, source = s.source,
+                published_date = s.published_date, scraped_date = s.scraped_date
+            WHEN NOT MATCHED THEN INSERT
+                (article_id, company_id, title, content, url, source, published_date, scraped_date)
+            VALUES
+                ({ID_SEQUENCES['NEWS_ARTICLES'][0]}.NEXTVAL, s.company_id, s.title, s.content, s.url,
+                 s.source, s.published_date, s.scraped_date)
+            """)
+            articles_merged = cursor.rowcount
+            
+            cursor.execute(f"""
+            MERGE INTO SENTIMENT_ANALYSIS t
+            USING (
+                SELECT na.article_id, na.company_id, s.engine, s.sentiment_score, s.sentiment_label,
+                       s.confidence_score, s.keywords
+                FROM SPOOL_SENTIMENT s
+                JOIN NEWS_ARTICLES na ON na.url = s.url
+                QUALIFY ROW_NUMBER() OVER (
+                    PARTITION BY na.article_id, s.engine ORDER BY s.batch_id DESC, s.batch_row DESC
+                ) = 1
+            ) s
+            ON t.article_id = s.article_id AND t.engine = s.engine
+            WHEN MATCHED THEN UPDATE SET
+                company_id = s.company_id, sentiment_score = s.sentiment_score,
+                sentiment_label = s.sentiment_label, confidence_score = s.confidence_score,
+                keywords = s.keywords
+            WHEN NOT MATCHED THEN INSERT
+                (sentiment_id, article_id, company_id, engine, sentiment_score, sentiment_label,
+                 confidence_score, keywords)
+            VALUES
+                ({ID_SEQUENCES['SENTIMENT_ANALYSIS'][0]}.NEXTVAL, s.article_id, s.company_id, s.engine,
+                 s.sentiment_score, s.sentiment_label, s.confidence_score, s.keywords)
+            """)
+            sentiments_merged = cursor.rowcount
+            
+            cursor.execute("""
+            SELECT DISTINCT c.company_id, TO_DATE(COALESCE(s.published_date, s.scraped_date))
+            FROM SPOOL_ARTICLES s
+            JOIN COMPANIES c ON c.ticker = s.ticker
+            """)
+            keys = [(company_id, day) for company_id, day in cursor.fetchall()]
             cursor.close()
             
-            if results:
-                columns = ['sector', 'sector_sentiment', 'company_count', 'total_articles']
-                df = pd.DataFrame(results, columns=columns)
-                logger.info(f"Retrieved sentiment data for {len(df)} sectors")
-                return df
-            else:
-                logger.warning("No sector sentiment data found")
-                return pd.DataFrame()
+            logger.info(f"Loaded {len(batch_ids)} spooled batch(es): {articles_merged} articles and "
+                        f"{sentiments_merged} sentiment rows merged")
+            return keys
             
         except Exception as e:
-            logger.error(f"Failed to get sector sentiment: {e}")
-            return pd.DataFrame()
+            logger.error(f"Failed to load spooled batches: {e}")
+            return None
     
-    def get_article_count_by_source(self, days: int = 7) -> pd.DataFrame:
-        """Get article count by news source"""
+    def archive_article_content(self, older_than_days: int) -> int:
+        """Unload old article content to Parquet in the archive stage, then drop it from the hot table
+        
+        Only rows whose current content still matches the unloaded hash are
+        cleared, so content changed by a concurrent upsert is never lost.
+        Parquet field names are quoted so they stay lower case for the
+        case-sensitive $1:field reads.
+        """
+        cutoff = datetime.combine(date.today() - timedelta(days=older_than_days), datetime.min.time())
+        archive_path = f"content/{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}/"
+        
         try:
-            query = f"""
-            SELECT 
-                source,
-                COUNT(*) as article_count,
-                COUNT(DISTINCT company_id) as companies_covered
-            FROM NEWS_ARTICLES
-            WHERE scraped_date >= DATEADD(day, -{days}, CURRENT_DATE())
-            GROUP BY source
-            ORDER BY article_count DESC
-            """
-            
             cursor = self.connection.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
+            
+            cursor.execute(f"""
+            COPY INTO @{ARCHIVE_STAGE}/{archive_path}
+            FROM (
+                SELECT article_id AS "article_id", url AS "url", content AS "content",
+                    SHA2(content, 256) AS "content_hash"
+                FROM NEWS_ARTICLES
+                WHERE scraped_date < %s AND content IS NOT NULL
+            )
+            FILE_FORMAT = (TYPE = PARQUET COMPRESSION = SNAPPY)
+            HEADER = TRUE
+            """, (cutoff,))
+            unloaded = sum(row[0] for row in cursor.fetchall())
+            
+            if not unloaded:
+                cursor.close()
+                logger.info(f"No article content older than {older_than_days} days to archive")
+                return 0
+            
+            cursor.execute(f"""
+            UPDATE NEWS_ARTICLES t
+            SET content = NULL, content_hash = a.content_hash, content_archive_path = %s
+            FROM (
+                SELECT $1:article_id::INTEGER AS article_id, $1:content_hash::VARCHAR AS content_hash
+                FROM @{ARCHIVE_STAGE}/{archive_path} (FILE_FORMAT => '{ARCHIVE_FILE_FORMAT}')
+            ) a
+            WHERE t.article_id = a.article_id AND SHA2(t.content, 256) = a.content_hash
+            """, (archive_path,))
+            archived = cursor.rowcount
             cursor.close()
             
-            if results:
-                columns = ['source', 'article_count', 'companies_covered']
-                df = pd.DataFrame(results, columns=columns)
-                logger.info(f"Retrieved article count for {len(df)} sources")
-                return df
-            else:
-                logger.warning("No article count by source data found")
-                return pd.DataFrame()
+            logger.info(f"Archived content of {archived} articles older than {older_than_days} days "
+                        f"to @{ARCHIVE_STAGE}/{archive_path} ({unloaded} rows unloaded)")
+            return archived
             
         except Exception as e:
-            logger.error(f"Failed to get article count by source: {e}")
-            return pd.DataFrame()
+            logger.error(f"Failed to archive article content: {e}")
+            return 0
     
-    def execute_query(self, query: str) -> pd.DataFrame:
-        """Execute a custom query and return results as DataFrame"""
+    def get_article_contents(self, article_ids: List[int]) -> Dict[int, str]:
+        """Article content by id; archived content is read back from the stage"""
+        if not article_ids:
+            return {}
+        
         try:
             cursor = self.connection.cursor()
-            cursor.execute(query)
-            results = cursor.fetchall()
+            placeholders = ", ".join(["%s"] * len(article_ids))
+            cursor.execute(f"""
+            SELECT article_id, content, content_hash, content_archive_path
+            FROM NEWS_ARTICLES
+            WHERE article_id IN ({placeholders})
+            """, list(article_ids))
+            
+            contents: Dict[int, str] = {}
+            archived: Dict[str, Dict[int, str]] = {}
+            for article_id, content, stored_hash, archive_path in cursor.fetchall():
+                if content is not None:
+                    contents[article_id] = content
+                elif archive_path:
+                    archived.setdefault(archive_path, {})[article_id] = stored_hash
+            
+            # One stage scan per archive run that holds requested articles
+            for archive_path, hashes in archived.items():
+                placeholders = ", ".join(["%s"] * len(hashes))
+                cursor.execute(f"""
+                SELECT $1:article_id::INTEGER, $1:content::VARCHAR
+                FROM @{ARCHIVE_STAGE}/{archive_path} (FILE_FORMAT => '{ARCHIVE_FILE_FORMAT}')
+                WHERE $1:article_id::INTEGER IN ({placeholders})
+                """, list(hashes))
+                
+                for article_id, content in cursor.fetchall():
+                    content = self._verified_content(article_id, content, hashes[article_id])
+                    if content is not None:
+                        contents[article_id] = content
+            
             cursor.close()
+            return contents
             
-            if results:
-                # Try to get column names from cursor description
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                df = pd.DataFrame(results, columns=columns)
-                logger.info(f"Executed custom query, returned {len(df)} rows")
-                return df
-            else:
-                logger.warning("No results from custom query")
-                return pd.DataFrame()
+        except Exception as e:
+            logger.error(f"Failed to get article contents: {e}")
+            return {}
+    
+    def get_company(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Get company id, name and sector by ticker from the company cache"""
+        try:
+            return company_cache.get(self.connection, ticker)
             
         except Exception as e:
-            logger.error(f"Failed to execute query: {e}")
-            return pd.DataFrame()
+            logger.error(f"Failed to get company for {ticker}: {e}")
+            return None
+    
+    def refresh_company_cache(self) -> int:
+        """Reload the company cache with one query"""
+        try:
+            return company_cache.refresh(self.connection)
+        except Exception as e:
+            logger.error(f"Failed to refresh company cache: {e}")
+            return 0
+    
+    def _fetch_dataframe(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """Run a query, building SELECT results directly from Arrow result batches
+        
+        Other statements (DML, DDL, SHOW) keep the row-tuple fetch: their
+        results are not Arrow. The cursor rowcount is kept in df.attrs.
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, params)
+            if ARROW_RESULT_PATTERN.match(query):
+                df = cursor.fetch_pandas_all()
+            else:
+                columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                df = pd.DataFrame(cursor.fetchall() if columns else [], columns=columns)
+            df.attrs['rowcount'] = cursor.rowcount
+        finally:
+            cursor.close()
+        
+        # Unquoted Snowflake identifiers come back upper-case
+        df.columns = [column.lower() for column in df.columns]
+        return df
+    
+    def iter_query_batches(self, query: str, params: Optional[tuple] = None) -> Iterator[pd.DataFrame]:
+        """Stream a large result as DataFrames, one per Arrow result batch"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, params)
+            for batch in cursor.fetch_pandas_batches():
+                batch.columns = [column.lower() for column in batch.columns]
+                yield batch
+        finally:
+            cursor.close()
+    
+    def iter_arrow_batches(self, query: str, params: Optional[tuple] = None) -> Iterator[Any]:
+        """Stream a large result as pyarrow Tables without converting to pandas"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(query, params)
+            for table in cursor.fetch_arrow_batches():
+                yield table
+        finally:
+            cursor.close()
     
-    def __enter__(self):
-        """Context manager entry"""
-        self.connect()
-        return self
+    def explain_partitions(self, query: str, params: Optional[tuple] = None) -> Dict[str, Any]:
+        """Compile-time pruning stats for a query from EXPLAIN USING JSON"""
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN USING JSON {query}", params)
+            plan = json.loads(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+        
+        stats = plan.get('GlobalStats', {})
+        assigned = int(stats.get('partitionsAssigned', 0))
+        total = int(stats.get('partitionsTotal', 0))
+        return {
+            'partitions_assigned': assigned,
+            'partitions_total': total,
+            'bytes_assigned': int(stats.get('bytesAssigned', 0)),
+            'scan_ratio': assigned / total if total else 0.0
+        }
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        self.disconnect() 
\ No newline at end of file
+    def execute_queries_async(self, queries: Dict[str, Union[str, Tuple[str, Optional[tuple]]]],
+                              poll_interval: float = 0.05, timeout: float = 300.0) -> Dict[str, pd.DataFrame]:
+        """Run independent queries concurrently and return a DataFrame per name
+        
+        Every query is submitted with execute_async on the held connection, so
+        the warehouse runs them in parallel and total time approaches the
+        slowest query. Results are polled by query id; failed or timed-out
+        queries come back as empty DataFrames.
+        """
+        results: Dict[str, pd.DataFrame] = {}
+        pending: Dict[str, str] = {}
+        submitted: Dict[str, float] = {}
+        
+        cursor = self.connection.cursor()
+        try:
+            for name, query in queries.items():
+                sql, params = query if isinstance(query, tuple) else (query, None)
+                try:
+                    submitted[name] = time.perf_counter()
+                    cursor.execute_async(sql, params)
+                    pending[name] = cursor.sfqid
+                except Exception as e:
+                    logger.error(f"Failed to submit async query '{name}': {e}")
+                    results[name] = pd.DataFrame()
+        finally:
+            cursor.close()
+        
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        
+        while pending:
+            for name, query_id in list(pending.items()):
+                try:
+                    status = self.connection.get_query_status_throw_if_error(query_id)
+                    if self.connection.is_still_running(status):
+                        continue
+                    
+                    result_cursor = self.connection.cursor()
+                    try:
+                        result_cursor.get_results_from_sfqid(query_id)
+                        df = result_cursor.fetch_pandas_all()
+                    finally:
+                        result_cursor.close()
+                    
+                    df.columns = [column.lower() for column in df.columns]
+                    results[name] = df
+                    
+                    # Submit-to-fetch latency, including time spent waiting on this poll loop
+                    sql = queries[name][0] if isinstance(queries[name], tuple) else queries[name]
+                    query_instrumentation.record(sql, time.perf_counter() - submitted[name], rows=len(df),
+                                                 query_id=query_id, caller=f"execute_queries_async:{name}")
+                    
+                except Exception as e:
+                    logger.error(f"Async query '{name}' failed: {e}")
+                    results[name] = pd.DataFrame()
+                
+                del pending[name]
+            
+            if not pending:
+                break
+            
+            if time.monotonic() > deadline:
+                for name, query_id in pending.items():
+                    logger.error(f"Async query '{name}' timed out after {timeout}s; cancelling {query_id}")
+                    self._cancel_query(query_id)
+                    results[name] = pd.DataFrame()
+                break
+            
+            # Back off gently so long-running queries are not polled in a tight loop
+            time.sleep(interval)
+            interval = min(interval * 2, 1.0)
+        
+        return {name: results.get(name, pd.DataFrame()) for name in queries}
+    
+    def _cancel_query(self, query_id: str):
+        """Best-effort cancel of a running query"""
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("SELECT SYSTEM$CANCEL_QUERY(%s)", (query_id,))
+            cursor.close()
+        except Exception as e:
+            logger.warning(f"Failed to cancel query {query_id}: {e}")
+    
+    def get_dashboard_data(self, days: int = 7, top_limit: int = 10,
+                           granularity: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Load every dashboard dataset concurrently"""
+        start = time.perf_counter()
+        
+        results = self.execute_queries_async({
+            'daily_data': self.daily_sentiment_query(days, granularity or choose_granularity(days)),
+            'top_companies': self.top_companies_query(days, top_limit),
+            'sector_data': self.sector_sentiment_query(days),
+            'source_data': self.article_count_by_source_query(days)
+        })
+        
+        logger.info(f"Loaded dashboard data ({', '.join(f'{name}: {len(df)} rows' for name, df in results.items())}) "
+                    f"in {time.perf_counter() - start:.2f}s")
+        return results
@@ -0,0 +1,125 @@
+"""
+Parquet Write-Ahead Spool
+Scored batches are written to local compressed Parquet before loading into storage
+"""
+
+import os
+import json
+import glob
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+import pandas as pd
+from loguru import logger
+
+from src.models.news_article import NewsArticleWithSentiment
+
+DEFAULT_SPOOL_DIR = os.getenv('SPOOL_DIR', 'data/spool')
+
+SPOOL_KINDS = ('articles', 'sentiment')
+
+SPOOL_SENTIMENT_COLUMNS = [
+    'batch_id', 'batch_row', 'url', 'engine', 'sentiment_score', 'sentiment_label', 'confidence_score', 'keywords'
+]
+
+class ParquetSpool:
+    """Directory of batch files awaiting load, one articles and one sentiment file per batch
+
+    Rows carry the ticker and url instead of database ids, so batches can be
+    written while storage is unavailable and resolved when they are loaded.
+    """
+
+    def __init__(self, spool_dir: str = DEFAULT_SPOOL_DIR, compression: str = 'zstd'):
+        """Initialize the spool, creating its directory"""
+        self.spool_dir = spool_dir
+        self.compression = compression
+        os.makedirs(spool_dir, exist_ok=True)
+
+    def batch_paths(self, batch_id: str) -> Dict[str, str]:
+        """Parquet file per kind for a batch"""
+        return {kind: os.path.join(self.spool_dir, f"{batch_id}.{kind}.parquet") for kind in SPOOL_KINDS}
+
+    def write_batch(self, articles_with_sentiment: List[NewsArticleWithSentiment]) -> Optional[str]:
+        """Spool a scored batch; returns its batch id (None if nothing was written)"""
+        batch_id = f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}-{os.getpid()}"
+
+        article_rows, sentiment_rows = [], []
+        for item in articles_with_sentiment:
+            article = item.article
+            if not article.url or not article.ticker:
+                continue
+
+            article_rows.append({
+                'batch_id': batch_id,
+                'batch_row': len(article_rows),
+                'ticker': article.ticker.upper(),
+                'title': article.title,
+                'content': article.content,
+                'url': article.url,
+                'source': article.source,
+                'published_date': article.published_date,
+                'scraped_date': article.scraped_date
+            })
+
+            for sentiment in item.sentiment_analyses:
+                sentiment_rows.append({
+                    'batch_id': batch_id,
+                    'batch_row': len(sentiment_rows),
+                    'url': article.url,
+                    'engine': sentiment.engine.value,
+                    'sentiment_score': sentiment.sentiment_score,
+                    'sentiment_label': sentiment.sentiment_label.value,
+                    'confidence_score': sentiment.confidence_score,
+                    'keywords': json.dumps(sentiment.keywords) if sentiment.keywords else None
+                })
+
+        if not article_rows:
+            logger.warning("Nothing to spool: no articles with a URL and ticker")
+            return None
+
+        paths = self.batch_paths(batch_id)
+        frames = {
+            'articles': pd.DataFrame(article_rows),
+            'sentiment': pd.DataFrame(sentiment_rows, columns=SPOOL_SENTIMENT_COLUMNS)
+        }
+
+        # Sentiment first: a batch only counts as pending once its articles file exists
+        for kind in ('sentiment', 'articles'):
+            temp_path = paths[kind] + '.tmp'
+            # Microsecond timestamps load cleanly into TIMESTAMP_NTZ
+            frames[kind].to_parquet(temp_path, compression=self.compression, index=False,
+                                    coerce_timestamps='us', allow_truncated_timestamps=True)
+            os.replace(temp_path, paths[kind])
+
+        logger.info(f"Spooled batch {batch_id}: {len(article_rows)} articles, {len(sentiment_rows)} sentiment rows")
+        return batch_id
+
+    def pending_batches(self) -> List[str]:
+        """Batch ids waiting to be loaded, oldest first"""
+        suffix = '.articles.parquet'
+        return sorted(
+            os.path.basename(path)[:-len(suffix)]
+            for path in glob.glob(os.path.join(self.spool_dir, f"*{suffix}"))
+        )
+
+    def read_batch(self, batch_id: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Articles and sentiment DataFrames for a batch"""
+        paths = self.batch_paths(batch_id)
+        articles = pd.read_parquet(paths['articles'])
+        sentiment = pd.read_parquet(paths['sentiment']) if os.path.exists(paths['sentiment']) else pd.DataFrame()
+        return articles, sentiment
+
+    def mark_loaded(self, batch_ids: List[str]):
+        """Delete the files of batches that reached storage"""
+        for batch_id in batch_ids:
+            # Articles file first: once it is gone the batch is no longer pending
+            for kind in ('articles', 'sentiment'):
+                path = self.batch_paths(batch_id)[kind]
+                if os.path.exists(path):
+                    os.remove(path)
+
+        logger.info(f"Removed {len(batch_ids)} loaded batch(es) from the spool")
+
+    @staticmethod
+    def records(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """DataFrame rows as dicts with nulls as None"""
+        return df.astype(object).where(df.notna(), None).to_dict('records')
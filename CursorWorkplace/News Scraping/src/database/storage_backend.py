@@ -0,0 +1,668 @@
+"""
+Storage Backend
+Interface shared by the Snowflake warehouse and the embedded local database
+"""
+
+import os
+import json
+import hashlib
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, date, timedelta
+import pandas as pd
+from loguru import logger
+
+from src.models.news_article import (
+    NewsArticle,
+    SentimentAnalysis,
+    DailySentimentSummary,
+    SentimentEngine,
+    SentimentLabel
+)
+from src.database.rollup import ROLLUP_ALL_SOURCES, choose_granularity, window_filter, series_filter
+
+PIPELINE_RUN_COLUMNS = [
+    'run_id', 'started_at', 'finished_at', 'status', 'mode', 'resumed', 'failed_stage', 'duration_seconds',
+    'articles_scraped', 'articles_scored', 'articles_stored', 'summaries_refreshed', 'error_count',
+    'articles_per_second', 'peak_rss_mb', 'peak_worker_rss_mb', 'stages', 'error_message'
+]
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest of article content (matches Snowflake SHA2(content, 256))"""
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+class StorageBackend(ABC):
+    """Tables, views and operations every storage backend provides
+
+    Backends own COMPANIES, NEWS_ARTICLES, SENTIMENT_ANALYSIS,
+    DAILY_SENTIMENT_SUMMARY, DAILY_SUMMARY_VIEW and SENTIMENT_ROLLUP with
+    the same columns, so the pipeline, dashboard and scripts run unchanged
+    on either. Dashboard reads are served from the rollup cube.
+    """
+
+    # Bind parameter placeholder for the backend's driver
+    placeholder = '%s'
+
+    # Bind expression for a JSON document column
+    json_placeholder = '%s'
+
+    def __init__(self):
+        """Initialize shared session state"""
+        self.connection = None
+        self._session_depth = 0
+
+    @abstractmethod
+    def connect(self) -> bool:
+        """Open (or check out) a connection; no-op if one is already held"""
+
+    @abstractmethod
+    def disconnect(self):
+        """Close (or return) the held connection"""
+
+    @abstractmethod
+    def setup_database(self) -> bool:
+        """Create or migrate tables and views"""
+
+    @abstractmethod
+    def insert_companies(self, companies: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert missing companies; returns ticker -> company_id for every input company"""
+
+    @abstractmethod
+    def get_company(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Company id, name and sector by ticker"""
+
+    @abstractmethod
+    def upsert_news_articles(self, articles: List[NewsArticle]) -> List[Optional[int]]:
+        """Idempotently upsert articles on url; returns ids aligned with the input"""
+
+    @abstractmethod
+    def upsert_sentiment_analyses(self, sentiments: List[SentimentAnalysis]) -> List[Optional[int]]:
+        """Idempotently upsert sentiment results on (article_id, engine); returns aligned ids"""
+
+    @abstractmethod
+    def upsert_daily_summaries(self, summaries: List[DailySentimentSummary]) -> List[Optional[int]]:
+        """Idempotently upsert daily summaries on (company_id, date); returns aligned ids"""
+
+    @abstractmethod
+    def refresh_daily_summaries(self, keys: List[Tuple[int, date]]) -> int:
+        """Recompute DAILY_SENTIMENT_SUMMARY for the given (company_id, date) keys only"""
+
+    @abstractmethod
+    def archive_article_content(self, older_than_days: int) -> int:
+        """Move content of articles scraped more than N days ago to compressed Parquet
+
+        The hot row keeps its metadata plus content_hash and
+        content_archive_path; returns the number of articles archived.
+        """
+
+    @abstractmethod
+    def get_article_contents(self, article_ids: List[int]) -> Dict[int, str]:
+        """Article content by id, reading archived content back on demand"""
+
+    @abstractmethod
+    def _fetch_dataframe(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """Run a query and return a DataFrame with lower-case column names"""
+
+    @abstractmethod
+    def refresh_rollups(self, keys: List[Tuple[int, date]]) -> int:
+        """Rebuild SENTIMENT_ROLLUP cells holding the given (company_id, date) keys at every granularity"""
+
+    @staticmethod
+    def daily_sentiment_query(days: int = 7, granularity: str = 'day') -> str:
+        """SQL behind get_daily_sentiment_data (one row per company and bucket)"""
+        bucket = "r.bucket_start" if granularity == 'hour' else "CAST(r.bucket_start AS DATE)"
+        return f"""
+            SELECT
+                c.name AS company_name,
+                c.ticker,
+                c.sector,
+                {bucket} AS date,
+                r.sentiment_sum / r.sentiment_count AS avg_sentiment_score,
+                CASE
+                    WHEN r.sentiment_sum / r.sentiment_count > 0.1 THEN 'positive'
+                    WHEN r.sentiment_sum / r.sentiment_count < -0.1 THEN 'negative'
+                    ELSE 'neutral'
+                END AS sentiment_label,
+                r.scored_article_count AS article_count,
+                r.positive_count,
+                r.negative_count,
+                r.neutral_count
+            FROM SENTIMENT_ROLLUP r
+            JOIN COMPANIES c ON c.company_id = r.company_id
+            WHERE {series_filter(days, granularity)}
+                AND r.source = '{ROLLUP_ALL_SOURCES}'
+                AND r.sentiment_count > 0
+            ORDER BY date DESC, avg_sentiment_score DESC
+            """
+
+    @staticmethod
+    def top_companies_query(days: int = 30, limit: int = 10) -> str:
+        """SQL behind get_top_companies_by_sentiment (average of daily averages, as over DAILY_SUMMARY_VIEW)"""
+        return f"""
+            SELECT
+                c.name AS company_name,
+                c.ticker,
+                c.sector,
+                SUM(r.daily_avg_sum) / SUM(r.scored_days) as avg_sentiment,
+                SUM(r.scored_days) as days_analyzed,
+                SUM(r.scored_article_count) as total_articles
+            FROM SENTIMENT_ROLLUP r
+            JOIN COMPANIES c ON c.company_id = r.company_id
+            WHERE {window_filter(days)}
+                AND r.source = '{ROLLUP_ALL_SOURCES}'
+            GROUP BY c.name, c.ticker, c.sector
+            HAVING SUM(r.scored_days) >= 5
+            ORDER BY avg_sentiment DESC
+            LIMIT {int(limit)}
+            """
+
+    @staticmethod
+    def sector_sentiment_query(days: int = 7) -> str:
+        """SQL behind get_sector_sentiment"""
+        return f"""
+            SELECT
+                c.sector,
+                SUM(r.daily_avg_sum) / SUM(r.scored_days) as sector_sentiment,
+                COUNT(DISTINCT CASE WHEN r.scored_days > 0 THEN r.company_id END) as company_count,
+                SUM(r.scored_article_count) as total_articles
+            FROM SENTIMENT_ROLLUP r
+            JOIN COMPANIES c ON c.company_id = r.company_id
+            WHERE {window_filter(days)}
+                AND r.source = '{ROLLUP_ALL_SOURCES}'
+            GROUP BY c.sector
+            HAVING SUM(r.scored_days) > 0
+            ORDER BY sector_sentiment DESC
+            """
+
+    @staticmethod
+    def article_count_by_source_query(days: int = 7) -> str:
+        """SQL behind get_article_count_by_source
+
+        Counts come from the rollup cube, so they cover articles matched to a
+        company and bucket them by publication date (scrape date when
+        unpublished), like the summaries, rather than by scrape date.
+        """
+        return f"""
+            SELECT
+                r.source,
+                SUM(r.article_count) as article_count,
+                COUNT(DISTINCT r.company_id) as companies_covered
+            FROM SENTIMENT_ROLLUP r
+            WHERE {window_filter(days)}
+                AND r.source <> '{ROLLUP_ALL_SOURCES}'
+            GROUP BY r.source
+            ORDER BY article_count DESC
+            """
+
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Connection pool counters (empty for unpooled backends)"""
+        return {}
+
+    def get_company_id(self, ticker: str) -> Optional[int]:
+        """Get company ID by ticker symbol"""
+        company = self.get_company(ticker)
+        return company['company_id'] if company else None
+
+    def get_article_content(self, article_id: int) -> Optional[str]:
+        """Content of one article, hot or archived"""
+        return self.get_article_contents([article_id]).get(article_id)
+
+    @staticmethod
+    def _verified_content(article_id: int, content: Optional[str], expected_hash: Optional[str]) -> Optional[str]:
+        """Archived content, or None if it does not match the hash kept in the hot table"""
+        if content is None or (expected_hash and content_hash(content) != expected_hash):
+            logger.warning(f"Archived content for article {article_id} is missing or fails its hash check")
+            return None
+        return content
+
+    @staticmethod
+    def day_bounds(day: date) -> Tuple[datetime, datetime]:
+        """Half-open [start, end) timestamp range for a calendar day
+
+        Compare raw columns against these bounds instead of wrapping them in
+        DATE(), which defeats micro-partition pruning.
+        """
+        start = datetime.combine(day, datetime.min.time())
+        return start, start + timedelta(days=1)
+
+    @staticmethod
+    def _article_row(article: NewsArticle) -> Optional[Dict[str, Any]]:
+        """NEWS_ARTICLES row for an article (None without a URL, the natural key)"""
+        if not article.url:
+            return None
+        return {
+            'company_id': article.company_id,
+            'title': article.title,
+            'content': article.content,
+            'url': article.url,
+            'source': article.source,
+            'published_date': article.published_date,
+            'scraped_date': article.scraped_date
+        }
+
+    @staticmethod
+    def _sentiment_row(sentiment: SentimentAnalysis) -> Optional[Dict[str, Any]]:
+        """SENTIMENT_ANALYSIS row for a result (None without an article id)"""
+        if not sentiment.article_id:
+            return None
+        return {
+            'article_id': sentiment.article_id,
+            'company_id': sentiment.company_id,
+            'engine': sentiment.engine.value,
+            'sentiment_score': sentiment.sentiment_score,
+            'sentiment_label': sentiment.sentiment_label.value,
+            'confidence_score': sentiment.confidence_score,
+            'keywords': json.dumps(sentiment.keywords) if sentiment.keywords else None
+        }
+
+    @staticmethod
+    def _summary_row(summary: DailySentimentSummary) -> Dict[str, Any]:
+        """DAILY_SENTIMENT_SUMMARY row for a summary"""
+        return {
+            'company_id': summary.company_id,
+            'date': summary.date.date(),
+            'avg_sentiment_score': summary.avg_sentiment_score,
+            'sentiment_label': summary.sentiment_label.value,
+            'article_count': summary.article_count,
+            'positive_count': summary.positive_count,
+            'negative_count': summary.negative_count,
+            'neutral_count': summary.neutral_count
+        }
+
+    def load_spooled_batches(self, spool, batch_ids: List[str]) -> Optional[List[Tuple[int, date]]]:
+        """Load spooled batches through the upsert methods
+
+        Returns the (company_id, date) summary keys touched, or None if the
+        load failed and the batches should stay spooled.
+        """
+        try:
+            keys = set()
+            for batch_id in batch_ids:
+                articles_df, sentiment_df = spool.read_batch(batch_id)
+
+                articles = []
+                for row in spool.records(articles_df):
+                    company_id = self.get_company_id(row['ticker'])
+                    if not company_id:
+                        logger.warning(f"Company not found: {row['ticker']}")
+                        continue
+
+                    articles.append(NewsArticle(
+                        title=row['title'], content=row['content'], url=row['url'], source=row['source'],
+                        published_date=row['published_date'], scraped_date=row['scraped_date'],
+                        company_id=company_id, ticker=row['ticker']
+                    ))
+
+                article_ids = self.upsert_news_articles(articles)
+                if articles and not any(article_ids):
+                    return None
+
+                stored = {}
+                for article, article_id in zip(articles, article_ids):
+                    if article_id:
+                        stored[article.url] = (article_id, article.company_id)
+                        keys.add((article.company_id, (article.published_date or article.scraped_date).date()))
+
+                sentiments = [
+                    SentimentAnalysis(
+                        engine=SentimentEngine(row['engine']),
+                        sentiment_score=row['sentiment_score'],
+                        sentiment_label=SentimentLabel(row['sentiment_label']),
+                        confidence_score=row['confidence_score'],
+                        keywords=json.loads(row['keywords']) if row['keywords'] else None,
+                        article_id=stored[row['url']][0],
+                        company_id=stored[row['url']][1]
+                    )
+                    for row in spool.records(sentiment_df) if row['url'] in stored
+                ]
+
+                sentiment_ids = self.upsert_sentiment_analyses(sentiments)
+                if sentiments and not any(sentiment_ids):
+                    return None
+
+            logger.info(f"Loaded {len(batch_ids)} spooled batch(es) touching {len(keys)} summaries")
+            return sorted(keys)
+
+        except Exception as e:
+            logger.error(f"Failed to load spooled batches: {e}")
+            return None
+
+    def get_daily_counts(self, day: date) -> Dict[str, int]:
+        """Articles, sentiment analyses and summaries written on a day"""
+        day_start, day_end = self.day_bounds(day)
+        p = self.placeholder
+
+        df = self._fetch_dataframe(f"""
+            SELECT
+                (SELECT COUNT(*) FROM NEWS_ARTICLES WHERE created_at >= {p} AND created_at < {p}) AS articles,
+                (SELECT COUNT(*) FROM SENTIMENT_ANALYSIS WHERE created_at >= {p} AND created_at < {p}) AS sentiments,
+                (SELECT COUNT(*) FROM DAILY_SENTIMENT_SUMMARY WHERE date = {p}) AS summaries
+            """, (day_start, day_end, day_start, day_end, day))
+
+        return {column: int(df[column].iloc[0]) for column in df.columns}
+
+    def get_articles_after(self, after_id: int, limit: int, since: Optional[date] = None,
+                           until: Optional[date] = None) -> pd.DataFrame:
+        """Next page of articles by ascending article_id (keyset pagination)
+
+        Each page seeks past the previous page's last id instead of using
+        OFFSET, so every page costs the same however deep the scan goes.
+        since/until filter on scrape date as a half-open day range.
+        """
+        p = self.placeholder
+        conditions, params = [f"na.article_id > {p}"], [after_id]
+        if since:
+            conditions.append(f"na.scraped_date >= {p}")
+            params.append(self.day_bounds(since)[0])
+        if until:
+            conditions.append(f"na.scraped_date < {p}")
+            params.append(self.day_bounds(until)[1])
+
+        df = self._fetch_dataframe(f"""
+            SELECT
+                na.article_id,
+                na.company_id,
+                c.ticker,
+                na.title,
+                na.content,
+                na.content_archive_path,
+                na.published_date,
+                na.scraped_date
+            FROM NEWS_ARTICLES na
+            LEFT JOIN COMPANIES c ON na.company_id = c.company_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY na.article_id
+            LIMIT {int(limit)}
+            """, tuple(params))
+
+        # Content past the retention window is read back from the archive
+        if not df.empty:
+            archived = df[df['content'].isna() & df['content_archive_path'].notna()]['article_id'].tolist()
+            if archived:
+                contents = self.get_article_contents([int(article_id) for article_id in archived])
+                df['content'] = [
+                    contents.get(int(article_id), content)
+                    for article_id, content in zip(df['article_id'], df['content'])
+                ]
+
+        return df
+
+    def get_rollup_keys(self, since: Optional[date] = None, until: Optional[date] = None) -> List[Tuple[int, date]]:
+        """Every (company_id, date) with articles, for rebuilding the rollup cube from scratch"""
+        p = self.placeholder
+        day = "CAST(COALESCE(published_date, scraped_date) AS DATE)"
+        conditions, params = ["company_id IS NOT NULL"], []
+        if since or until:
+            # Raw timestamps against [start, end) bounds, so the filter can prune partitions
+            bounds, bound_params = [], []
+            if since:
+                bounds.append(f"{{column}} >= {p}")
+                bound_params.append(self.day_bounds(since)[0])
+            if until:
+                bounds.append(f"{{column}} < {p}")
+                bound_params.append(self.day_bounds(until)[1])
+            published = ' AND '.join(bounds).format(column='published_date')
+            scraped = ' AND '.join(bounds).format(column='scraped_date')
+            conditions.append(f"(({published}) OR (published_date IS NULL AND {scraped}))")
+            params.extend(bound_params * 2)
+
+        df = self._fetch_dataframe(f"""
+            SELECT DISTINCT company_id, {day} AS date
+            FROM NEWS_ARTICLES
+            WHERE {' AND '.join(conditions)}
+            """, tuple(params) or None)
+
+        return [(int(company_id), pd.Timestamp(day).date()) for company_id, day in zip(df['company_id'], df['date'])]
+
+    def record_pipeline_run(self, run: Dict[str, Any]) -> bool:
+        """Insert a PIPELINE_RUNS row (one per run attempt)"""
+        try:
+            values = [json.dumps(run[column], default=str) if column == 'stages' else run.get(column)
+                      for column in PIPELINE_RUN_COLUMNS]
+            expressions = [self.json_placeholder if column == 'stages' else self.placeholder
+                           for column in PIPELINE_RUN_COLUMNS]
+
+            cursor = self.connection.cursor()
+            # INSERT ... SELECT so the JSON column can be parsed on the way in
+            cursor.execute(
+                f"INSERT INTO PIPELINE_RUNS ({', '.join(PIPELINE_RUN_COLUMNS)}) SELECT {', '.join(expressions)}",
+                tuple(values)
+            )
+            cursor.close()
+
+            logger.info(f"Recorded pipeline run {run['run_id']} ({run['status']})")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to record pipeline run: {e}")
+            return False
+
+    def get_pipeline_runs(self, limit: int = 20, since: Optional[datetime] = None) -> pd.DataFrame:
+        """Most recent PIPELINE_RUNS rows, newest first"""
+        try:
+            p = self.placeholder
+            where = f"WHERE started_at >= {p}" if since else ""
+            return self._fetch_dataframe(f"""
+                SELECT {', '.join(PIPELINE_RUN_COLUMNS)}
+                FROM PIPELINE_RUNS
+                {where}
+                ORDER BY started_at DESC
+                LIMIT {int(limit)}
+                """, (since,) if since else None)
+
+        except Exception as e:
+            logger.error(f"Failed to get pipeline runs: {e}")
+            return pd.DataFrame()
+
+    @abstractmethod
+    def ensure_feed_partitions(self, partition_keys: List[str]) -> bool:
+        """Add FEED_LEASES rows for partitions that have none (safe to race with other workers)"""
+
+    def claim_feed_leases(self, worker_id: str, claim_id: str, now: datetime, expires_at: datetime,
+                          due_before: datetime, limit: int) -> List[Tuple[str, Optional[str]]]:
+        """Claim up to limit free or expired partitions last completed before due_before
+
+        The claim is a single compare-and-set UPDATE; the partitions that
+        ended up tagged with claim_id are the ones this worker holds.
+        Returns (partition_key, previous_worker_id) pairs, where a previous
+        worker means the lease was stolen after it expired.
+        """
+        p = self.placeholder
+        claimable = f"(worker_id IS NULL OR lease_expires_at < {p}) AND (last_completed_at IS NULL OR last_completed_at < {p})"
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"""
+                UPDATE FEED_LEASES
+                SET previous_worker_id = worker_id,
+                    worker_id = {p},
+                    claim_id = {p},
+                    claimed_at = {p},
+                    renewed_at = {p},
+                    lease_expires_at = {p},
+                    claim_count = COALESCE(claim_count, 0) + 1
+                WHERE partition_key IN (
+                    SELECT partition_key
+                    FROM FEED_LEASES
+                    WHERE {claimable}
+                    ORDER BY last_completed_at NULLS FIRST, partition_key
+                    LIMIT {int(limit)}
+                )
+                AND {claimable}
+                """, (worker_id, claim_id, now, now, expires_at, now, due_before, now, due_before))
+            cursor.close()
+
+            df = self._fetch_dataframe(
+                f"SELECT partition_key, previous_worker_id FROM FEED_LEASES WHERE claim_id = {p}", (claim_id,)
+            )
+            return [(key, previous if isinstance(previous, str) else None)
+                    for key, previous in zip(df['partition_key'], df['previous_worker_id'])]
+
+        except Exception as e:
+            logger.error(f"Failed to claim feed leases: {e}")
+            return []
+
+    def renew_feed_leases(self, claim_id: str, now: datetime, expires_at: datetime) -> Optional[List[str]]:
+        """Extend the leases of a claim; returns the partitions still held (None when the database is unreachable)"""
+        p = self.placeholder
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(
+                f"UPDATE FEED_LEASES SET renewed_at = {p}, lease_expires_at = {p} WHERE claim_id = {p}",
+                (now, expires_at, claim_id)
+            )
+            cursor.close()
+
+            df = self._fetch_dataframe(f"SELECT partition_key FROM FEED_LEASES WHERE claim_id = {p}", (claim_id,))
+            return df['partition_key'].tolist()
+
+        except Exception as e:
+            logger.error(f"Failed to renew feed leases: {e}")
+            return None
+
+    def finish_feed_leases(self, claim_id: str, partition_keys: List[str], worker_id: str,
+                           completed_at: Optional[datetime] = None) -> bool:
+        """Give up held partitions, marking them completed at completed_at (or just releasing them)"""
+        if not partition_keys:
+            return True
+
+        p = self.placeholder
+        completion = (f", last_completed_at = {p}, last_completed_by = {p}" if completed_at else "")
+        params = ((completed_at, worker_id) if completed_at else ()) + (claim_id,) + tuple(partition_keys)
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute(f"""
+                UPDATE FEED_LEASES
+                SET worker_id = NULL, claim_id = NULL, lease_expires_at = NULL{completion}
+                WHERE claim_id = {p} AND partition_key IN ({', '.join([p] * len(partition_keys))})
+                """, params)
+            cursor.close()
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to finish feed leases: {e}")
+            return False
+
+    def get_feed_leases(self) -> pd.DataFrame:
+        """Every feed partition with its current holder and last completion"""
+        try:
+            return self._fetch_dataframe("""
+                SELECT partition_key, worker_id, lease_expires_at, claimed_at, renewed_at,
+                       claim_count, last_completed_at, last_completed_by
+                FROM FEED_LEASES
+                ORDER BY partition_key
+                """)
+
+        except Exception as e:
+            logger.error(f"Failed to get feed leases: {e}")
+            return pd.DataFrame()
+
+    def get_daily_sentiment_data(self, days: int = 7, granularity: str = 'day') -> pd.DataFrame:
+        """Get sentiment per company and day (or hour/week/month bucket) for the last N days"""
+        try:
+            df = self._fetch_dataframe(self.daily_sentiment_query(days, granularity))
+
+            if not df.empty:
+                logger.info(f"Retrieved {len(df)} daily sentiment records")
+            else:
+                logger.warning("No daily sentiment data found")
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to get daily sentiment data: {e}")
+            return pd.DataFrame()
+
+    def get_top_companies_by_sentiment(self, days: int = 30, limit: int = 10) -> pd.DataFrame:
+        """Get top companies by average sentiment"""
+        try:
+            df = self._fetch_dataframe(self.top_companies_query(days, limit))
+
+            if not df.empty:
+                logger.info(f"Retrieved top {len(df)} companies by sentiment")
+            else:
+                logger.warning("No top companies data found")
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to get top companies: {e}")
+            return pd.DataFrame()
+
+    def get_sector_sentiment(self, days: int = 7) -> pd.DataFrame:
+        """Get sentiment analysis by sector"""
+        try:
+            df = self._fetch_dataframe(self.sector_sentiment_query(days))
+
+            if not df.empty:
+                logger.info(f"Retrieved sentiment data for {len(df)} sectors")
+            else:
+                logger.warning("No sector sentiment data found")
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to get sector sentiment: {e}")
+            return pd.DataFrame()
+
+    def get_article_count_by_source(self, days: int = 7) -> pd.DataFrame:
+        """Get article count by news source"""
+        try:
+            df = self._fetch_dataframe(self.article_count_by_source_query(days))
+
+            if not df.empty:
+                logger.info(f"Retrieved article count for {len(df)} sources")
+            else:
+                logger.warning("No article count by source data found")
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to get article count by source: {e}")
+            return pd.DataFrame()
+
+    def get_dashboard_data(self, days: int = 7, top_limit: int = 10,
+                           granularity: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Load every dashboard dataset; the trend granularity defaults to one suited to the window"""
+        return {
+            'daily_data': self.get_daily_sentiment_data(days, granularity or choose_granularity(days)),
+            'top_companies': self.get_top_companies_by_sentiment(days, top_limit),
+            'sector_data': self.get_sector_sentiment(days),
+            'source_data': self.get_article_count_by_source(days)
+        }
+
+    def execute_query(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """Execute a custom query and return results as DataFrame"""
+        try:
+            df = self._fetch_dataframe(query, params)
+
+            if not df.empty:
+                logger.info(f"Executed custom query, returned {len(df)} rows")
+            else:
+                logger.warning("No results from custom query")
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to execute query: {e}")
+            return pd.DataFrame()
+
+    def __enter__(self):
+        """Context manager entry"""
+        self._session_depth += 1
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; nested blocks keep the connection until the outermost exits"""
+        self._session_depth = max(0, self._session_depth - 1)
+        if self._session_depth == 0:
+            self.disconnect()
+
+def get_storage_backend(kind: Optional[str] = None) -> StorageBackend:
+    """Backend selected by STORAGE_BACKEND (snowflake, duckdb)"""
+    kind = (kind or os.getenv('STORAGE_BACKEND', 'snowflake')).lower()
+
+    # Imported lazily so each backend only needs its own driver installed
+    if kind == 'snowflake':
+        from src.database.snowflake_manager import SnowflakeManager
+        return SnowflakeManager()
+    if kind == 'duckdb':
+        from src.database.duckdb_manager import DuckDBManager
+        return DuckDBManager()
+
+    raise ValueError(f"Unknown STORAGE_BACKEND '{kind}' (expected snowflake or duckdb)")
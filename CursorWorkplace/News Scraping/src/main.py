@@ -5,8 +5,10 @@ Orchestrates the entire news sentiment analysis process
 
 import os
 import sys
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+import time
+import argparse
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
 from dotenv import load_dotenv
 from loguru import logger
 
@@ -15,14 +17,13 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.scrapers.rss_scraper import RSSScraper
 from src.sentiment.sentiment_analyzer import SentimentAnalyzer
-from src.database.snowflake_manager import SnowflakeManager
-from src.models.news_article import (
-    NewsArticle, 
-    SentimentAnalysis, 
-    NewsArticleWithSentiment,
-    DailySentimentSummary,
-    SentimentLabel
-)
+from src.database.storage_backend import get_storage_backend
+from src.database.spool import ParquetSpool
+from src.database.query_instrumentation import query_instrumentation
+from src.pipeline.executor import ConcurrentPipeline, score_articles
+from src.pipeline.checkpoint import RunCheckpoint, article_key
+from src.pipeline.run_history import PipelineRunRecorder
+from src.models.news_article import NewsArticle, NewsArticleWithSentiment
 from config.companies import FORTUNE_100_COMPANIES
 
 # Load environment variables
@@ -35,7 +36,33 @@ class NewsSentimentScraper:
         """Initialize the scraper"""
         self.rss_scraper = RSSScraper()
         self.sentiment_analyzer = SentimentAnalyzer()
-        self.db_manager = SnowflakeManager()
+        self.db_manager = get_storage_backend()
+        self.target_company_sentences = os.getenv('SENTIMENT_TARGET_COMPANY', 'false').lower() == 'true'
+        
+        # (company_id, article date) keys written since the last summary refresh
+        self.touched_summary_keys: Set[Tuple[int, Any]] = set()
+        
+        # Write-ahead spool so scored batches survive a slow or unavailable database
+        self.spool = ParquetSpool()
+        self.spool_load_retries = int(os.getenv('SPOOL_LOAD_RETRIES', '3'))
+        self.spool_retry_backoff = float(os.getenv('SPOOL_RETRY_BACKOFF_SECONDS', '5'))
+        
+        # Article bodies older than this move from the hot table to the archive
+        self.content_retention_days = int(os.getenv('CONTENT_RETENTION_DAYS', '90'))
+        
+        # concurrent overlaps scraping, scoring and storing; sequential runs them one after another
+        self.pipeline_mode = os.getenv('PIPELINE_MODE', 'concurrent').lower()
+        self.last_stage_report: Dict[str, Any] = {}
+        
+        # Checkpoints of runs that were never resumed are removed after this many days
+        self.checkpoint_retention_days = float(os.getenv('CHECKPOINT_RETENTION_DAYS', '7'))
+        
+        # Stage timings and counts of the current run, written to PIPELINE_RUNS when it ends
+        self.run_recorder: Optional[PipelineRunRecorder] = None
+        
+        # Worker mode: the feeds this run holds leases on, and a fence that fails once a lease is lost
+        self.active_feeds: Optional[List[Dict[str, str]]] = None
+        self.lease_fence: Optional[Callable[[], bool]] = None
         
         # Setup logging
         logger.add(
@@ -65,17 +92,11 @@ class NewsSentimentScraper:
             logger.info("Populating companies table...")
             
             with self.db_manager:
-                for company in FORTUNE_100_COMPANIES:
-                    # Check if company already exists
-                    existing_id = self.db_manager.get_company_id(company['ticker'])
-                    if not existing_id:
-                        company_id = self.db_manager.insert_company(company)
-                        if company_id:
-                            logger.info(f"Added company: {company['name']} (ID: {company_id})")
-                        else:
-                            logger.warning(f"Failed to add company: {company['name']}")
-                    else:
-                        logger.debug(f"Company already exists: {company['name']} (ID: {existing_id})")
+                # Missing companies are inserted in one statement; existing ones come from the cache
+                company_ids = self.db_manager.insert_companies(FORTUNE_100_COMPANIES)
+                if len(company_ids) < len(FORTUNE_100_COMPANIES):
+                    logger.warning(f"Only {len(company_ids)} of {len(FORTUNE_100_COMPANIES)} companies are available")
+                    return False
             
             logger.info("Companies population completed")
             return True
@@ -84,51 +105,33 @@ class NewsSentimentScraper:
             logger.error(f"Companies population error: {e}")
             return False
     
-    def scrape_news(self) -> List[NewsArticle]:
-        """Scrape news articles"""
+    def scrape_news(self) -> Optional[List[NewsArticle]]:
+        """Scrape news articles (None if scraping failed, as opposed to finding nothing)"""
         try:
             logger.info("Starting news scraping...")
             
             # Scrape RSS feeds
-            articles = self.rss_scraper.scrape_and_match()
+            articles = self.rss_scraper.scrape_and_match(self.active_feeds)
             
             logger.info(f"Scraped {len(articles)} articles")
             return articles
             
         except Exception as e:
             logger.error(f"News scraping error: {e}")
-            return []
+            return None
     
     def analyze_sentiment(self, articles: List[NewsArticle]) -> List[NewsArticleWithSentiment]:
         """Analyze sentiment for articles"""
         try:
             logger.info("Starting sentiment analysis...")
             
-            articles_with_sentiment = []
-            
-            for i, article in enumerate(articles):
-                try:
-                    # Analyze sentiment
-                    sentiment_analyses = self.sentiment_analyzer.analyze_article(
-                        title=article.title,
-                        content=article.content
-                    )
-                    
-                    if sentiment_analyses:
-                        # Create combined object
-                        article_with_sentiment = NewsArticleWithSentiment(
-                            article=article,
-                            sentiment_analyses=sentiment_analyses
-                        )
-                        articles_with_sentiment.append(article_with_sentiment)
-                        
-                        logger.debug(f"Analyzed article {i+1}/{len(articles)}: {article.title[:50]}...")
-                    
-                except Exception as e:
-                    logger.error(f"Sentiment analysis failed for article: {e}")
-                    continue
+            articles_with_sentiment = score_articles(
+                self.sentiment_analyzer, articles, self.target_company_sentences
+            )
             
             logger.info(f"Completed sentiment analysis for {len(articles_with_sentiment)} articles")
+            self.sentiment_analyzer.save_keyword_state()
+            self.sentiment_analyzer.instrumentation.flush()
             return articles_with_sentiment
             
         except Exception as e:
@@ -136,134 +139,297 @@ class NewsSentimentScraper:
             return []
     
     def store_data(self, articles_with_sentiment: List[NewsArticleWithSentiment]) -> bool:
-        """Store articles and sentiment data in Snowflake"""
+        """Spool the scored batch locally, then bulk load the spool backlog"""
         try:
-            logger.info("Storing data in Snowflake...")
+            logger.info("Storing data...")
             
-            with self.db_manager:
-                stored_count = 0
+            # Another worker took over a feed of this run; it will store that feed's articles itself
+            if self.lease_fence and not self.lease_fence():
+                logger.error("Feed lease lost; not storing this batch")
+                return False
+            
+            # Write-ahead: once spooled the batch is safe even if the load fails
+            if not self.spool.write_batch(articles_with_sentiment):
+                return False
+            
+            if not self.load_spool():
+                logger.warning("Scored batch kept in the local spool; it will load on the next run")
+            return True
                 
-                for article_with_sentiment in articles_with_sentiment:
-                    try:
-                        article = article_with_sentiment.article
-                        sentiment_analyses = article_with_sentiment.sentiment_analyses
-                        
-                        # Get company ID
-                        company_id = self.db_manager.get_company_id(article.ticker)
-                        if not company_id:
-                            logger.warning(f"Company not found: {article.ticker}")
-                            continue
-                        
-                        # Update article with company ID
-                        article.company_id = company_id
-                        
-                        # Insert article
-                        article_id = self.db_manager.insert_news_article(article)
-                        if not article_id:
-                            continue
-                        
-                        # Insert sentiment analyses
-                        for sentiment_analysis in sentiment_analyses:
-                            sentiment_analysis.article_id = article_id
-                            sentiment_analysis.company_id = company_id
-                            
-                            sentiment_id = self.db_manager.insert_sentiment_analysis(sentiment_analysis)
-                            if sentiment_id:
-                                stored_count += 1
-                    
-                    except Exception as e:
-                        logger.error(f"Failed to store article: {e}")
-                        continue
+        except Exception as e:
+            logger.error(f"Data storage error: {e}")
+            return False
+    
+    def load_spool(self) -> bool:
+        """Load every pending spooled batch in bulk, retrying with backoff"""
+        batch_ids = self.spool.pending_batches()
+        if not batch_ids:
+            return True
+        
+        for attempt in range(1, self.spool_load_retries + 1):
+            with self.db_manager:
+                keys = self.db_manager.load_spooled_batches(self.spool, batch_ids)
+            
+            if keys is not None:
+                self.spool.mark_loaded(batch_ids)
+                self.touched_summary_keys.update(keys)
+                logger.info(f"Loaded {len(batch_ids)} spooled batch(es)")
+                return True
+            
+            if attempt < self.spool_load_retries:
+                delay = self.spool_retry_backoff * 2 ** (attempt - 1)
+                logger.warning(f"Spool load attempt {attempt} failed; retrying in {delay:.0f}s")
+                time.sleep(delay)
+        
+        logger.error(f"Spool load failed after {self.spool_load_retries} attempts; "
+                     f"{len(batch_ids)} batch(es) remain spooled")
+        return False
+    
+    def run_sequential_stages(self, checkpoint: RunCheckpoint) -> bool:
+        """Scrape, score and store one stage after another, skipping work the checkpoint already holds"""
+        if checkpoint.is_complete('scraped'):
+            articles = checkpoint.scraped_articles()
+            logger.info(f"Resuming with {len(articles)} checkpointed articles")
+        else:
+            with self.run_recorder.stage('fetch'):
+                articles = self.scrape_news()
+                if articles is None:
+                    # Left incomplete so a resumed run scrapes again
+                    self.run_recorder.add_errors('fetch')
+                    logger.error("News scraping failed")
+                    return False
+                checkpoint.append('scraped', articles)
+                checkpoint.complete('scraped')
+                self.run_recorder.add_items('fetch', len(articles))
+        
+        if not articles:
+            if self.active_feeds is not None and checkpoint.is_complete('scraped'):
+                return self.complete_empty_run(checkpoint)
+            logger.warning("No articles scraped")
+            return False
+        
+        if not checkpoint.is_complete('scored'):
+            scored_keys = {article_key(item.article) for item in checkpoint.scored_articles()}
+            remaining = [article for article in articles if article_key(article) not in scored_keys]
+            with self.run_recorder.stage('score'):
+                scored = self.analyze_sentiment(remaining) if remaining else []
+                checkpoint.append('scored', scored)
+                if scored or not remaining:
+                    checkpoint.complete('scored')
+                self.run_recorder.add_items('score', len(scored))
+        
+        if not checkpoint.is_complete('scored') and not checkpoint.scored_articles():
+            logger.warning("No sentiment analysis completed")
+            return False
+        
+        with self.run_recorder.stage('store'):
+            if not self.store_checkpointed(checkpoint):
+                logger.error("Data storage failed")
+                return False
+        
+        checkpoint.complete('stored')
+        return True
+    
+    def run_concurrent_stages(self, checkpoint: RunCheckpoint) -> bool:
+        """Scrape, score and store with the stages overlapping (see ConcurrentPipeline)"""
+        try:
+            logger.info("Starting concurrent scrape, score and store stages...")
+            
+            # Articles scored before an earlier failure are stored, never re-scored
+            scored_keys = {article_key(item.article) for item in checkpoint.scored_articles()}
+            if not self.store_checkpointed(checkpoint):
+                logger.error("Data storage failed")
+                return False
+            
+            pipeline = ConcurrentPipeline.from_env()
+            
+            if checkpoint.is_complete('scraped'):
+                # Feed the checkpointed articles that still need scoring straight to the scoring stage
+                remaining = [article for article in checkpoint.scraped_articles()
+                             if article_key(article) not in scored_keys]
+                size = pipeline.score_batch_size
+                feeds = [remaining[i:i + size] for i in range(0, len(remaining), size)]
+                pipeline.feed_delay = 0
                 
-                logger.info(f"Stored {stored_count} sentiment analyses")
-                return stored_count > 0
+                def fetch(chunk: List[NewsArticle]) -> List[NewsArticle]:
+                    return chunk
+            else:
+                feeds = self.active_feeds if self.active_feeds is not None else self.rss_scraper.rss_feeds
                 
+                def fetch(feed: Dict[str, str]) -> List[NewsArticle]:
+                    articles = self.rss_scraper.scrape_feed(feed['url'], feed['name'])
+                    matched = self.rss_scraper.match_articles_to_companies(articles)
+                    checkpoint.append('scraped', matched)
+                    return [article for article in matched if article_key(article) not in scored_keys]
+            
+            def store(batch: List[NewsArticleWithSentiment]) -> bool:
+                checkpoint.append('scored', batch)
+                if not self.store_data(batch):
+                    return False
+                checkpoint.append('stored', [article_key(item.article) for item in batch])
+                return True
+            
+            def on_scored(articles: List[NewsArticle]):
+                # Scoring processes do not persist keyword statistics; fold their text in here
+                self.sentiment_analyzer.record_corpus([(article.title, article.content) for article in articles])
+            
+            report = pipeline.run(
+                feeds, fetch, store,
+                on_scored=on_scored, target_company_sentences=self.target_company_sentences
+            )
+            self.sentiment_analyzer.save_keyword_state()
+            self.last_stage_report = report
+            self.run_recorder.merge_stage_report(report)
+            
+            stages = report['stages']
+            if not stages['fetch']['errors']:
+                checkpoint.complete('scraped')
+            if not stages['score']['errors']:
+                checkpoint.complete('scored')
+            
+            if not stages['fetch']['items'] and not scored_keys:
+                if self.active_feeds is not None and not stages['fetch']['errors']:
+                    return self.complete_empty_run(checkpoint)
+                logger.warning("No articles scraped")
+                return False
+            if stages['store']['errors']:
+                logger.error(f"Data storage failed for {stages['store']['errors']} batch(es)")
+                return False
+            if not stages['store']['items'] and not scored_keys:
+                logger.warning("No sentiment analysis completed")
+                return False
+            
+            checkpoint.complete('stored')
+            return True
+            
         except Exception as e:
-            logger.error(f"Data storage error: {e}")
+            logger.error(f"Concurrent pipeline error: {e}")
+            return False
+    
+    def complete_empty_run(self, checkpoint: RunCheckpoint) -> bool:
+        """Worker mode: leased feeds scraped cleanly with nothing to store are done until they are due again
+        
+        Failing the run would release the partitions uncompleted, and claims
+        would keep handing these feeds out ahead of feeds that are due.
+        """
+        logger.info(f"No matched articles in {len(self.active_feeds)} leased feed(s)")
+        checkpoint.complete('stored')
+        return True
+    
+    def store_checkpointed(self, checkpoint: RunCheckpoint) -> bool:
+        """Store checkpointed articles that were scored but never reached storage"""
+        stored_keys = checkpoint.stored_keys()
+        pending = [item for item in checkpoint.scored_articles() if article_key(item.article) not in stored_keys]
+        if not pending:
+            return True
+        
+        logger.info(f"Storing {len(pending)} checkpointed scored articles")
+        if not self.store_data(pending):
+            self.run_recorder.add_errors('store')
             return False
+        
+        checkpoint.append('stored', [article_key(item.article) for item in pending])
+        self.run_recorder.add_items('store', len(pending))
+        return True
     
-    def generate_daily_summaries(self) -> bool:
-        """Generate daily sentiment summaries"""
+    def generate_daily_summaries(self, keys: Optional[List[Tuple[int, Any]]] = None) -> bool:
+        """Refresh daily sentiment summaries and rollups for the (company_id, date) keys touched by stored batches
+        
+        Returns False only when a refresh failed; nothing to refresh is a success.
+        """
         try:
             logger.info("Generating daily summaries...")
             
+            keys = set(keys) if keys is not None else set(self.touched_summary_keys)
+            if not keys:
+                logger.info("No company/day summaries touched since the last refresh")
+                return True
+            
             with self.db_manager:
-                # Get today's date
-                today = datetime.now().date()
-                
-                # Query to get daily summaries
-                query = """
-                SELECT 
-                    c.company_id,
-                    c.name as company_name,
-                    c.ticker,
-                    DATE(sa.created_at) as date,
-                    AVG(sa.sentiment_score) as avg_sentiment_score,
-                    COUNT(DISTINCT sa.article_id) as article_count,
-                    SUM(CASE WHEN sa.sentiment_label = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                    SUM(CASE WHEN sa.sentiment_label = 'negative' THEN 1 ELSE 0 END) as negative_count,
-                    SUM(CASE WHEN sa.sentiment_label = 'neutral' THEN 1 ELSE 0 END) as neutral_count
-                FROM SENTIMENT_ANALYSIS sa
-                JOIN COMPANIES c ON sa.company_id = c.company_id
-                WHERE DATE(sa.created_at) = %s
-                GROUP BY c.company_id, c.name, c.ticker, DATE(sa.created_at)
-                """
-                
-                cursor = self.db_manager.connection.cursor()
-                cursor.execute(query, (today,))
-                results = cursor.fetchall()
-                cursor.close()
-                
-                summaries_created = 0
-                
-                for result in results:
-                    try:
-                        (company_id, company_name, ticker, date, avg_score, 
-                         article_count, positive_count, negative_count, neutral_count) = result
-                        
-                        # Determine sentiment label
-                        if avg_score > 0.1:
-                            sentiment_label = SentimentLabel.POSITIVE
-                        elif avg_score < -0.1:
-                            sentiment_label = SentimentLabel.NEGATIVE
-                        else:
-                            sentiment_label = SentimentLabel.NEUTRAL
-                        
-                        # Create summary
-                        summary = DailySentimentSummary(
-                            company_id=company_id,
-                            company_name=company_name,
-                            ticker=ticker,
-                            date=datetime.combine(date, datetime.min.time()),
-                            avg_sentiment_score=float(avg_score),
-                            sentiment_label=sentiment_label,
-                            article_count=article_count,
-                            positive_count=positive_count,
-                            negative_count=negative_count,
-                            neutral_count=neutral_count
-                        )
-                        
-                        # Insert summary
-                        summary_id = self.db_manager.insert_daily_summary(summary)
-                        if summary_id:
-                            summaries_created += 1
-                    
-                    except Exception as e:
-                        logger.error(f"Failed to create summary for {company_name}: {e}")
-                        continue
-                
-                logger.info(f"Created {summaries_created} daily summaries")
-                return summaries_created > 0
+                # One set-based MERGE recomputes only the touched keys
+                summaries_created = self.db_manager.refresh_daily_summaries(list(keys))
+                # The rollup cube is rebuilt for the same company/days
+                rollup_cells = self.db_manager.refresh_rollups(list(keys)) if summaries_created else 0
+            
+            if summaries_created and rollup_cells:
+                self.touched_summary_keys -= keys
+            elif summaries_created:
+                logger.warning("Sentiment rollup refresh failed; touched keys are kept for the next run")
+            
+            logger.info(f"Created {summaries_created} daily summaries ({rollup_cells} rollup cells)")
+            return summaries_created > 0 and rollup_cells > 0
                 
         except Exception as e:
             logger.error(f"Daily summary generation error: {e}")
             return False
     
-    def run_full_pipeline(self) -> bool:
-        """Run the complete news sentiment analysis pipeline"""
+    def archive_old_content(self, older_than_days: Optional[int] = None) -> int:
+        """Retention job: archive article content older than the retention window"""
+        days = self.content_retention_days if older_than_days is None else older_than_days
         try:
-            logger.info("Starting full news sentiment analysis pipeline...")
+            logger.info(f"Archiving article content older than {days} days...")
             
+            with self.db_manager:
+                return self.db_manager.archive_article_content(days)
+                
+        except Exception as e:
+            logger.error(f"Content archiving error: {e}")
+            return 0
+    
+    def run_full_pipeline(self, resume_run_id: Optional[str] = None, run_id: Optional[str] = None,
+                          feeds: Optional[List[Dict[str, str]]] = None,
+                          fence: Optional[Callable[[], bool]] = None) -> bool:
+        """Run the complete news sentiment analysis pipeline, or resume a failed run from its checkpoint
+        
+        Worker mode passes the leased feeds and a fence that stops storage once a lease is lost.
+        """
+        run_id = resume_run_id or run_id or datetime.now().strftime('%Y%m%dT%H%M%S')
+        self.active_feeds = feeds
+        self.lease_fence = fence
+        
+        # Per-run query report (and QUERY_TAG run id) starts fresh for every pipeline run
+        query_instrumentation.reset()
+        query_instrumentation.set_run_id(run_id)
+        
+        self.run_recorder = PipelineRunRecorder(run_id, self.pipeline_mode, resumed=bool(resume_run_id))
+        succeeded, error_message = False, None
+        
+        try:
+            if resume_run_id:
+                checkpoint = RunCheckpoint(resume_run_id)
+                if not checkpoint.exists():
+                    logger.error(f"No checkpoint for run {resume_run_id}; "
+                                 f"available: {', '.join(RunCheckpoint.list_runs()) or 'none'}")
+                    return False
+                logger.info(f"Resuming run {run_id} after stage '{checkpoint.last_completed_stage() or 'none'}'")
+            else:
+                RunCheckpoint.cleanup_stale(self.checkpoint_retention_days)
+                checkpoint = RunCheckpoint.create(run_id)
+            
+            if not self._run_pipeline_steps(checkpoint):
+                logger.error(f"Pipeline run {run_id} failed; resume it with --resume {run_id}")
+                return False
+            
+            # Completed runs need no checkpoint
+            checkpoint.cleanup()
+            succeeded = True
+            logger.info("Pipeline completed successfully!")
+            return True
+            
+        except Exception as e:
+            error_message = str(e)
+            logger.error(f"Pipeline error: {e}")
+            return False
+        
+        finally:
+            self.record_run(succeeded, error_message)
+            query_instrumentation.log_report(int(os.getenv('QUERY_REPORT_TOP_N', '10')))
+    
+    def _run_pipeline_steps(self, checkpoint: RunCheckpoint) -> bool:
+        """Pipeline steps behind run_full_pipeline"""
+        logger.info("Starting full news sentiment analysis pipeline...")
+        
+        with self.run_recorder.stage('setup'):
             # Step 1: Setup database
             if not self.setup_database():
                 logger.error("Database setup failed")
@@ -274,33 +440,50 @@ class NewsSentimentScraper:
                 logger.error("Companies population failed")
                 return False
             
-            # Step 3: Scrape news
-            articles = self.scrape_news()
-            if not articles:
-                logger.warning("No articles scraped")
-                return False
-            
-            # Step 4: Analyze sentiment
-            articles_with_sentiment = self.analyze_sentiment(articles)
-            if not articles_with_sentiment:
-                logger.warning("No sentiment analysis completed")
-                return False
+            # Drain batches spooled by earlier runs that could not reach the database
+            if self.spool.pending_batches():
+                self.load_spool()
+        
+        # Steps 3-5: Scrape news, analyze sentiment and store data
+        if not checkpoint.is_complete('stored'):
+            if self.pipeline_mode == 'concurrent':
+                stored = self.run_concurrent_stages(checkpoint)
+            else:
+                stored = self.run_sequential_stages(checkpoint)
             
-            # Step 5: Store data
-            if not self.store_data(articles_with_sentiment):
-                logger.error("Data storage failed")
+            # Keys owed a refresh survive a failure between storing and summarizing
+            checkpoint.save_summary_keys(self.touched_summary_keys)
+            if not stored:
                 return False
-            
-            # Step 6: Generate daily summaries
-            if not self.generate_daily_summaries():
+        
+        # Step 6: Generate daily summaries
+        self.touched_summary_keys |= checkpoint.summary_keys()
+        with self.run_recorder.stage('summarize'):
+            summary_keys = len(self.touched_summary_keys)
+            if self.generate_daily_summaries():
+                checkpoint.complete('summarized')
+                self.run_recorder.add_items('summarize', summary_keys)
+            else:
                 logger.warning("Daily summary generation failed")
-            
-            logger.info("Pipeline completed successfully!")
-            return True
-            
+        
+        return True
+    
+    def record_run(self, succeeded: bool, error_message: Optional[str] = None) -> Dict[str, Any]:
+        """Write the current run to PIPELINE_RUNS, keeping a local copy in case storage is down"""
+        run = self.run_recorder.finish('succeeded' if succeeded else 'failed', error_message)
+        self.run_recorder.append_local(run)
+        
+        try:
+            with self.db_manager:
+                self.db_manager.record_pipeline_run(run)
         except Exception as e:
-            logger.error(f"Pipeline error: {e}")
-            return False
+            logger.error(f"Pipeline run history error: {e}")
+        
+        logger.info(f"Run {run['run_id']} {run['status']} in {run['duration_seconds']:.1f}s: "
+                    f"{run['articles_scraped']} scraped, {run['articles_scored']} scored, "
+                    f"{run['articles_stored']} stored, {run['error_count']} errors, "
+                    f"peak RSS {run['peak_rss_mb']} MB")
+        return run
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get pipeline statistics"""
@@ -329,6 +512,9 @@ class NewsSentimentScraper:
                 
                 cursor.close()
                 
+                # Connection reuse across pipeline stages and scheduled runs
+                stats['connection_pool'] = self.db_manager.get_pool_metrics()
+                
                 return stats
                 
         except Exception as e:
@@ -337,12 +523,17 @@ class NewsSentimentScraper:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description='Run the news sentiment pipeline')
+    parser.add_argument('--resume', metavar='RUN_ID',
+                        help='Resume a failed run from its checkpoint instead of starting over')
+    args = parser.parse_args()
+    
     try:
         # Initialize scraper
         scraper = NewsSentimentScraper()
         
         # Run pipeline
-        success = scraper.run_full_pipeline()
+        success = scraper.run_full_pipeline(resume_run_id=args.resume)
         
         if success:
             logger.info("News sentiment analysis completed successfully!")
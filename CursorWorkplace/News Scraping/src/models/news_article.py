@@ -19,6 +19,7 @@ class SentimentEngine(str, Enum):
     TEXTBLOB = "textblob"
     VADER = "vader"
     NLTK = "nltk"
+    LINEAR = "linear"
 
 class NewsArticle(BaseModel):
     """News article data model"""
@@ -0,0 +1 @@
+# Pipeline Package
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Sentiment Backfill
+Re-scores stored articles in keyset-paginated chunks across a process pool
+"""
+
+import os
+import json
+import time
+import tempfile
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, date
+from typing import List, Dict, Any, Optional, Tuple
+import pandas as pd
+from loguru import logger
+
+from src.database.storage_backend import StorageBackend
+from src.models.news_article import SentimentAnalysis, SentimentEngine
+
+DEFAULT_BACKFILL_DIR = os.getenv('BACKFILL_DIR', 'data/backfill')
+
+# Analyzer owned by each backfill process
+_backfill_analyzer = None
+
+def _init_backfill_worker():
+    """Build the per-process analyzer once, when the worker starts"""
+    global _backfill_analyzer
+    from src.sentiment.sentiment_analyzer import SentimentAnalyzer
+
+    _backfill_analyzer = SentimentAnalyzer()
+    # Historical text is already counted in the keyword statistics; never persist them here
+    if _backfill_analyzer.keyword_extractor:
+        _backfill_analyzer.keyword_extractor.state_path = None
+
+def _score_chunk(articles: List[Tuple[str, Optional[str]]], engines: List[SentimentEngine],
+                 search_terms: Optional[List[Optional[List[str]]]]) -> List[List[SentimentAnalysis]]:
+    """Process-pool task: analyses for each (title, content) pair"""
+    return _backfill_analyzer.analyze_articles(articles, engines=engines, search_terms=search_terms)
+
+class BackfillProgress:
+    """Resumable state of a backfill job, saved atomically after every merged chunk"""
+
+    def __init__(self, job: str, backfill_dir: str = DEFAULT_BACKFILL_DIR):
+        """Load the job's progress file, or start fresh"""
+        self.path = os.path.join(backfill_dir, f"{job}.json")
+        self.state: Dict[str, Any] = {
+            'job': job, 'last_article_id': 0, 'articles_scored': 0, 'analyses_written': 0,
+            'chunks': 0, 'summary_keys': [], 'completed': False,
+            'started_at': datetime.utcnow().isoformat(), 'updated_at': None
+        }
+        if os.path.exists(self.path):
+            with open(self.path, 'r', encoding='utf-8') as handle:
+                self.state.update(json.load(handle))
+
+    @property
+    def last_article_id(self) -> int:
+        """Highest article id whose results are merged"""
+        return int(self.state['last_article_id'])
+
+    def summary_keys(self) -> List[Tuple[int, date]]:
+        """(company_id, date) keys touched so far"""
+        return [(company_id, datetime.strptime(day, '%Y-%m-%d').date())
+                for company_id, day in self.state['summary_keys']]
+
+    def advance(self, last_article_id: int, articles: int, analyses: int, keys: List[Tuple[int, date]]):
+        """Record a merged chunk"""
+        saved = {tuple(key) for key in self.state['summary_keys']}
+        saved.update((company_id, str(day)) for company_id, day in keys)
+        self.state.update(
+            last_article_id=last_article_id,
+            articles_scored=self.state['articles_scored'] + articles,
+            analyses_written=self.state['analyses_written'] + analyses,
+            chunks=self.state['chunks'] + 1,
+            summary_keys=sorted(saved)
+        )
+        self.save()
+
+    def save(self):
+        """Atomically replace the progress file"""
+        self.state['updated_at'] = datetime.utcnow().isoformat()
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False, encoding='utf-8') as handle:
+            json.dump(self.state, handle)
+            temp_path = handle.name
+        os.replace(temp_path, self.path)
+
+    def reset(self):
+        """Forget saved progress"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+class SentimentBackfill:
+    """Streams NEWS_ARTICLES by article_id, re-scores them and merges SENTIMENT_ANALYSIS
+
+    The reader fetches the next page while earlier pages are scored; results
+    are merged strictly in page order, so the saved watermark never skips an
+    unmerged page and an interrupted job resumes after the last merged one.
+    """
+
+    def __init__(self, db_manager: StorageBackend, engines: List[SentimentEngine], chunk_size: int = 500,
+                 workers: Optional[int] = None, target_company_sentences: bool = False):
+        """Initialize the job settings"""
+        self.db_manager = db_manager
+        self.engines = engines
+        self.chunk_size = max(1, chunk_size)
+        self.workers = max(1, workers or (os.cpu_count() or 2) - 1)
+        self.target_company_sentences = target_company_sentences
+
+    def _search_terms(self, page: pd.DataFrame) -> Optional[List[Optional[List[str]]]]:
+        """Company search terms per article for targeted sentence scoring"""
+        if not self.target_company_sentences:
+            return None
+
+        from config.companies import get_company_by_ticker
+
+        terms = []
+        for ticker in page['ticker']:
+            company = get_company_by_ticker(ticker) if isinstance(ticker, str) else None
+            terms.append(company['search_terms'] if company else None)
+        return terms
+
+    @staticmethod
+    def _summary_key(row) -> Optional[Tuple[int, date]]:
+        """Daily summary key of an article (publication date, else scrape date)"""
+        if pd.isna(row.company_id):
+            return None
+        timestamp = row.published_date if not pd.isna(row.published_date) else row.scraped_date
+        return int(row.company_id), pd.Timestamp(timestamp).date()
+
+    def _merge(self, page: pd.DataFrame, results: List[List[SentimentAnalysis]]) -> Tuple[int, List[Tuple[int, date]]]:
+        """Attach article ids and bulk-merge a page of results; returns analyses written and touched keys"""
+        sentiments, keys = [], set()
+        for row, analyses in zip(page.itertuples(index=False), results):
+            for analysis in analyses:
+                analysis.article_id = int(row.article_id)
+                analysis.company_id = None if pd.isna(row.company_id) else int(row.company_id)
+                sentiments.append(analysis)
+            key = self._summary_key(row)
+            if analyses and key:
+                keys.add(key)
+
+        ids = self.db_manager.upsert_sentiment_analyses(sentiments)
+        written = sum(1 for sentiment_id in ids if sentiment_id)
+        if sentiments and not written:
+            raise RuntimeError(f"Merging {len(sentiments)} sentiment analyses failed")
+        return written, sorted(keys)
+
+    def run(self, progress: BackfillProgress, since: Optional[date] = None, until: Optional[date] = None,
+            max_articles: Optional[int] = None, rebuild_summaries: bool = True) -> Dict[str, Any]:
+        """Backfill from the saved watermark to the end (or max_articles) and rebuild summaries and rollups"""
+        if progress.state['completed']:
+            logger.info(f"Backfill {progress.state['job']} already completed; reset it to run again")
+            return progress.state
+
+        engines = [engine.value for engine in self.engines]
+        if progress.state.get('engines', engines) != engines:
+            logger.error(f"Backfill {progress.state['job']} was started with engines {progress.state['engines']}; "
+                         f"use a new job name or restart it")
+            return progress.state
+        progress.state['engines'] = engines
+
+        after_id = progress.last_article_id
+        logger.info(f"Backfill {progress.state['job']}: engines={engines} "
+                    f"starting after article {after_id} with {self.workers} workers")
+
+        in_flight = deque()
+        max_in_flight = self.workers * 2
+        read = 0
+        start = time.perf_counter()
+
+        def merge_oldest():
+            future, page = in_flight.popleft()
+            written, keys = self._merge(page, future.result())
+            progress.advance(int(page['article_id'].iloc[-1]), len(page), written, keys)
+
+            rate = progress.state['articles_scored'] / max(time.perf_counter() - start, 1e-9)
+            logger.info(f"Backfill {progress.state['job']}: through article {progress.last_article_id}, "
+                        f"{progress.state['articles_scored']} articles, {progress.state['analyses_written']} analyses "
+                        f"({rate:.1f} articles/s)")
+
+        # Spawned workers start clean instead of forking the database connection
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                 initializer=_init_backfill_worker) as pool:
+            while max_articles is None or read < max_articles:
+                limit = self.chunk_size if max_articles is None else min(self.chunk_size, max_articles - read)
+                page = self.db_manager.get_articles_after(after_id, limit, since, until)
+                if page.empty:
+                    break
+
+                articles = [(title, content if isinstance(content, str) else None)
+                            for title, content in zip(page['title'], page['content'])]
+                in_flight.append((pool.submit(_score_chunk, articles, self.engines, self._search_terms(page)), page))
+                after_id = int(page['article_id'].iloc[-1])
+                read += len(page)
+
+                # Keep reading ahead while the pool works, up to two pages per worker
+                while len(in_flight) >= max_in_flight:
+                    merge_oldest()
+
+            while in_flight:
+                merge_oldest()
+
+        reached_end = max_articles is None or read < max_articles
+        if rebuild_summaries and reached_end:
+            keys = progress.summary_keys()
+            logger.info(f"Rebuilding {len(keys)} daily summaries and their rollups touched by the backfill")
+            refreshed = self.db_manager.refresh_daily_summaries(keys) if keys else 0
+            if refreshed and not self.db_manager.refresh_rollups(keys):
+                refreshed = 0
+            if keys and not refreshed:
+                # Scores are merged; rerunning the job only retries the rebuild
+                logger.error("Daily summary or rollup rebuild failed; rerun the job to retry it")
+                return progress.state
+
+            progress.state.update(completed=True, summaries_refreshed=refreshed)
+            progress.save()
+
+        return progress.state
@@ -0,0 +1,190 @@
+"""
+Pipeline Run Checkpoints
+Per-run stage outputs on local disk so a failed run can resume where it stopped
+"""
+
+import os
+import json
+import time
+import shutil
+import tempfile
+import threading
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterable, Callable
+from loguru import logger
+
+from src.models.news_article import NewsArticle, NewsArticleWithSentiment
+
+DEFAULT_CHECKPOINT_DIR = os.getenv('CHECKPOINT_DIR', 'data/checkpoints')
+
+# Stages in pipeline order; each has a JSON Lines file of its output
+CHECKPOINT_STAGES = ('scraped', 'scored', 'stored', 'summarized')
+
+def article_key(article: NewsArticle) -> str:
+    """Identity of an article across stages (url, or source and title when there is none)"""
+    return article.url or f"{article.source}:{article.title}"
+
+class RunCheckpoint:
+    """Directory of stage outputs for one pipeline run
+
+    Stage files are appended as work completes and a manifest records which
+    stages finished, so a resumed run skips finished stages and, within an
+    unfinished one, items that were already processed.
+    """
+
+    def __init__(self, run_id: str, checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR):
+        """Open (without creating) the checkpoint of a run"""
+        self.run_id = run_id
+        self.path = os.path.join(checkpoint_dir, run_id)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, run_id: str, checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR) -> 'RunCheckpoint':
+        """Start an empty checkpoint for a new run"""
+        checkpoint = cls(run_id, checkpoint_dir)
+        os.makedirs(checkpoint.path, exist_ok=True)
+        checkpoint._write_manifest({'run_id': run_id, 'created_at': datetime.utcnow().isoformat(),
+                                    'completed': [], 'summary_keys': []})
+        return checkpoint
+
+    def exists(self) -> bool:
+        """Whether the run has a checkpoint on disk"""
+        return os.path.exists(self._manifest_path())
+
+    def _manifest_path(self) -> str:
+        """Path of the manifest file"""
+        return os.path.join(self.path, 'manifest.json')
+
+    def _stage_path(self, stage: str) -> str:
+        """Path of a stage's output file"""
+        return os.path.join(self.path, f"{stage}.jsonl")
+
+    def manifest(self) -> Dict[str, Any]:
+        """Completed stages and saved summary keys"""
+        with open(self._manifest_path(), 'r', encoding='utf-8') as handle:
+            return json.load(handle)
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        """Atomically replace the manifest"""
+        with tempfile.NamedTemporaryFile('w', dir=self.path, suffix='.tmp', delete=False, encoding='utf-8') as handle:
+            json.dump(manifest, handle)
+            temp_path = handle.name
+        os.replace(temp_path, self._manifest_path())
+
+    def is_complete(self, stage: str) -> bool:
+        """Whether a stage finished in this run"""
+        return stage in self.manifest()['completed']
+
+    def last_completed_stage(self) -> Optional[str]:
+        """Furthest stage that finished, if any"""
+        completed = self.manifest()['completed']
+        finished = [stage for stage in CHECKPOINT_STAGES if stage in completed]
+        return finished[-1] if finished else None
+
+    def complete(self, stage: str):
+        """Mark a stage finished"""
+        with self._lock:
+            manifest = self.manifest()
+            if stage not in manifest['completed']:
+                manifest['completed'].append(stage)
+                self._write_manifest(manifest)
+        logger.debug(f"Checkpoint {self.run_id}: stage '{stage}' complete")
+
+    def append(self, stage: str, records: Iterable[Any]):
+        """Append pydantic models (or JSON-able values) to a stage file"""
+        lines = [record.json() if hasattr(record, 'json') else json.dumps(record) for record in records]
+        if not lines:
+            return
+
+        with self._lock:
+            with open(self._stage_path(stage), 'ab+') as handle:
+                # Start on a fresh line if an earlier write was cut off mid-record
+                handle.seek(0, os.SEEK_END)
+                if handle.tell():
+                    handle.seek(-1, os.SEEK_END)
+                    if handle.read(1) != b'\n':
+                        handle.write(b'\n')
+                handle.write(('\n'.join(lines) + '\n').encode('utf-8'))
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def _read_records(self, stage: str, parse: Callable[[str], Any]) -> List[Any]:
+        """Parsed records of a stage file, skipping records torn by a crash"""
+        path = self._stage_path(stage)
+        if not os.path.exists(path):
+            return []
+
+        records = []
+        with open(path, 'r', encoding='utf-8') as handle:
+            for line in handle:
+                if not line.strip():
+                    continue
+                try:
+                    records.append(parse(line))
+                except ValueError:
+                    logger.warning(f"Skipping unreadable record in checkpoint {self.run_id}/{stage}")
+        return records
+
+    def scraped_articles(self) -> List[NewsArticle]:
+        """Scraped articles, de-duplicated by article key"""
+        articles: Dict[str, NewsArticle] = {}
+        for article in self._read_records('scraped', NewsArticle.parse_raw):
+            articles.setdefault(article_key(article), article)
+        return list(articles.values())
+
+    def scored_articles(self) -> List[NewsArticleWithSentiment]:
+        """Scored articles, de-duplicated by article key"""
+        scored: Dict[str, NewsArticleWithSentiment] = {}
+        for item in self._read_records('scored', NewsArticleWithSentiment.parse_raw):
+            scored.setdefault(article_key(item.article), item)
+        return list(scored.values())
+
+    def stored_keys(self) -> Set[str]:
+        """Keys of articles that reached storage"""
+        return set(self._read_records('stored', json.loads))
+
+    def save_summary_keys(self, keys: Iterable[Tuple[int, Any]]):
+        """Remember (company_id, date) keys still owed a summary refresh"""
+        with self._lock:
+            manifest = self.manifest()
+            saved = {(company_id, day) for company_id, day in manifest['summary_keys']}
+            saved.update((company_id, str(day)) for company_id, day in keys)
+            manifest['summary_keys'] = sorted(saved)
+            self._write_manifest(manifest)
+
+    def summary_keys(self) -> Set[Tuple[int, Any]]:
+        """Saved (company_id, date) keys"""
+        return {
+            (company_id, datetime.strptime(day, '%Y-%m-%d').date())
+            for company_id, day in self.manifest()['summary_keys']
+        }
+
+    def cleanup(self):
+        """Delete the checkpoint"""
+        shutil.rmtree(self.path, ignore_errors=True)
+        logger.debug(f"Removed checkpoint for run {self.run_id}")
+
+    @staticmethod
+    def list_runs(checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR) -> List[str]:
+        """Run ids with a checkpoint on disk, oldest first"""
+        if not os.path.isdir(checkpoint_dir):
+            return []
+        return sorted(
+            run_id for run_id in os.listdir(checkpoint_dir)
+            if os.path.exists(os.path.join(checkpoint_dir, run_id, 'manifest.json'))
+        )
+
+    @classmethod
+    def cleanup_stale(cls, max_age_days: float, checkpoint_dir: str = DEFAULT_CHECKPOINT_DIR) -> int:
+        """Delete checkpoints of abandoned runs older than max_age_days"""
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        for run_id in cls.list_runs(checkpoint_dir):
+            checkpoint = cls(run_id, checkpoint_dir)
+            if os.path.getmtime(checkpoint._manifest_path()) < cutoff:
+                checkpoint.cleanup()
+                removed += 1
+
+        if removed:
+            logger.info(f"Removed {removed} stale run checkpoint(s)")
+        return removed
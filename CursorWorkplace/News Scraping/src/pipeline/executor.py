@@ -0,0 +1,393 @@
+"""
+Concurrent Pipeline Executor
+Fetch threads, a sentiment process pool and a storage writer connected by bounded queues
+"""
+
+import os
+import time
+import queue
+import threading
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from loguru import logger
+
+from src.models.news_article import NewsArticle, NewsArticleWithSentiment
+from src.utils.metrics import MetricsSink, get_metrics_sink
+
+# End-of-stream marker passed down each queue
+_DONE = object()
+
+# Analyzer owned by each scoring process
+_worker_analyzer = None
+
+def score_articles(analyzer, articles: List[NewsArticle],
+                   target_company_sentences: bool = False) -> List[NewsArticleWithSentiment]:
+    """Score a batch of articles and pair each with its sentiment analyses"""
+    # Optionally score only the sentences that mention the matched company
+    search_terms = None
+    if target_company_sentences:
+        from config.companies import get_company_by_ticker
+
+        search_terms = []
+        for article in articles:
+            company = get_company_by_ticker(article.ticker) if article.ticker else None
+            search_terms.append(company['search_terms'] if company else None)
+
+    # Score the batch together so keywords are extracted once per article
+    batch_analyses = analyzer.analyze_articles(
+        [(article.title, article.content) for article in articles],
+        search_terms=search_terms
+    )
+
+    return [
+        NewsArticleWithSentiment(article=article, sentiment_analyses=sentiment_analyses)
+        for article, sentiment_analyses in zip(articles, batch_analyses)
+        if sentiment_analyses
+    ]
+
+def _init_score_worker():
+    """Build the per-process analyzer once, when the worker starts"""
+    global _worker_analyzer
+    from src.sentiment.sentiment_analyzer import SentimentAnalyzer
+
+    _worker_analyzer = SentimentAnalyzer()
+    # Workers never persist keyword statistics; the parent folds scored text in once
+    if _worker_analyzer.keyword_extractor:
+        _worker_analyzer.keyword_extractor.state_path = None
+
+def _score_batch(articles: List[NewsArticle],
+                 target_company_sentences: bool) -> Tuple[List[NewsArticleWithSentiment], float]:
+    """Process-pool task: scored articles plus the seconds spent scoring them"""
+    start = time.perf_counter()
+    scored = score_articles(_worker_analyzer, articles, target_company_sentences)
+    _worker_analyzer.instrumentation.flush()
+    return scored, time.perf_counter() - start
+
+class StageStats:
+    """Busy, starved and blocked time for one pipeline stage
+
+    busy is time spent doing the stage's work, starved is time waiting on an
+    empty input queue, and blocked is time waiting on a full output queue
+    (backpressure from the next stage).
+    """
+
+    def __init__(self, name: str, workers: int):
+        """Initialize empty counters"""
+        self.name = name
+        self.workers = workers
+        self.items = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.starved_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.max_queue_depth = 0
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def mark_started(self):
+        """Record when the stage began"""
+        self.started_at = datetime.utcnow()
+
+    def mark_finished(self):
+        """Record when the stage drained its input"""
+        self.finished_at = datetime.utcnow()
+
+    def add(self, items: int = 0, errors: int = 0, busy: float = 0.0, starved: float = 0.0, blocked: float = 0.0):
+        """Accumulate counters from any thread"""
+        with self._lock:
+            self.items += items
+            self.errors += errors
+            self.busy_seconds += busy
+            self.starved_seconds += starved
+            self.blocked_seconds += blocked
+
+    def observe_depth(self, depth: int):
+        """Track the deepest the stage's input queue got"""
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+
+    def utilization(self, wall_seconds: float) -> float:
+        """Fraction of the stage's worker capacity spent busy"""
+        capacity = wall_seconds * self.workers
+        return self.busy_seconds / capacity if capacity else 0.0
+
+    def to_dict(self, wall_seconds: float) -> Dict[str, Any]:
+        """Counters plus utilization for the run report"""
+        elapsed = (self.finished_at - self.started_at).total_seconds() if self.started_at and self.finished_at else 0.0
+        return {
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+            'elapsed_seconds': round(elapsed, 3),
+            'workers': self.workers,
+            'items': self.items,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'starved_seconds': round(self.starved_seconds, 3),
+            'blocked_seconds': round(self.blocked_seconds, 3),
+            'max_queue_depth': self.max_queue_depth,
+            'utilization': round(self.utilization(wall_seconds), 3)
+        }
+
+class ConcurrentPipeline:
+    """Scrape, score and store stages running at the same time
+
+    Feeds are fetched by a thread pool, matched articles are scored in a
+    process pool and a single writer thread stores scored batches. Stages
+    are joined by bounded queues, so a slow stage blocks the one before it
+    instead of letting work pile up in memory.
+    """
+
+    def __init__(self, fetch_workers: int = 8, score_workers: Optional[int] = None, queue_size: int = 8,
+                 score_batch_size: int = 32, store_batch_size: int = 200, flush_seconds: float = 5.0,
+                 feed_delay: float = 1.0, sink: Optional[MetricsSink] = None,
+                 score_task: Callable = _score_batch, score_initializer: Optional[Callable] = _init_score_worker):
+        """Initialize stage sizes, plus the picklable process-pool scoring task and worker initializer"""
+        self.fetch_workers = max(1, fetch_workers)
+        self.score_workers = max(1, score_workers or (os.cpu_count() or 2) - 1)
+        self.queue_size = max(1, queue_size)
+        self.score_batch_size = max(1, score_batch_size)
+        self.store_batch_size = max(1, store_batch_size)
+        self.flush_seconds = flush_seconds
+        self.feed_delay = feed_delay
+        self.sink = sink or get_metrics_sink()
+        self.score_task = score_task
+        self.score_initializer = score_initializer
+
+    @classmethod
+    def from_env(cls) -> 'ConcurrentPipeline':
+        """Build the executor from PIPELINE_* settings"""
+        score_workers = os.getenv('PIPELINE_SCORE_WORKERS')
+        return cls(
+            fetch_workers=int(os.getenv('PIPELINE_FETCH_WORKERS', '8')),
+            score_workers=int(score_workers) if score_workers else None,
+            queue_size=int(os.getenv('PIPELINE_QUEUE_SIZE', '8')),
+            score_batch_size=int(os.getenv('PIPELINE_SCORE_BATCH_SIZE', '32')),
+            store_batch_size=int(os.getenv('PIPELINE_STORE_BATCH_SIZE', '200')),
+            flush_seconds=float(os.getenv('PIPELINE_STORE_FLUSH_SECONDS', '5'))
+        )
+
+    def run(self, feeds: List[Dict[str, str]], fetch: Callable[[Dict[str, str]], List[NewsArticle]],
+            store: Callable[[List[NewsArticleWithSentiment]], bool],
+            on_scored: Optional[Callable[[List[NewsArticle]], None]] = None,
+            target_company_sentences: bool = False) -> Dict[str, Any]:
+        """Run all stages to completion and return per-stage counters
+
+        fetch returns the matched articles of one feed, store persists a
+        scored batch, and on_scored (optional) sees every article batch once
+        it has been scored, from the dispatching thread.
+        """
+        stats = {
+            'fetch': StageStats('fetch', self.fetch_workers),
+            'score': StageStats('score', self.score_workers),
+            'store': StageStats('store', 1)
+        }
+        score_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        store_queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        abort = threading.Event()
+        start = time.perf_counter()
+
+        writer = threading.Thread(target=self._store_stage, name='pipeline-store',
+                                  args=(store_queue, store, stats['store'], abort), daemon=True)
+        writer.start()
+
+        fetcher = threading.Thread(target=self._fetch_stage, name='pipeline-fetch',
+                                   args=(feeds, fetch, score_queue, stats['fetch'], stats['score'], abort), daemon=True)
+        fetcher.start()
+
+        try:
+            self._score_stage(score_queue, store_queue, stats['score'], stats['store'], on_scored,
+                              target_company_sentences, abort)
+        except Exception as e:
+            logger.error(f"Pipeline scoring stage failed: {e}")
+            stats['score'].add(errors=1)
+            abort.set()
+        finally:
+            self._put(store_queue, _DONE, None, None, abort, force=True)
+
+        fetcher.join()
+        writer.join()
+
+        wall_seconds = time.perf_counter() - start
+        return self._report(stats, wall_seconds)
+
+    def _put(self, target: queue.Queue, item, producer: Optional[StageStats], consumer: Optional[StageStats],
+             abort: threading.Event, force: bool = False) -> bool:
+        """Blocking put that counts backpressure and gives up once the run is aborted"""
+        start = time.perf_counter()
+        while True:
+            try:
+                target.put(item, timeout=0.5)
+                break
+            except queue.Full:
+                if abort.is_set() and not force:
+                    return False
+
+        if producer:
+            producer.add(blocked=time.perf_counter() - start)
+        if consumer:
+            consumer.observe_depth(target.qsize())
+        return True
+
+    def _fetch_stage(self, feeds: List[Dict[str, str]], fetch: Callable, score_queue: queue.Queue,
+                     fetch_stats: StageStats, score_stats: StageStats, abort: threading.Event):
+        """Fetch feeds on a thread pool and queue their matched articles for scoring"""
+        fetch_stats.mark_started()
+        def fetch_one(feed: Dict[str, str]):
+            if abort.is_set():
+                return
+
+            start = time.perf_counter()
+            try:
+                articles = fetch(feed)
+            except Exception as e:
+                logger.error(f"Failed to fetch feed {feed.get('name')}: {e}")
+                fetch_stats.add(errors=1, busy=time.perf_counter() - start)
+                return
+            fetch_stats.add(items=len(articles), busy=time.perf_counter() - start)
+
+            if articles:
+                self._put(score_queue, articles, fetch_stats, score_stats, abort)
+
+            # Stay polite to each feed host
+            time.sleep(self.feed_delay)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix='pipeline-fetch') as pool:
+                list(pool.map(fetch_one, feeds))
+        finally:
+            fetch_stats.mark_finished()
+            # After an abort nobody reads the score queue, so the marker may be dropped
+            self._put(score_queue, _DONE, None, None, abort)
+
+    def _score_stage(self, score_queue: queue.Queue, store_queue: queue.Queue, score_stats: StageStats,
+                     store_stats: StageStats, on_scored: Optional[Callable], target_company_sentences: bool,
+                     abort: threading.Event):
+        """Batch queued articles into process-pool tasks and forward results to the writer"""
+        score_stats.mark_started()
+        in_flight: Dict[Future, List[NewsArticle]] = {}
+        # At most two tasks per worker are queued; beyond that the dispatcher stops reading
+        max_in_flight = self.score_workers * 2
+        batch: List[NewsArticle] = []
+
+        def forward(block: bool):
+            if not in_flight:
+                return
+            waited = time.perf_counter()
+            done, _ = wait(list(in_flight), timeout=None if block else 0, return_when=FIRST_COMPLETED)
+            if block:
+                score_stats.add(blocked=time.perf_counter() - waited)
+
+            for future in done:
+                articles = in_flight.pop(future)
+                try:
+                    scored, seconds = future.result()
+                except Exception as e:
+                    logger.error(f"Scoring batch of {len(articles)} articles failed: {e}")
+                    score_stats.add(errors=1)
+                    continue
+
+                score_stats.add(items=len(articles), busy=seconds)
+                if on_scored:
+                    on_scored(articles)
+                if scored:
+                    self._put(store_queue, scored, score_stats, store_stats, abort)
+
+        def submit(articles: List[NewsArticle]):
+            while len(in_flight) >= max_in_flight:
+                forward(block=True)
+            in_flight[pool.submit(self.score_task, articles, target_company_sentences)] = articles
+
+        # Spawned workers do not inherit the fetch threads' locks
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=self.score_workers, mp_context=context,
+                                 initializer=self.score_initializer) as pool:
+            while not abort.is_set():
+                waited = time.perf_counter()
+                try:
+                    item = score_queue.get(timeout=0.1)
+                except queue.Empty:
+                    score_stats.add(starved=time.perf_counter() - waited)
+                    forward(block=False)
+                    continue
+                score_stats.add(starved=time.perf_counter() - waited)
+
+                if item is _DONE:
+                    break
+
+                batch.extend(item)
+                while len(batch) >= self.score_batch_size:
+                    submit(batch[:self.score_batch_size])
+                    batch = batch[self.score_batch_size:]
+                forward(block=False)
+
+            if batch:
+                submit(batch)
+            while in_flight:
+                forward(block=True)
+        score_stats.mark_finished()
+
+    def _store_stage(self, store_queue: queue.Queue, store: Callable, store_stats: StageStats,
+                     abort: threading.Event):
+        """Writer thread: accumulate scored articles and store them in batches"""
+        store_stats.mark_started()
+        pending: List[NewsArticleWithSentiment] = []
+
+        def flush():
+            if not pending:
+                return
+            start = time.perf_counter()
+            try:
+                stored = store(list(pending))
+            except Exception as e:
+                logger.error(f"Storing batch of {len(pending)} articles failed: {e}")
+                stored = False
+            # A failed batch counts as one error, never as stored items
+            if stored:
+                store_stats.add(items=len(pending), busy=time.perf_counter() - start)
+            else:
+                store_stats.add(errors=1, busy=time.perf_counter() - start)
+            pending.clear()
+
+        while True:
+            waited = time.perf_counter()
+            try:
+                item = store_queue.get(timeout=self.flush_seconds)
+            except queue.Empty:
+                item = None
+            store_stats.add(starved=time.perf_counter() - waited)
+
+            if item is _DONE:
+                break
+            if item:
+                pending.extend(item)
+
+            # Flush full batches, and partial ones whenever the queue runs dry
+            if len(pending) >= self.store_batch_size or item is None:
+                flush()
+
+        flush()
+        store_stats.mark_finished()
+
+    def _report(self, stats: Dict[str, StageStats], wall_seconds: float) -> Dict[str, Any]:
+        """Log per-stage utilization and push it to the metrics sink"""
+        stages = {name: stage.to_dict(wall_seconds) for name, stage in stats.items()}
+        bottleneck = max(stages, key=lambda name: stages[name]['utilization'])
+
+        for name, stage in stages.items():
+            tags = {'stage': name}
+            self.sink.record_timing('pipeline_stage_busy_seconds', stage['busy_seconds'], tags)
+            self.sink.record_timing('pipeline_stage_blocked_seconds', stage['blocked_seconds'], tags)
+            self.sink.increment('pipeline_stage_items', stage['items'], tags)
+            logger.info(
+                f"[pipeline] {name}: workers={stage['workers']} items={stage['items']} errors={stage['errors']} "
+                f"utilization={stage['utilization']:.0%} busy={stage['busy_seconds']:.1f}s "
+                f"starved={stage['starved_seconds']:.1f}s blocked={stage['blocked_seconds']:.1f}s "
+                f"max_queue_depth={stage['max_queue_depth']}"
+            )
+        logger.info(f"[pipeline] finished in {wall_seconds:.1f}s; busiest stage: {bottleneck}")
+        self.sink.flush('pipeline_')
+
+        return {'wall_seconds': round(wall_seconds, 3), 'bottleneck': bottleneck, 'stages': stages}
@@ -0,0 +1,141 @@
+"""
+Feed Partition Leases
+Expiring FEED_LEASES claims that let several worker nodes split the feeds between them
+"""
+
+import os
+import uuid
+import socket
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Set, Iterable
+from loguru import logger
+
+from src.database.storage_backend import StorageBackend
+
+def default_worker_id() -> str:
+    """host:pid, unique per worker process"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def partition_key(feed: Dict[str, str]) -> str:
+    """Lease partition of a feed (one partition per feed)"""
+    return feed['name']
+
+class FeedLeaseManager:
+    """Claims, renews and gives up one worker's feed partition leases
+
+    A claim is a compare-and-set UPDATE tagging free, expired or due
+    partitions with a fresh claim id, so at most one worker holds a
+    partition at a time. A heartbeat thread renews held leases; if a renewal
+    finds a partition re-claimed by another worker (because this one
+    stalled past the lease), the partition is marked lost and the worker
+    must stop writing its results.
+    """
+
+    def __init__(self, db_manager: StorageBackend, worker_id: Optional[str] = None,
+                 ttl_seconds: float = 300, renew_seconds: Optional[float] = None):
+        """Initialize with a storage backend this manager owns (its connection is used by the heartbeat)"""
+        self.db_manager = db_manager
+        self.worker_id = worker_id or default_worker_id()
+        self.ttl_seconds = ttl_seconds
+        self.renew_seconds = renew_seconds or ttl_seconds / 3
+        self.claim_id: Optional[str] = None
+        self.held: Set[str] = set()
+        self.lost: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop_heartbeat = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, db_manager: StorageBackend) -> 'FeedLeaseManager':
+        """Build from WORKER_ID and FEED_LEASE_TTL_SECONDS"""
+        return cls(db_manager, worker_id=os.getenv('WORKER_ID') or None,
+                   ttl_seconds=float(os.getenv('FEED_LEASE_TTL_SECONDS', '300')))
+
+    def sync_partitions(self, feeds: Iterable[Dict[str, str]]) -> bool:
+        """Make sure every feed has a lease row"""
+        return self.db_manager.ensure_feed_partitions(sorted({partition_key(feed) for feed in feeds}))
+
+    def claim(self, limit: int, due_before: datetime) -> List[str]:
+        """Claim up to limit partitions not completed since due_before; returns the ones now held"""
+        now = datetime.utcnow()
+        claim_id = uuid.uuid4().hex
+        claimed = self.db_manager.claim_feed_leases(
+            self.worker_id, claim_id, now, now + timedelta(seconds=self.ttl_seconds), due_before, limit
+        )
+
+        stolen = [f"{key} (from {previous})" for key, previous in claimed if previous and previous != self.worker_id]
+        if stolen:
+            logger.warning(f"Worker {self.worker_id} took over expired leases: {', '.join(stolen)}")
+
+        with self._lock:
+            self.claim_id = claim_id if claimed else None
+            self.held = {key for key, _ in claimed}
+            self.lost = set()
+
+        if claimed:
+            logger.info(f"Worker {self.worker_id} claimed {len(claimed)} feed partition(s): "
+                        f"{', '.join(sorted(self.held))}")
+        return sorted(self.held)
+
+    def renew(self) -> bool:
+        """Extend held leases; returns False once any partition has been lost"""
+        with self._lock:
+            claim_id, held = self.claim_id, set(self.held)
+        if not claim_id:
+            return True
+
+        now = datetime.utcnow()
+        still_held = self.db_manager.renew_feed_leases(claim_id, now, now + timedelta(seconds=self.ttl_seconds))
+        if still_held is None:
+            # Unreachable database: keep working; the lease stays valid until it expires
+            return self.holds_all()
+
+        lost = held - set(still_held)
+        if lost:
+            logger.error(f"Worker {self.worker_id} lost feed lease(s) to another worker: {', '.join(sorted(lost))}")
+            with self._lock:
+                self.lost |= lost
+                self.held -= lost
+        return self.holds_all()
+
+    def holds_all(self) -> bool:
+        """Whether every partition of the current claim is still held (the storage fence)"""
+        with self._lock:
+            return not self.lost
+
+    def _heartbeat_loop(self):
+        """Renew leases until stopped"""
+        while not self._stop_heartbeat.wait(self.renew_seconds):
+            try:
+                self.renew()
+            except Exception as e:
+                logger.error(f"Feed lease heartbeat error: {e}")
+
+    def start_heartbeat(self):
+        """Renew held leases in the background every renew_seconds"""
+        self._stop_heartbeat.clear()
+        self._heartbeat = threading.Thread(target=self._heartbeat_loop, name='feed-lease-heartbeat', daemon=True)
+        self._heartbeat.start()
+
+    def stop_heartbeat(self):
+        """Stop renewing"""
+        self._stop_heartbeat.set()
+        if self._heartbeat:
+            self._heartbeat.join()
+            self._heartbeat = None
+
+    def finish(self, completed: bool) -> bool:
+        """Give up every held partition, marking it completed (so it is not due again until the next interval)"""
+        with self._lock:
+            claim_id, held = self.claim_id, sorted(self.held)
+            self.claim_id, self.held = None, set()
+        if not claim_id:
+            return True
+
+        finished = self.db_manager.finish_feed_leases(
+            claim_id, held, self.worker_id, datetime.utcnow() if completed else None
+        )
+        logger.info(f"Worker {self.worker_id} {'completed' if completed else 'released'} "
+                    f"{len(held)} feed partition(s)")
+        return finished
@@ -0,0 +1,209 @@
+"""
+Pipeline Run History
+Per-run stage timings, item counts, throughput, errors and sampled peak memory
+"""
+
+import os
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+from loguru import logger
+
+DEFAULT_RUN_HISTORY_PATH = os.getenv('PIPELINE_RUN_HISTORY', 'logs/pipeline_runs.jsonl')
+
+class RssSampler:
+    """Samples this process's resident set size, and that of its worker processes, during one run
+
+    ru_maxrss and similar counters are process-lifetime peaks, so a
+    long-lived scheduler would report its largest run forever. A background
+    thread polls psutil instead and keeps the maxima seen since start().
+    """
+
+    def __init__(self, interval_seconds: float = 0.5):
+        """Initialize with the sampling interval"""
+        self.interval_seconds = interval_seconds
+        self.peak_rss_mb: Optional[float] = None
+        self.peak_worker_rss_mb: Optional[float] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._process = None
+
+    def sample(self):
+        """Fold the current RSS of this process and the sum over its children into the peaks"""
+        rss = self._process.memory_info().rss
+        workers = 0
+        for child in self._process.children(recursive=True):
+            try:
+                workers += child.memory_info().rss
+            except Exception:
+                # Exited between listing and reading
+                continue
+
+        self.peak_rss_mb = max(self.peak_rss_mb or 0.0, round(rss / (1024 * 1024), 1))
+        if workers:
+            self.peak_worker_rss_mb = max(self.peak_worker_rss_mb or 0.0, round(workers / (1024 * 1024), 1))
+
+    def _run(self):
+        """Sample until stopped"""
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.debug(f"RSS sample failed: {e}")
+                return
+
+    def start(self) -> bool:
+        """Take a first sample and keep sampling in the background; False without psutil"""
+        try:
+            import psutil
+        except ImportError:
+            logger.warning("psutil is not installed; pipeline runs will not record peak memory")
+            return False
+
+        self._process = psutil.Process()
+        self.sample()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        """Take a last sample and stop the thread"""
+        if not self._thread:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        try:
+            self.sample()
+        except Exception as e:
+            logger.debug(f"RSS sample failed: {e}")
+
+class PipelineRunRecorder:
+    """Collects stage timings and counts for one pipeline run attempt"""
+
+    def __init__(self, run_id: str, mode: str, resumed: bool = False,
+                 history_path: str = DEFAULT_RUN_HISTORY_PATH):
+        """Start recording a run"""
+        self.run_id = run_id
+        self.mode = mode
+        self.resumed = resumed
+        self.history_path = history_path
+        self.started_at = datetime.utcnow()
+        self.current_stage: Optional[str] = None
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._start = time.perf_counter()
+        self.rss_sampler = RssSampler(float(os.getenv('PIPELINE_RSS_SAMPLE_SECONDS', '0.5')))
+        self.rss_sampler.start()
+
+    def _stage(self, name: str) -> Dict[str, Any]:
+        """Counters for a stage, created on first use"""
+        return self.stages.setdefault(name, {
+            'started_at': None, 'finished_at': None, 'seconds': 0.0, 'items': 0, 'errors': 0
+        })
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a stage; an exception escaping the block counts as a stage error"""
+        stage = self._stage(name)
+        self.current_stage = name
+        started_at = datetime.utcnow()
+        stage['started_at'] = stage['started_at'] or started_at.isoformat()
+        start = time.perf_counter()
+        try:
+            yield stage
+        except Exception:
+            stage['errors'] += 1
+            raise
+        finally:
+            stage['seconds'] += time.perf_counter() - start
+            stage['finished_at'] = datetime.utcnow().isoformat()
+
+    def add_items(self, name: str, count: int):
+        """Count items a stage produced"""
+        self._stage(name)['items'] += count
+
+    def add_errors(self, name: str, count: int = 1):
+        """Count failures within a stage"""
+        self._stage(name)['errors'] += count
+
+    def merge_stage_report(self, report: Dict[str, Any]):
+        """Fold a ConcurrentPipeline report (overlapping stages) into the run"""
+        stages = report.get('stages', {})
+        for name, stats in stages.items():
+            stage = self._stage(name)
+            stage['items'] += stats['items']
+            stage['errors'] += stats['errors']
+            stage['started_at'] = min(filter(None, [stage['started_at'], stats.get('started_at')]), default=None)
+            stage['finished_at'] = max(filter(None, [stage['finished_at'], stats.get('finished_at')]), default=None)
+            stage['seconds'] += stats.get('elapsed_seconds', 0.0)
+            for key in ('workers', 'busy_seconds', 'utilization', 'max_queue_depth'):
+                stage[key] = stats.get(key)
+
+        # Stages overlap, so blame the first one that failed or came up empty
+        for name, stats in stages.items():
+            self.current_stage = name
+            if stats['errors'] or not stats['items']:
+                break
+
+    def finish(self, status: str, error_message: Optional[str] = None) -> Dict[str, Any]:
+        """Close the run and return its PIPELINE_RUNS row"""
+        duration = time.perf_counter() - self._start
+        self.rss_sampler.stop()
+        for stage in self.stages.values():
+            stage['seconds'] = round(stage['seconds'], 3)
+            stage['items_per_second'] = round(stage['items'] / stage['seconds'], 2) if stage['seconds'] else None
+
+        def items(name: str) -> int:
+            return self.stages.get(name, {}).get('items', 0)
+
+        return {
+            'run_id': self.run_id,
+            'started_at': self.started_at,
+            'finished_at': datetime.utcnow(),
+            'status': status,
+            'mode': self.mode,
+            'resumed': self.resumed,
+            'failed_stage': self.current_stage if status != 'succeeded' else None,
+            'duration_seconds': round(duration, 3),
+            'articles_scraped': items('fetch'),
+            'articles_scored': items('score'),
+            'articles_stored': items('store'),
+            'summaries_refreshed': items('summarize'),
+            'error_count': sum(stage['errors'] for stage in self.stages.values()),
+            'articles_per_second': round(items('store') / duration, 3) if duration else None,
+            'peak_rss_mb': self.rss_sampler.peak_rss_mb,
+            'peak_worker_rss_mb': self.rss_sampler.peak_worker_rss_mb,
+            'stages': self.stages,
+            'error_message': error_message[:1000] if error_message else None
+        }
+
+    def append_local(self, run: Dict[str, Any]) -> bool:
+        """Append the run to the local JSON Lines history (kept even when storage is down)"""
+        try:
+            os.makedirs(os.path.dirname(self.history_path) or '.', exist_ok=True)
+            with open(self.history_path, 'a', encoding='utf-8') as handle:
+                handle.write(json.dumps(run, default=str) + '\n')
+            return True
+        except Exception as e:
+            logger.error(f"Failed to append pipeline run to {self.history_path}: {e}")
+            return False
+
+def read_local_history(limit: int = 20, history_path: str = DEFAULT_RUN_HISTORY_PATH) -> List[Dict[str, Any]]:
+    """Most recent runs from the local history, newest first"""
+    if not os.path.exists(history_path):
+        return []
+
+    with open(history_path, 'r', encoding='utf-8') as handle:
+        lines = handle.readlines()[-limit:]
+
+    runs = []
+    for line in reversed(lines):
+        try:
+            runs.append(json.loads(line))
+        except ValueError:
+            continue
+    return runs
@@ -0,0 +1,96 @@
+"""
+Feed Worker
+Worker mode: repeatedly claim due feed partitions, run the pipeline on them and hand them back
+"""
+
+import os
+import re
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+from loguru import logger
+
+from src.pipeline.leases import FeedLeaseManager, partition_key
+
+class FeedWorker:
+    """Runs the pipeline on feed partitions leased from FEED_LEASES
+
+    Any number of workers can run against the same database: each cycle
+    claims up to partitions_per_claim feeds that are free (or whose lease
+    expired) and were not completed within feed_interval, so every feed is
+    processed by one worker per interval and throughput grows with workers.
+    """
+
+    def __init__(self, scraper, leases: FeedLeaseManager, partitions_per_claim: int = 2,
+                 feed_interval_minutes: float = 60, idle_seconds: float = 30):
+        """Initialize with a NewsSentimentScraper and this worker's lease manager"""
+        self.scraper = scraper
+        self.leases = leases
+        self.partitions_per_claim = max(1, partitions_per_claim)
+        self.feed_interval = timedelta(minutes=feed_interval_minutes)
+        self.idle_seconds = idle_seconds
+
+    @classmethod
+    def from_env(cls, scraper, leases: FeedLeaseManager) -> 'FeedWorker':
+        """Build from the WORKER_* and FEED_INTERVAL_MINUTES environment variables"""
+        return cls(
+            scraper, leases,
+            partitions_per_claim=int(os.getenv('WORKER_PARTITIONS_PER_CLAIM', '2')),
+            feed_interval_minutes=float(os.getenv('FEED_INTERVAL_MINUTES', '60')),
+            idle_seconds=float(os.getenv('WORKER_IDLE_SECONDS', '30'))
+        )
+
+    def run_id(self) -> str:
+        """Run id unique across workers (also used as the checkpoint directory name)"""
+        worker = re.sub(r'[^A-Za-z0-9]+', '-', self.leases.worker_id).strip('-')
+        return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{worker}"
+
+    def run_once(self) -> Optional[bool]:
+        """Claim due partitions and run the pipeline on them; None when nothing is due"""
+        keys = self.leases.claim(self.partitions_per_claim, datetime.utcnow() - self.feed_interval)
+        if not keys:
+            return None
+
+        feeds = [feed for feed in self.scraper.rss_scraper.rss_feeds if partition_key(feed) in keys]
+        succeeded = False
+        self.leases.start_heartbeat()
+        try:
+            succeeded = self.scraper.run_full_pipeline(run_id=self.run_id(), feeds=feeds,
+                                                       fence=self.leases.holds_all)
+        finally:
+            self.leases.stop_heartbeat()
+            # Failed or fenced-off partitions go straight back to the pool for another worker
+            succeeded = succeeded and self.leases.holds_all()
+            self.leases.finish(completed=succeeded)
+
+        return succeeded
+
+    def run(self, stop_event: Optional[threading.Event] = None, max_cycles: Optional[int] = None) -> int:
+        """Work until stopped (or after max_cycles pipeline runs); returns the number of runs"""
+        stop_event = stop_event or threading.Event()
+        cycles = 0
+
+        with self.leases.db_manager:
+            if not self.leases.db_manager.setup_database():
+                logger.error("Database setup failed; worker not started")
+                return 0
+            if not self.leases.sync_partitions(self.scraper.rss_scraper.rss_feeds):
+                logger.error("Could not register feed partitions; worker not started")
+                return 0
+
+            logger.info(f"Worker {self.leases.worker_id} started "
+                        f"({self.partitions_per_claim} partition(s) per claim, feeds due every {self.feed_interval})")
+
+            while not stop_event.is_set() and (max_cycles is None or cycles < max_cycles):
+                result = self.run_once()
+                if result is None:
+                    # Every feed is held by another worker or was completed recently
+                    stop_event.wait(self.idle_seconds)
+                    continue
+
+                cycles += 1
+                if not result:
+                    logger.warning(f"Worker {self.leases.worker_id} run failed; its partitions were released")
+                    stop_event.wait(self.idle_seconds)
+
+        return cycles
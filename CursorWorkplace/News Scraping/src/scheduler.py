@@ -15,6 +15,9 @@ from dotenv import load_dotenv
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.main import NewsSentimentScraper
+from src.database.storage_backend import get_storage_backend
+from src.pipeline.leases import FeedLeaseManager
+from src.pipeline.worker import FeedWorker
 
 # Load environment variables
 load_dotenv()
@@ -65,12 +68,22 @@ class NewsSentimentScheduler:
         
         print(f"✅ Daily job scheduled for {self.daily_run_time} {self.timezone}")
     
+    def run_weekly_job(self):
+        """Weekly scrape, then the content retention job"""
+        self.run_scraping_job()
+        self.run_retention_job()
+    
     def setup_weekly_job(self):
-        """Setup weekly scraping job"""
+        """Setup weekly scraping job, followed by content retention
+        
+        Retention is chained after the scrape rather than given its own cron
+        time, so it always starts once the weekly run has finished (an hour
+        offset from a 23:00 run would wrap to midnight of the same day).
+        """
         hour, minute = self.daily_run_time.split(':')
         
         self.scheduler.add_job(
-            func=self.run_scraping_job,
+            func=self.run_weekly_job,
             trigger=CronTrigger(
                 day_of_week=self.weekly_run_day.lower()[:3],
                 hour=int(hour),
@@ -81,7 +94,14 @@ class NewsSentimentScheduler:
             replace_existing=True
         )
         
-        print(f"✅ Weekly job scheduled for {self.weekly_run_day}s at {self.daily_run_time} {self.timezone}")
+        print(f"✅ Weekly job (scrape, then content retention) scheduled for "
+              f"{self.weekly_run_day}s at {self.daily_run_time} {self.timezone}")
+    
+    def run_retention_job(self):
+        """Archive old article content out of the hot table"""
+        print(f"[{datetime.now()}] Starting article content retention job...")
+        archived = self.scraper.archive_old_content()
+        print(f"[{datetime.now()}] ✅ Archived content of {archived} articles")
     
     def setup_hourly_job(self):
         """Setup hourly scraping job (for testing)"""
@@ -100,6 +120,29 @@ class NewsSentimentScheduler:
         print("🚀 Running scraping job immediately...")
         self.run_scraping_job()
     
+    def run_worker(self):
+        """Worker mode: process feed partitions leased from FEED_LEASES until stopped
+        
+        Start one worker per node (or several per node); they split the feeds
+        between them instead of each running the full daily job.
+        """
+        # The lease manager gets its own backend so the heartbeat never shares the pipeline's session
+        leases = FeedLeaseManager.from_env(get_storage_backend())
+        worker = FeedWorker.from_env(self.scraper, leases)
+        
+        print("=== Fortune 100 News Sentiment Worker ===")
+        print(f"Worker id: {leases.worker_id}")
+        print(f"Lease TTL: {leases.ttl_seconds:.0f}s, feeds due every {worker.feed_interval}")
+        print("\n👷 Worker started. Press Ctrl+C to stop.")
+        
+        try:
+            runs = worker.run()
+            print(f"\n⏹️ Worker stopped after {runs} run(s).")
+        except KeyboardInterrupt:
+            print("\n⏹️ Worker stopped by user; held leases were released.")
+        except Exception as e:
+            print(f"\n❌ Worker error: {e}")
+    
     def start_scheduler(self, run_immediately: bool = False):
         """Start the scheduler"""
         print("=== Fortune 100 News Sentiment Scheduler ===")
@@ -152,6 +195,11 @@ def main():
         action='store_true',
         help='Enable hourly jobs for testing'
     )
+    parser.add_argument(
+        '--worker',
+        action='store_true',
+        help='Run as a lease-coordinated worker instead of the cron schedule (start one per node)'
+    )
     
     args = parser.parse_args()
     
@@ -161,7 +209,10 @@ def main():
     
     # Initialize and start scheduler
     scheduler = NewsSentimentScheduler()
-    scheduler.start_scheduler(run_immediately=args.run_now)
+    if args.worker:
+        scheduler.run_worker()
+    else:
+        scheduler.start_scheduler(run_immediately=args.run_now)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
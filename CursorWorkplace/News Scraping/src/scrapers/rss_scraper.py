@@ -200,11 +200,11 @@ class RSSScraper:
         
         return articles
     
-    def scrape_all_feeds(self) -> List[NewsArticle]:
-        """Scrape all RSS feeds"""
+    def scrape_all_feeds(self, feeds: Optional[List[Dict[str, str]]] = None) -> List[NewsArticle]:
+        """Scrape all RSS feeds (or just the given ones; an empty list scrapes nothing)"""
         all_articles = []
         
-        for feed in self.rss_feeds:
+        for feed in feeds if feeds is not None else self.rss_feeds:
             articles = self.scrape_feed(feed['url'], feed['name'])
             all_articles.extend(articles)
             
@@ -236,12 +236,12 @@ class RSSScraper:
         logger.info(f"Matched {len(matched_articles)} articles to companies")
         return matched_articles
     
-    def scrape_and_match(self) -> List[NewsArticle]:
-        """Scrape RSS feeds and match articles to companies"""
+    def scrape_and_match(self, feeds: Optional[List[Dict[str, str]]] = None) -> List[NewsArticle]:
+        """Scrape RSS feeds (all, or just the given ones) and match articles to companies"""
         logger.info("Starting RSS feed scraping...")
         
         # Scrape all feeds
-        articles = self.scrape_all_feeds()
+        articles = self.scrape_all_feeds(feeds)
         
         # Match articles to companies
         matched_articles = self.match_articles_to_companies(articles)
@@ -0,0 +1,93 @@
+"""
+Sentiment Instrumentation
+Hot-path timers, call counts, text-length histograms and sampled profiling
+"""
+
+import os
+import io
+import time
+import random
+import pstats
+import cProfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional
+from loguru import logger
+
+from src.utils.metrics import MetricsSink, get_metrics_sink, TEXT_LENGTH_BUCKETS
+
+class SentimentInstrumentation:
+    """Per-engine and per-step instrumentation for SentimentAnalyzer
+
+    Timers cost two perf_counter() calls and a dict update, so they are
+    left on by default. cProfile only runs for a sampled fraction of batches.
+    """
+
+    def __init__(self, sink: Optional[MetricsSink] = None, profile_sample_rate: float = 0.0,
+                 profile_dir: str = 'logs/profiles'):
+        """Initialize instrumentation with a metrics sink"""
+        self.sink = sink or get_metrics_sink()
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_dir = profile_dir
+        self._profiling = False
+
+    @classmethod
+    def from_env(cls) -> 'SentimentInstrumentation':
+        """Build instrumentation from METRICS_SINK and SENTIMENT_PROFILE_* settings"""
+        return cls(
+            sink=get_metrics_sink(),
+            profile_sample_rate=float(os.getenv('SENTIMENT_PROFILE_SAMPLE_RATE', '0')),
+            profile_dir=os.getenv('SENTIMENT_PROFILE_DIR', 'logs/profiles')
+        )
+
+    @contextmanager
+    def timer(self, step: str, engine: Optional[str] = None):
+        """Time a step (clean_text, extract_keywords, engine, ...) and count calls"""
+        # Every step carries both labels; a metric's label names must not vary between samples
+        tags = {'step': step, 'engine': engine or ''}
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sink.record_timing('sentiment_step_seconds', time.perf_counter() - start, tags)
+            self.sink.increment('sentiment_step_calls', 1, tags)
+
+    def observe_text_length(self, length: int, kind: str = 'raw'):
+        """Add a text length to the length histogram"""
+        self.sink.observe('sentiment_text_length_chars', length, {'kind': kind}, TEXT_LENGTH_BUCKETS)
+
+    @contextmanager
+    def maybe_profile(self, label: str):
+        """Profile the enclosed block for a sampled fraction of calls"""
+        if (self._profiling or self.profile_sample_rate <= 0
+                or random.random() >= self.profile_sample_rate):
+            yield
+            return
+
+        profiler = cProfile.Profile()
+        self._profiling = True
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._profiling = False
+            self._write_profile(profiler, label)
+
+    def _write_profile(self, profiler: cProfile.Profile, label: str):
+        """Dump profile stats to disk and log the top functions"""
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            path = os.path.join(self.profile_dir, f"{label}_{datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')}.prof")
+            profiler.dump_stats(path)
+
+            summary = io.StringIO()
+            pstats.Stats(profiler, stream=summary).sort_stats('cumulative').print_stats(10)
+            logger.info(f"Sampled profile for {label} written to {path}\n{summary.getvalue()}")
+
+        except Exception as e:
+            logger.warning(f"Failed to write sampled profile for {label}: {e}")
+
+    def flush(self):
+        """Flush the sentiment metrics from the shared sink"""
+        self.sink.flush('sentiment_')
@@ -0,0 +1,156 @@
+"""
+Corpus-Level Keyword Extraction
+Incremental TF-IDF keyword extractor with hashed document frequencies on disk
+"""
+
+import os
+import re
+import tempfile
+from typing import List, Dict, Optional
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from sklearn.utils import murmurhash3_32
+from loguru import logger
+
+DEFAULT_STATE_PATH = os.getenv('KEYWORD_STATE_PATH', 'data/keyword_df.npz')
+
+TOKEN_PATTERN = re.compile(r'\b[a-z][a-z0-9\-\']+\b')
+
+class TfidfKeywordExtractor:
+    """Corpus-aware TF-IDF keyword extractor
+
+    Document frequencies are kept in a fixed-size array of hashed buckets, so
+    the on-disk state stays compact no matter how large the vocabulary grows.
+    """
+
+    def __init__(self, n_buckets: int = 2 ** 20, min_word_length: int = 3,
+                 state_path: Optional[str] = DEFAULT_STATE_PATH):
+        """Initialize an empty extractor"""
+        self.n_buckets = n_buckets
+        self.min_word_length = min_word_length
+        self.state_path = state_path
+        self.stop_words = frozenset(ENGLISH_STOP_WORDS)
+        self.doc_freq = np.zeros(n_buckets, dtype=np.uint32)
+        self.doc_count = 0
+
+    def tokenize(self, text: str) -> List[str]:
+        """Lowercase word tokens without stop words or short words"""
+        if not text:
+            return []
+
+        return [
+            token for token in TOKEN_PATTERN.findall(text.lower())
+            if len(token) >= self.min_word_length and token not in self.stop_words
+        ]
+
+    def _bucket(self, token: str) -> int:
+        """Stable hash bucket for a token (Python's hash() is salted per process)"""
+        return murmurhash3_32(token, positive=True) % self.n_buckets
+
+    def update(self, documents: List[List[str]]):
+        """Add tokenized documents to the corpus document frequencies"""
+        for tokens in documents:
+            if not tokens:
+                continue
+            buckets = np.fromiter({self._bucket(token) for token in tokens}, dtype=np.int64)
+            self.doc_freq[buckets] += 1
+            self.doc_count += 1
+
+    def extract_batch(self, texts: List[str], max_keywords: int = 10, update: bool = True) -> List[List[str]]:
+        """Top TF-IDF keywords for each text, scoring the batch as one sparse matrix"""
+        if not texts:
+            return []
+
+        documents = [self.tokenize(text) for text in texts]
+        if update:
+            self.update(documents)
+
+        # Build a batch-local vocabulary and a CSR term-count matrix
+        vocabulary: Dict[str, int] = {}
+        indices, indptr = [], [0]
+        for tokens in documents:
+            for token in tokens:
+                indices.append(vocabulary.setdefault(token, len(vocabulary)))
+            indptr.append(len(indices))
+
+        if not vocabulary:
+            return [[] for _ in texts]
+
+        counts = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(documents), len(vocabulary))
+        )
+        counts.sum_duplicates()
+
+        # Smoothed IDF from the persisted corpus statistics
+        terms = list(vocabulary)
+        buckets = np.fromiter((self._bucket(term) for term in terms), dtype=np.int64, count=len(terms))
+        idf = np.log((1.0 + self.doc_count) / (1.0 + self.doc_freq[buckets])) + 1.0
+
+        counts.data = np.log1p(counts.data)
+        scores = counts.multiply(idf.astype(np.float32)).tocsr()
+
+        keywords = []
+        for row in range(scores.shape[0]):
+            start, end = scores.indptr[row], scores.indptr[row + 1]
+            if start == end:
+                keywords.append([])
+                continue
+
+            row_scores = scores.data[start:end]
+            row_terms = scores.indices[start:end]
+            top = np.argsort(-row_scores, kind='stable')[:max_keywords]
+            keywords.append([terms[row_terms[i]] for i in top])
+
+        return keywords
+
+    def extract(self, text: str, max_keywords: int = 10) -> List[str]:
+        """Top keywords for a single text without updating corpus statistics"""
+        return self.extract_batch([text], max_keywords=max_keywords, update=False)[0]
+
+    def save(self, path: Optional[str] = None) -> bool:
+        """Atomically persist document frequencies as a compressed array"""
+        path = path or self.state_path
+        if not path:
+            return False
+
+        temp_path = None
+        try:
+            directory = os.path.dirname(path) or '.'
+            os.makedirs(directory, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(dir=directory, suffix='.tmp', delete=False) as handle:
+                temp_path = handle.name
+                np.savez_compressed(
+                    handle,
+                    doc_freq=self.doc_freq,
+                    doc_count=np.array([self.doc_count], dtype=np.int64),
+                    n_buckets=np.array([self.n_buckets], dtype=np.int64)
+                )
+
+            os.replace(temp_path, path)
+            logger.debug(f"Saved keyword document frequencies ({self.doc_count} documents) to {path}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save keyword state to {path}: {e}")
+            # The previous state file is untouched; drop the partial write
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_STATE_PATH) -> 'TfidfKeywordExtractor':
+        """Load persisted state, or start an empty corpus if none exists"""
+        if not path or not os.path.exists(path):
+            return cls(state_path=path)
+
+        with np.load(path) as state:
+            extractor = cls(n_buckets=int(state['n_buckets'][0]), state_path=path)
+            extractor.doc_freq = state['doc_freq'].astype(np.uint32)
+            extractor.doc_count = int(state['doc_count'][0])
+
+        logger.info(f"Loaded keyword document frequencies for {extractor.doc_count} documents")
+        return extractor
@@ -0,0 +1,195 @@
+"""
+Linear Sentiment Model
+Hashing-vectorizer + linear classifier trained locally on consensus labels
+"""
+
+import os
+import glob
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
+import joblib
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from loguru import logger
+
+from src.models.news_article import SentimentLabel
+
+# Bump when the on-disk artifact layout changes
+MODEL_FORMAT_VERSION = 1
+
+DEFAULT_MODEL_DIR = os.getenv('LINEAR_SENTIMENT_MODEL_DIR', 'models')
+MODEL_FILE_PREFIX = 'linear_sentiment_v'
+MODEL_FILE_SUFFIX = '.joblib'
+
+class LinearSentimentModel:
+    """Hashing-vectorizer linear sentiment model
+
+    Weights are kept as a dense (n_features, n_classes) matrix so scoring a
+    batch is a single sparse-matrix product: X @ W + b.
+    """
+
+    CLASSES = [SentimentLabel.NEGATIVE.value, SentimentLabel.NEUTRAL.value, SentimentLabel.POSITIVE.value]
+
+    def __init__(self, n_features: int = 2 ** 18, ngram_range: Tuple[int, int] = (1, 2)):
+        """Initialize an untrained model"""
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.vectorizer = self._build_vectorizer()
+        self.weights = None
+        self.intercept = None
+        self.classes = list(self.CLASSES)
+        self.model_version = None
+        self.metadata: Dict[str, Any] = {}
+
+    def _build_vectorizer(self) -> HashingVectorizer:
+        """Create the stateless vectorizer for the current settings"""
+        return HashingVectorizer(
+            n_features=self.n_features,
+            ngram_range=self.ngram_range,
+            alternate_sign=False,
+            norm='l2',
+            lowercase=True,
+            dtype=np.float32
+        )
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether weights are available for scoring"""
+        return self.weights is not None
+
+    def fit(self, texts: List[str], labels: List[str], epochs: int = 20) -> Dict[str, Any]:
+        """Train on texts and consensus labels, returning training metadata"""
+        if len(texts) != len(labels):
+            raise ValueError("texts and labels must have the same length")
+
+        present = set(labels)
+        if not present.issubset(self.CLASSES) or len(present) < 2:
+            raise ValueError(f"Need at least two of {self.CLASSES} in labels, got {sorted(present)}")
+
+        X = self.vectorizer.transform(texts)
+
+        classifier = SGDClassifier(
+            loss='log_loss',
+            alpha=1e-5,
+            max_iter=epochs,
+            tol=1e-4,
+            class_weight='balanced',
+            random_state=42
+        )
+        classifier.fit(X, labels)
+
+        # Expand to the fixed class order so missing classes score -inf-ish
+        weights = np.zeros((self.n_features, len(self.classes)), dtype=np.float32)
+        intercept = np.full(len(self.classes), -1e3, dtype=np.float32)
+        coef = classifier.coef_
+        fitted_classes = list(classifier.classes_)
+
+        if len(fitted_classes) == 2:
+            # Binary SGD stores a single row for the second class; a zero row
+            # for the first keeps softmax equal to the fitted sigmoid
+            coef = np.vstack([np.zeros_like(coef[0]), coef[0]])
+            fitted_intercept = np.array([0.0, classifier.intercept_[0]])
+        else:
+            fitted_intercept = classifier.intercept_
+
+        for row, label in enumerate(fitted_classes):
+            column = self.classes.index(label)
+            weights[:, column] = coef[row]
+            intercept[column] = fitted_intercept[row]
+
+        self.weights = weights
+        self.intercept = intercept
+        self.model_version = datetime.utcnow().strftime('%Y%m%dT%H%M%S')
+        self.metadata = {
+            'trained_at': datetime.utcnow().isoformat(),
+            'training_samples': len(texts),
+            'label_counts': {label: labels.count(label) for label in self.classes},
+            'epochs': epochs
+        }
+
+        logger.info(f"Trained linear sentiment model {self.model_version} on {len(texts)} samples")
+        return self.metadata
+
+    def decision_function(self, texts: List[str]) -> np.ndarray:
+        """Raw per-class scores for a batch of texts"""
+        if not self.is_trained:
+            raise RuntimeError("Linear sentiment model is not trained")
+
+        X = self.vectorizer.transform(texts)
+        return np.asarray(X @ self.weights) + self.intercept
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """Softmax-normalised class probabilities for a batch of texts"""
+        scores = self.decision_function(texts)
+        scores -= scores.max(axis=1, keepdims=True)
+        exp_scores = np.exp(scores)
+        return exp_scores / exp_scores.sum(axis=1, keepdims=True)
+
+    def score_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Score a batch, returning a polarity in [-1, 1] plus class probabilities"""
+        if not texts:
+            return []
+
+        probabilities = self.predict_proba(texts)
+        negative = self.classes.index(SentimentLabel.NEGATIVE.value)
+        positive = self.classes.index(SentimentLabel.POSITIVE.value)
+
+        results = []
+        for row in probabilities:
+            score = float(np.clip(row[positive] - row[negative], -1.0, 1.0))
+            results.append({
+                'score': score,
+                'confidence': float(row.max()),
+                'probabilities': {label: float(p) for label, p in zip(self.classes, row)}
+            })
+
+        return results
+
+    def save(self, output_dir: str = DEFAULT_MODEL_DIR) -> str:
+        """Write a versioned model artifact and return its path"""
+        if not self.is_trained:
+            raise RuntimeError("Cannot save an untrained model")
+
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, f"{MODEL_FILE_PREFIX}{self.model_version}{MODEL_FILE_SUFFIX}")
+
+        joblib.dump({
+            'format_version': MODEL_FORMAT_VERSION,
+            'model_version': self.model_version,
+            'n_features': self.n_features,
+            'ngram_range': self.ngram_range,
+            'classes': self.classes,
+            'weights': self.weights,
+            'intercept': self.intercept,
+            'metadata': self.metadata
+        }, path, compress=3)
+
+        logger.info(f"Saved linear sentiment model to {path}")
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'LinearSentimentModel':
+        """Load a model artifact written by save()"""
+        payload = joblib.load(path)
+
+        format_version = payload.get('format_version')
+        if format_version != MODEL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported model format version {format_version} in {path}")
+
+        model = cls(n_features=payload['n_features'], ngram_range=payload['ngram_range'])
+        model.classes = list(payload['classes'])
+        model.weights = payload['weights']
+        model.intercept = payload['intercept']
+        model.model_version = payload['model_version']
+        model.metadata = payload.get('metadata', {})
+
+        logger.info(f"Loaded linear sentiment model {model.model_version} from {path}")
+        return model
+
+def find_latest_model(model_dir: str = DEFAULT_MODEL_DIR) -> Optional[str]:
+    """Return the newest versioned model artifact in a directory"""
+    pattern = os.path.join(model_dir, f"{MODEL_FILE_PREFIX}*{MODEL_FILE_SUFFIX}")
+    candidates = sorted(glob.glob(pattern))
+    return candidates[-1] if candidates else None
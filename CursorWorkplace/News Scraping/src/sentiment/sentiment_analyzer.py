@@ -3,9 +3,10 @@ Sentiment Analysis Engine
 Combines multiple sentiment analysis libraries for robust analysis
 """
 
+import os
 import re
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from textblob import TextBlob
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
@@ -18,15 +19,46 @@ from src.models.news_article import (
     SentimentEngine, 
     SentimentLabel
 )
+from src.sentiment.instrumentation import SentimentInstrumentation
+
+DEFAULT_ENGINES = [SentimentEngine.TEXTBLOB, SentimentEngine.VADER, SentimentEngine.NLTK]
+
+# Sentences on each side of a company mention to include in targeted scoring
+DEFAULT_SENTENCE_WINDOW = int(os.getenv('SENTIMENT_SENTENCE_WINDOW', '1'))
+
+SENTENCE_PATTERN = re.compile(r'[^.!?]+(?:[.!?]+|$)')
+
+# Batches folded into the keyword statistics between saves (also saved at the end of a run)
+KEYWORD_SAVE_BATCHES = max(1, int(os.getenv('KEYWORD_SAVE_BATCHES', '20')))
+
+def get_configured_engines() -> List[SentimentEngine]:
+    """Read the engine list from SENTIMENT_ENGINES, falling back to the defaults"""
+    configured = os.getenv('SENTIMENT_ENGINES')
+    if not configured:
+        return list(DEFAULT_ENGINES)
+    
+    engines = []
+    for name in configured.split(','):
+        try:
+            engines.append(SentimentEngine(name.strip().lower()))
+        except ValueError:
+            logger.warning(f"Ignoring unknown engine in SENTIMENT_ENGINES: {name}")
+    
+    return engines or list(DEFAULT_ENGINES)
 
 class SentimentAnalyzer:
     """Multi-engine sentiment analyzer"""
     
-    def __init__(self):
+    def __init__(self, linear_model_path: Optional[str] = None,
+                 instrumentation: Optional[SentimentInstrumentation] = None):
         """Initialize sentiment analyzers"""
+        self.instrumentation = instrumentation or SentimentInstrumentation.from_env()
         self.textblob_analyzer = None
         self.vader_analyzer = SentimentIntensityAnalyzer()
         self.nltk_analyzer = None
+        self.linear_model = None
+        self.keyword_extractor = None
+        self.unsaved_keyword_batches = 0
         
         # Download required NLTK data
         try:
@@ -35,12 +67,43 @@ class SentimentAnalyzer:
             self.nltk_analyzer = NLTKSentimentIntensityAnalyzer()
         except Exception as e:
             logger.warning(f"Failed to initialize NLTK analyzer: {e}")
+        
+        self.load_linear_model(linear_model_path)
+        
+        # Corpus-level keyword statistics persisted across runs
+        try:
+            from src.sentiment.keyword_extractor import TfidfKeywordExtractor
+            self.keyword_extractor = TfidfKeywordExtractor.load()
+        except Exception as e:
+            logger.warning(f"Failed to initialize TF-IDF keyword extractor, using word frequency: {e}")
+    
+    def load_linear_model(self, path: Optional[str] = None) -> bool:
+        """Load the locally trained linear model (explicit path, env, or latest artifact)"""
+        try:
+            from src.sentiment.linear_model import LinearSentimentModel, find_latest_model
+            
+            path = path or os.getenv('LINEAR_SENTIMENT_MODEL_PATH') or find_latest_model()
+            if not path:
+                return False
+            
+            self.linear_model = LinearSentimentModel.load(path)
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Failed to load linear sentiment model: {e}")
+            self.linear_model = None
+            return False
     
     def clean_text(self, text: str) -> str:
         """Clean and preprocess text for sentiment analysis"""
         if not text:
             return ""
         
+        with self.instrumentation.timer('clean_text'):
+            return self._clean_text(text)
+    
+    def _clean_text(self, text: str) -> str:
+        """Regex cleanup behind clean_text"""
         # Remove HTML tags
         text = re.sub(r'<[^>]+>', '', text)
         
@@ -60,7 +123,15 @@ class SentimentAnalyzer:
         if not text:
             return []
         
-        # Simple keyword extraction based on frequency
+        with self.instrumentation.timer('extract_keywords'):
+            if self.keyword_extractor:
+                return self.keyword_extractor.extract(text, max_keywords)
+            
+            return self._extract_frequency_keywords(text, max_keywords)
+    
+    def _extract_frequency_keywords(self, text: str, max_keywords: int) -> List[str]:
+        """Word-frequency keywords, used when no TF-IDF state is available"""
+        # Fall back to simple keyword extraction based on frequency
         words = re.findall(r'\b\w+\b', text.lower())
         
         # Remove common stop words
@@ -81,7 +152,7 @@ class SentimentAnalyzer:
         keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
         return [word for word, freq in keywords[:max_keywords]]
     
-    def analyze_with_textblob(self, text: str) -> Optional[SentimentAnalysis]:
+    def analyze_with_textblob(self, text: str, keywords: Optional[List[str]] = None) -> Optional[SentimentAnalysis]:
         """Analyze sentiment using TextBlob"""
         try:
             if not text:
@@ -103,8 +174,9 @@ class SentimentAnalyzer:
             else:
                 sentiment_label = SentimentLabel.NEUTRAL
             
-            # Extract keywords
-            keywords = self.extract_keywords(cleaned_text)
+            # Extract keywords unless the caller already did
+            if keywords is None:
+                keywords = self.extract_keywords(cleaned_text)
             
             return SentimentAnalysis(
                 engine=SentimentEngine.TEXTBLOB,
@@ -122,7 +194,7 @@ class SentimentAnalyzer:
             logger.error(f"TextBlob analysis failed: {e}")
             return None
     
-    def analyze_with_vader(self, text: str) -> Optional[SentimentAnalysis]:
+    def analyze_with_vader(self, text: str, keywords: Optional[List[str]] = None) -> Optional[SentimentAnalysis]:
         """Analyze sentiment using VADER"""
         try:
             if not text:
@@ -143,8 +215,9 @@ class SentimentAnalyzer:
             else:
                 sentiment_label = SentimentLabel.NEUTRAL
             
-            # Extract keywords
-            keywords = self.extract_keywords(cleaned_text)
+            # Extract keywords unless the caller already did
+            if keywords is None:
+                keywords = self.extract_keywords(cleaned_text)
             
             return SentimentAnalysis(
                 engine=SentimentEngine.VADER,
@@ -164,7 +237,7 @@ class SentimentAnalyzer:
             logger.error(f"VADER analysis failed: {e}")
             return None
     
-    def analyze_with_nltk(self, text: str) -> Optional[SentimentAnalysis]:
+    def analyze_with_nltk(self, text: str, keywords: Optional[List[str]] = None) -> Optional[SentimentAnalysis]:
         """Analyze sentiment using NLTK"""
         try:
             if not text or not self.nltk_analyzer:
@@ -185,8 +258,9 @@ class SentimentAnalyzer:
             else:
                 sentiment_label = SentimentLabel.NEUTRAL
             
-            # Extract keywords
-            keywords = self.extract_keywords(cleaned_text)
+            # Extract keywords unless the caller already did
+            if keywords is None:
+                keywords = self.extract_keywords(cleaned_text)
             
             return SentimentAnalysis(
                 engine=SentimentEngine.NLTK,
@@ -206,27 +280,88 @@ class SentimentAnalyzer:
             logger.error(f"NLTK analysis failed: {e}")
             return None
     
-    def analyze_text(self, text: str, engines: List[SentimentEngine] = None) -> List[SentimentAnalysis]:
+    def analyze_with_linear(self, text: str, keywords: Optional[List[str]] = None) -> Optional[SentimentAnalysis]:
+        """Analyze sentiment using the locally trained linear model"""
+        results = self.analyze_batch_with_linear([text], None if keywords is None else [keywords])
+        return results[0] if results else None
+    
+    def analyze_batch_with_linear(self, texts: List[str],
+                                  keywords: Optional[List[List[str]]] = None) -> List[Optional[SentimentAnalysis]]:
+        """Analyze a batch of texts with one sparse-matrix product"""
+        try:
+            if not texts or not self.linear_model:
+                return [None] * len(texts or [])
+            
+            cleaned_texts = [self.clean_text(text) if text else "" for text in texts]
+            positions = [i for i, cleaned in enumerate(cleaned_texts) if cleaned]
+            
+            results: List[Optional[SentimentAnalysis]] = [None] * len(texts)
+            if not positions:
+                return results
+            
+            scores = self.linear_model.score_batch([cleaned_texts[i] for i in positions])
+            
+            for i, scored in zip(positions, scores):
+                score = scored['score']
+                
+                # Determine sentiment label
+                if score > 0.1:
+                    sentiment_label = SentimentLabel.POSITIVE
+                elif score < -0.1:
+                    sentiment_label = SentimentLabel.NEGATIVE
+                else:
+                    sentiment_label = SentimentLabel.NEUTRAL
+                
+                results[i] = SentimentAnalysis(
+                    engine=SentimentEngine.LINEAR,
+                    sentiment_score=score,
+                    sentiment_label=sentiment_label,
+                    confidence_score=scored['confidence'],
+                    keywords=keywords[i] if keywords is not None else self.extract_keywords(cleaned_texts[i]),
+                    additional_data={
+                        **scored['probabilities'],
+                        'model_version': self.linear_model.model_version,
+                        'word_count': len(cleaned_texts[i].split())
+                    }
+                )
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Linear model analysis failed: {e}")
+            return [None] * len(texts)
+    
+    def analyze_text(self, text: str, engines: List[SentimentEngine] = None,
+                     keywords: Optional[List[str]] = None) -> List[SentimentAnalysis]:
         """Analyze text using multiple engines"""
         if not text:
             return []
         
         if engines is None:
-            engines = [SentimentEngine.TEXTBLOB, SentimentEngine.VADER, SentimentEngine.NLTK]
+            engines = get_configured_engines()
+        
+        self.instrumentation.observe_text_length(len(text))
+        
+        # Keywords are engine-independent, so extract them once per text
+        if keywords is None:
+            keywords = self.extract_keywords(self.clean_text(text))
         
         results = []
         
         for engine in engines:
             try:
-                if engine == SentimentEngine.TEXTBLOB:
-                    result = self.analyze_with_textblob(text)
-                elif engine == SentimentEngine.VADER:
-                    result = self.analyze_with_vader(text)
-                elif engine == SentimentEngine.NLTK:
-                    result = self.analyze_with_nltk(text)
-                else:
-                    logger.warning(f"Unknown sentiment engine: {engine}")
-                    continue
+                with self.instrumentation.timer('engine', engine.value):
+                    if engine == SentimentEngine.TEXTBLOB:
+                        result = self.analyze_with_textblob(text, keywords)
+                    elif engine == SentimentEngine.VADER:
+                        result = self.analyze_with_vader(text, keywords)
+                    elif engine == SentimentEngine.NLTK:
+                        result = self.analyze_with_nltk(text, keywords)
+                    elif engine == SentimentEngine.LINEAR:
+                        result = self.analyze_with_linear(text, keywords)
+                    else:
+                        logger.warning(f"Unknown sentiment engine: {engine}")
+                        continue
                 
                 if result:
                     results.append(result)
@@ -275,11 +410,198 @@ class SentimentAnalyzer:
             'neutral_votes': neutral_count
         }
     
-    def analyze_article(self, title: str, content: str = None, engines: List[SentimentEngine] = None) -> List[SentimentAnalysis]:
-        """Analyze a news article"""
+    def split_sentences(self, text: str) -> List[Tuple[int, int]]:
+        """Split text into (start, end) sentence offsets"""
+        spans = []
+        for match in SENTENCE_PATTERN.finditer(text):
+            start, end = match.span()
+            
+            # Trim surrounding whitespace so offsets point at the sentence itself
+            while start < end and text[start].isspace():
+                start += 1
+            while end > start and text[end - 1].isspace():
+                end -= 1
+            
+            if start < end:
+                spans.append((start, end))
+        
+        return spans
+    
+    def select_company_spans(self, title: str, content: Optional[str], search_terms: List[str],
+                             window: int = DEFAULT_SENTENCE_WINDOW) -> List[Tuple[int, int]]:
+        """Offsets of sentences mentioning the company, plus `window` neighbours each side
+        
+        Offsets index into the combined "title content" text. The title is
+        treated as its own sentence. Returns an empty list when no sentence
+        mentions the company.
+        """
+        terms = [term.lower() for term in search_terms if term]
+        if not terms:
+            return []
+        
+        sentences = [(0, len(title))]
+        if content:
+            offset = len(title) + 1
+            sentences.extend((offset + start, offset + end) for start, end in self.split_sentences(content))
+        
+        text = (title + " " + content) if content else title
+        lowered = text.lower()
+        
+        selected = set()
+        for index, (start, end) in enumerate(sentences):
+            sentence = lowered[start:end]
+            if any(term in sentence for term in terms):
+                selected.update(range(max(0, index - window), min(len(sentences), index + window + 1)))
+        
+        # Merge contiguous sentences into single spans
+        spans: List[Tuple[int, int]] = []
+        previous = None
+        for index in sorted(selected):
+            start, end = sentences[index]
+            if previous is not None and index == previous + 1:
+                spans[-1] = (spans[-1][0], end)
+            else:
+                spans.append((start, end))
+            previous = index
+        
+        return spans
+    
+    def _targeted_text(self, title: str, content: Optional[str], search_terms: Optional[List[str]],
+                       window: int) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Text to score for an article and the span metadata to record, if targeting applied"""
+        text = title
+        if content:
+            text += " " + content
+        
+        if not search_terms:
+            return text, None
+        
+        spans = self.select_company_spans(title, content, search_terms, window)
+        if not spans:
+            # Matched on something we could not localise; score the whole article
+            return text, None
+        
+        return " ".join(text[start:end] for start, end in spans), {
+            'scored_spans': [[start, end] for start, end in spans],
+            'sentence_window': window,
+            'scored_chars': sum(end - start for start, end in spans),
+            'total_chars': len(text)
+        }
+    
+    @staticmethod
+    def _attach_span_data(analyses: List[SentimentAnalysis], span_data: Optional[Dict[str, Any]]):
+        """Record targeted-scoring spans on each analysis"""
+        if not span_data:
+            return
+        
+        for analysis in analyses:
+            analysis.additional_data = {**(analysis.additional_data or {}), **span_data}
+    
+    def analyze_article(self, title: str, content: str = None, engines: List[SentimentEngine] = None,
+                        search_terms: Optional[List[str]] = None,
+                        window: int = DEFAULT_SENTENCE_WINDOW) -> List[SentimentAnalysis]:
+        """Analyze a news article
+        
+        When the matched company's search terms are given, only the sentences
+        mentioning the company (plus `window` neighbouring sentences) are scored,
+        and the scored offsets are recorded in additional_data['scored_spans'].
+        """
         # Combine title and content for analysis
         text = title
         if content:
             text += " " + content
         
-        return self.analyze_text(text, engines) 
\ No newline at end of file
+        if not search_terms:
+            return self.analyze_text(text, engines)
+        
+        targeted_text, span_data = self._targeted_text(title, content, search_terms, window)
+        
+        # Keywords still describe the whole article
+        keywords = self.extract_keywords(self.clean_text(text))
+        analyses = self.analyze_text(targeted_text, engines, keywords)
+        self._attach_span_data(analyses, span_data)
+        
+        return analyses
+    
+    def analyze_articles(self, articles: List[Tuple[str, Optional[str]]],
+                         engines: List[SentimentEngine] = None,
+                         search_terms: Optional[List[Optional[List[str]]]] = None,
+                         window: int = DEFAULT_SENTENCE_WINDOW) -> List[List[SentimentAnalysis]]:
+        """Analyze a batch of (title, content) pairs
+        
+        Keywords are scored for the whole batch against corpus document
+        frequencies, and the linear engine scores the batch in one call.
+        search_terms optionally holds per-article company terms for targeted
+        sentence-window scoring (see analyze_article).
+        """
+        if not articles:
+            return []
+        
+        if engines is None:
+            engines = get_configured_engines()
+        
+        if search_terms is None:
+            search_terms = [None] * len(articles)
+        
+        with self.instrumentation.maybe_profile('analyze_articles'):
+            return self._analyze_articles(articles, engines, search_terms, window)
+    
+    def record_corpus(self, articles: List[Tuple[str, Optional[str]]]) -> bool:
+        """Fold (title, content) pairs scored elsewhere into the persisted keyword document frequencies"""
+        if not self.keyword_extractor or not articles:
+            return False
+        
+        texts = [self.clean_text(title + (" " + content if content else "")) for title, content in articles]
+        self.keyword_extractor.update([self.keyword_extractor.tokenize(text) for text in texts])
+        self._keyword_batch_done()
+        return True
+    
+    def _keyword_batch_done(self):
+        """Count a batch folded into the keyword statistics, saving every KEYWORD_SAVE_BATCHES batches"""
+        self.unsaved_keyword_batches += 1
+        if self.unsaved_keyword_batches >= KEYWORD_SAVE_BATCHES:
+            self.save_keyword_state()
+    
+    def save_keyword_state(self) -> bool:
+        """Persist keyword document frequencies folded in since the last save (call at the end of a run)"""
+        if not self.keyword_extractor or not self.unsaved_keyword_batches:
+            return False
+        
+        if not self.keyword_extractor.save():
+            return False
+        self.unsaved_keyword_batches = 0
+        return True
+    
+    def _analyze_articles(self, articles: List[Tuple[str, Optional[str]]], engines: List[SentimentEngine],
+                          search_terms: List[Optional[List[str]]], window: int) -> List[List[SentimentAnalysis]]:
+        """Batch scoring body behind analyze_articles"""
+        texts = [title + (" " + content if content else "") for title, content in articles]
+        cleaned_texts = [self.clean_text(text) for text in texts]
+        targeted = [
+            self._targeted_text(title, content, terms, window)
+            for (title, content), terms in zip(articles, search_terms)
+        ]
+        score_texts = [targeted_text for targeted_text, _ in targeted]
+        
+        if self.keyword_extractor:
+            with self.instrumentation.timer('extract_keywords_batch'):
+                batch_keywords = self.keyword_extractor.extract_batch(cleaned_texts)
+            self._keyword_batch_done()
+        else:
+            batch_keywords = [self.extract_keywords(cleaned) for cleaned in cleaned_texts]
+        
+        per_text_engines = [engine for engine in engines if engine != SentimentEngine.LINEAR]
+        linear_results = [None] * len(texts)
+        if SentimentEngine.LINEAR in engines:
+            with self.instrumentation.timer('engine_batch', SentimentEngine.LINEAR.value):
+                linear_results = self.analyze_batch_with_linear(score_texts, batch_keywords)
+        
+        results = []
+        for text, keywords, linear_result, (_, span_data) in zip(score_texts, batch_keywords, linear_results, targeted):
+            analyses = self.analyze_text(text, per_text_engines, keywords) if per_text_engines else []
+            if linear_result:
+                analyses.append(linear_result)
+            self._attach_span_data(analyses, span_data)
+            results.append(analyses)
+        
+        return results
\ No newline at end of file
@@ -0,0 +1 @@
+# Utilities Package
\ No newline at end of file
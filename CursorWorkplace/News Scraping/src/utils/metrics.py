@@ -0,0 +1,228 @@
+"""
+Metrics Sinks
+Pluggable destinations for lightweight runtime timings, counters and histograms
+"""
+
+import os
+import bisect
+import threading
+from collections import defaultdict
+from typing import Dict, Any, Optional, Tuple, Sequence
+from loguru import logger
+
+Tags = Optional[Dict[str, str]]
+
+# Default histogram buckets (upper bounds)
+TIMING_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+TEXT_LENGTH_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+
+def _key(name: str, tags: Tags) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Hashable key for a metric name plus tags"""
+    return name, tuple(sorted(tags.items())) if tags else ()
+
+def _format_key(key: Tuple[str, Tuple[Tuple[str, str], ...]]) -> str:
+    """Readable name{tag=value} form of a metric key"""
+    name, tags = key
+    if not tags:
+        return name
+    return name + "{" + ",".join(f"{k}={v}" for k, v in tags) + "}"
+
+class MetricsSink:
+    """Base sink: accepts metrics and discards them"""
+
+    def record_timing(self, name: str, seconds: float, tags: Tags = None):
+        """Record a duration in seconds"""
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None):
+        """Increment a counter"""
+
+    def observe(self, name: str, value: float, tags: Tags = None,
+                buckets: Sequence[float] = TEXT_LENGTH_BUCKETS):
+        """Add a value to a histogram"""
+
+    def flush(self, prefix: Optional[str] = None):
+        """Emit or reset buffered metrics (only those whose names start with prefix, if given)
+
+        The sink is shared, so each subsystem flushes its own prefix and never
+        ends another subsystem's window.
+        """
+
+class InMemoryMetricsSink(MetricsSink):
+    """Aggregates metrics in process memory; cheap enough to leave on"""
+
+    def __init__(self):
+        """Initialize empty aggregates"""
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self, prefix: Optional[str] = None):
+        """Clear all aggregates, or only those of metrics whose names start with prefix"""
+        with self._lock:
+            if prefix is None:
+                self.timings: Dict[tuple, Dict[str, float]] = defaultdict(
+                    lambda: {'count': 0, 'total': 0.0, 'max': 0.0}
+                )
+                self.counters: Dict[tuple, int] = defaultdict(int)
+                self.histograms: Dict[tuple, Dict[str, Any]] = {}
+                return
+
+            for aggregates in (self.timings, self.counters, self.histograms):
+                for key in [key for key in aggregates if key[0].startswith(prefix)]:
+                    del aggregates[key]
+
+    def record_timing(self, name: str, seconds: float, tags: Tags = None):
+        """Record a duration in seconds"""
+        with self._lock:
+            stats = self.timings[_key(name, tags)]
+            stats['count'] += 1
+            stats['total'] += seconds
+            if seconds > stats['max']:
+                stats['max'] = seconds
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None):
+        """Increment a counter"""
+        with self._lock:
+            self.counters[_key(name, tags)] += value
+
+    def observe(self, name: str, value: float, tags: Tags = None,
+                buckets: Sequence[float] = TEXT_LENGTH_BUCKETS):
+        """Add a value to a histogram"""
+        with self._lock:
+            key = _key(name, tags)
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = {'buckets': tuple(buckets), 'counts': [0] * (len(buckets) + 1), 'sum': 0.0}
+                self.histograms[key] = histogram
+            histogram['counts'][bisect.bisect_left(histogram['buckets'], value)] += 1
+            histogram['sum'] += value
+
+    def snapshot(self, prefix: Optional[str] = None) -> Dict[str, Any]:
+        """Plain-dict copy of the current aggregates (only metrics whose names start with prefix, if given)"""
+        def selected(aggregates):
+            return [(key, value) for key, value in aggregates.items() if not prefix or key[0].startswith(prefix)]
+
+        with self._lock:
+            return {
+                'timings': {
+                    _format_key(key): {**stats, 'avg': stats['total'] / stats['count'] if stats['count'] else 0.0}
+                    for key, stats in selected(self.timings)
+                },
+                'counters': {_format_key(key): value for key, value in selected(self.counters)},
+                'histograms': {
+                    _format_key(key): {
+                        'buckets': list(histogram['buckets']) + ['+Inf'],
+                        'counts': list(histogram['counts']),
+                        'sum': histogram['sum']
+                    }
+                    for key, histogram in selected(self.histograms)
+                }
+            }
+
+class LogMetricsSink(InMemoryMetricsSink):
+    """Aggregates in memory and logs a summary on flush"""
+
+    def flush(self, prefix: Optional[str] = None):
+        """Log the aggregated metrics and start a new window (for metrics under prefix only, if given)"""
+        # Snapshot and reset together so samples recorded in between are not lost
+        with self._lock:
+            snapshot = self.snapshot(prefix)
+            self.reset(prefix)
+
+        timings = sorted(snapshot['timings'].items(), key=lambda item: item[1]['total'], reverse=True)
+        for name, stats in timings:
+            logger.info(
+                f"[metrics] {name}: calls={stats['count']} total={stats['total']:.3f}s "
+                f"avg={stats['avg'] * 1000:.2f}ms max={stats['max'] * 1000:.2f}ms"
+            )
+        for name, value in snapshot['counters'].items():
+            logger.info(f"[metrics] {name}: {value}")
+        for name, histogram in snapshot['histograms'].items():
+            buckets = ", ".join(f"<={b}: {c}" for b, c in zip(histogram['buckets'], histogram['counts']))
+            logger.info(f"[metrics] {name}: {buckets}")
+
+class PrometheusMetricsSink(MetricsSink):
+    """Exports metrics through prometheus_client (optional dependency)"""
+
+    def __init__(self, namespace: str = 'news_sentiment', port: Optional[int] = None):
+        """Initialize the sink, optionally starting an HTTP exporter"""
+        import prometheus_client
+
+        self._prometheus = prometheus_client
+        self.namespace = namespace
+        self._metrics: Dict[tuple, Tuple[Any, Tuple[str, ...]]] = {}
+        self._warned: set = set()
+        self._lock = threading.Lock()
+
+        if port:
+            prometheus_client.start_http_server(port)
+            logger.info(f"Prometheus metrics exporter listening on :{port}")
+
+    def _metric(self, kind: str, name: str, tags: Tags, **kwargs):
+        """Create (once) and return a labelled metric
+
+        Prometheus fixes a metric's label names at registration, so later
+        samples are normalized to them: missing labels become '' and unknown
+        ones are dropped with a warning.
+        """
+        tags = tags or {}
+        key = (kind, name)
+        with self._lock:
+            entry = self._metrics.get(key)
+            if entry is None:
+                label_names = tuple(sorted(tags))
+                metric_class = getattr(self._prometheus, kind)
+                metric = metric_class(name, name.replace('_', ' '), label_names,
+                                      namespace=self.namespace, **kwargs)
+                entry = self._metrics[key] = (metric, label_names)
+            metric, label_names = entry
+
+            unknown = set(tags) - set(label_names)
+            if unknown and (key, frozenset(unknown)) not in self._warned:
+                self._warned.add((key, frozenset(unknown)))
+                logger.warning(f"Dropping labels {sorted(unknown)} from {name}; "
+                               f"it is registered with {list(label_names)}")
+
+        if not label_names:
+            return metric
+        return metric.labels(**{label: str(tags.get(label, '')) for label in label_names})
+
+    def record_timing(self, name: str, seconds: float, tags: Tags = None):
+        """Record a duration in seconds"""
+        self._metric('Histogram', name, tags, buckets=TIMING_BUCKETS).observe(seconds)
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None):
+        """Increment a counter"""
+        self._metric('Counter', name, tags).inc(value)
+
+    def observe(self, name: str, value: float, tags: Tags = None,
+                buckets: Sequence[float] = TEXT_LENGTH_BUCKETS):
+        """Add a value to a histogram"""
+        self._metric('Histogram', name, tags, buckets=tuple(buckets)).observe(value)
+
+_sinks: Dict[str, MetricsSink] = {}
+_sinks_lock = threading.Lock()
+
+def get_metrics_sink(kind: Optional[str] = None) -> MetricsSink:
+    """Shared sink selected by METRICS_SINK (log, memory, prometheus, none)"""
+    kind = (kind or os.getenv('METRICS_SINK', 'log')).lower()
+
+    with _sinks_lock:
+        if kind in _sinks:
+            return _sinks[kind]
+
+        if kind == 'memory':
+            sink = InMemoryMetricsSink()
+        elif kind == 'prometheus':
+            try:
+                port = os.getenv('PROMETHEUS_PORT')
+                sink = PrometheusMetricsSink(port=int(port) if port else None)
+            except ImportError:
+                logger.warning("prometheus_client is not installed, falling back to log metrics sink")
+                sink = LogMetricsSink()
+        elif kind == 'none':
+            sink = MetricsSink()
+        else:
+            sink = LogMetricsSink()
+
+        _sinks[kind] = sink
+        return sink
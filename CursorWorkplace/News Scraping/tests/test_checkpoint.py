@@ -0,0 +1,183 @@
+"""
+Run Checkpoint Tests
+Stage outputs, completion markers and stored keys of a run, and resuming a failed run with --resume
+"""
+
+import os
+import sys
+import time
+from datetime import date
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('pydantic')
+
+from src.pipeline.checkpoint import RunCheckpoint, article_key
+from src.models.news_article import (
+    NewsArticle, NewsArticleWithSentiment, SentimentAnalysis, SentimentEngine, SentimentLabel
+)
+
+def articles(count: int = 3, ticker: str = 'AAPL'):
+    """Articles matched to one company"""
+    return [NewsArticle(title=f"{ticker} story {i}", url=f"https://example.com/{ticker}/{i}", source='Reuters',
+                        ticker=ticker) for i in range(count)]
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    """New empty checkpoint"""
+    return RunCheckpoint.create('20260304T093000', str(tmp_path))
+
+def test_article_key_falls_back_to_source_and_title():
+    """Articles without a url are keyed by source and title"""
+    assert article_key(articles(1)[0]) == 'https://example.com/AAPL/0'
+    assert article_key(NewsArticle(title='Untitled', source='Reuters')) == 'Reuters:Untitled'
+
+def test_complete_is_idempotent_and_ordered(checkpoint):
+    """Stages are marked once and the furthest finished stage follows pipeline order"""
+    assert checkpoint.exists()
+    assert checkpoint.last_completed_stage() is None
+
+    checkpoint.complete('scored')
+    checkpoint.complete('scraped')
+    checkpoint.complete('scored')
+
+    assert checkpoint.manifest()['completed'] == ['scored', 'scraped']
+    assert checkpoint.is_complete('scraped') and not checkpoint.is_complete('stored')
+    assert checkpoint.last_completed_stage() == 'scored'
+
+    # A reopened checkpoint sees the same state
+    reopened = RunCheckpoint(checkpoint.run_id, os.path.dirname(checkpoint.path))
+    assert reopened.last_completed_stage() == 'scored'
+
+def test_stage_records_are_deduplicated_and_survive_torn_writes(checkpoint):
+    """Re-appended articles read back once and a record cut off by a crash is skipped"""
+    batch = articles()
+    checkpoint.append('scraped', batch[:2])
+    with open(checkpoint._stage_path('scraped'), 'a', encoding='utf-8') as handle:
+        handle.write('{"title": "torn')
+    checkpoint.append('scraped', batch[1:])
+
+    assert [article.url for article in checkpoint.scraped_articles()] == [article.url for article in batch]
+
+    scored = [NewsArticleWithSentiment(article=article, sentiment_analyses=[
+        SentimentAnalysis(engine=SentimentEngine.VADER, sentiment_score=0.5, sentiment_label=SentimentLabel.POSITIVE)
+    ]) for article in batch]
+    checkpoint.append('scored', scored)
+    assert [item.sentiment_analyses[0].sentiment_score for item in checkpoint.scored_articles()] == [0.5] * 3
+
+def test_stored_keys(checkpoint):
+    """Stored keys accumulate across appends; an empty append writes nothing"""
+    assert checkpoint.stored_keys() == set()
+    checkpoint.append('stored', [])
+    assert not os.path.exists(checkpoint._stage_path('stored'))
+
+    keys = [article_key(article) for article in articles()]
+    checkpoint.append('stored', keys[:1])
+    checkpoint.append('stored', keys)
+    assert checkpoint.stored_keys() == set(keys)
+
+def test_summary_keys_round_trip(checkpoint):
+    """Summary keys are merged into the manifest and read back as dates"""
+    checkpoint.save_summary_keys([(1, date(2026, 3, 3)), (2, date(2026, 3, 4))])
+    checkpoint.save_summary_keys([(1, date(2026, 3, 3))])
+    assert checkpoint.summary_keys() == {(1, date(2026, 3, 3)), (2, date(2026, 3, 4))}
+
+def test_list_and_clean_up_stale_runs(tmp_path):
+    """Only checkpoints older than the retention are removed"""
+    directory = str(tmp_path)
+    old, recent = RunCheckpoint.create('20260101T000000', directory), RunCheckpoint.create('20260304T000000', directory)
+    os.makedirs(os.path.join(directory, 'not-a-run'))
+    stale = time.time() - 10 * 86400
+    os.utime(old._manifest_path(), (stale, stale))
+
+    assert RunCheckpoint.list_runs(directory) == [old.run_id, recent.run_id]
+    assert RunCheckpoint.cleanup_stale(7, directory) == 1
+    assert RunCheckpoint.list_runs(directory) == [recent.run_id]
+    assert RunCheckpoint.list_runs(str(tmp_path / 'missing')) == []
+
+class StubScraper:
+    """RSS scraper returning fixed articles and counting scrapes"""
+
+    def __init__(self):
+        self.calls = 0
+        self.rss_feeds = []
+
+    def scrape_and_match(self, feeds=None):
+        self.calls += 1
+        return articles(3, pipeline_ticker())
+
+class StubAnalyzer:
+    """Stand-in for SentimentAnalyzer (the pipeline under test replaces scoring)"""
+
+def pipeline_ticker() -> str:
+    """Ticker of a company the pipeline populates"""
+    from config.companies import FORTUNE_100_COMPANIES
+    return FORTUNE_100_COMPANIES[0]['ticker']
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    """Sequential NewsSentimentScraper over a DuckDB file, with stub scraping and scoring
+
+    Runs in a scratch directory, so the database, spool, checkpoints and logs
+    (relative data/ and logs/ paths) stay out of the tree.
+    """
+    pytest.importorskip('duckdb')
+    pytest.importorskip('pyarrow')
+    # Needs the scraping and sentiment dependencies and config/ to import
+    main = pytest.importorskip('src.main')
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('STORAGE_BACKEND', 'duckdb')
+    monkeypatch.setenv('PIPELINE_MODE', 'sequential')
+    monkeypatch.setattr(main, 'RSSScraper', StubScraper)
+    monkeypatch.setattr(main, 'SentimentAnalyzer', StubAnalyzer)
+
+    scraper = main.NewsSentimentScraper()
+    scraper.spool_load_retries = 1
+    scraper.scored_batches = []
+
+    def analyze_sentiment(batch):
+        scraper.scored_batches.append(len(batch))
+        return [NewsArticleWithSentiment(article=article, sentiment_analyses=[
+            SentimentAnalysis(engine=SentimentEngine.VADER, sentiment_score=0.4, sentiment_label=SentimentLabel.POSITIVE)
+        ]) for article in batch]
+
+    scraper.analyze_sentiment = analyze_sentiment
+    return scraper
+
+def test_resume_stores_checkpointed_articles_without_rescraping(scraper):
+    """A run that fails at storage resumes from its checkpoint: no new scrape or scoring, then summaries"""
+    store_data = scraper.store_data
+    scraper.store_data = lambda batch: False
+    assert not scraper.run_full_pipeline(run_id='run-1')
+
+    checkpoint = RunCheckpoint('run-1')
+    assert checkpoint.exists()
+    assert checkpoint.last_completed_stage() == 'scored'
+    assert checkpoint.stored_keys() == set()
+
+    scraper.store_data = store_data
+    assert scraper.run_full_pipeline(resume_run_id='run-1')
+
+    assert scraper.rss_scraper.calls == 1
+    assert scraper.scored_batches == [3]
+    assert not checkpoint.exists()
+    with scraper.db_manager:
+        counts = scraper.db_manager.execute_query(
+            "SELECT (SELECT COUNT(*) FROM NEWS_ARTICLES) AS articles, "
+            "(SELECT COUNT(*) FROM DAILY_SENTIMENT_SUMMARY) AS summaries")
+    assert counts['articles'][0] == 3
+    assert counts['summaries'][0] == 1
+
+def test_resume_of_unknown_run_fails(scraper):
+    """--resume with a run id that has no checkpoint does nothing"""
+    assert not scraper.run_full_pipeline(resume_run_id='missing')
+    assert scraper.rss_scraper.calls == 0
+
+def test_nothing_to_summarize_is_not_a_failure(scraper):
+    """With no touched company/days the summary step succeeds without touching storage"""
+    scraper.db_manager = None
+    assert scraper.generate_daily_summaries()
+    assert scraper.generate_daily_summaries([])
@@ -0,0 +1,78 @@
+"""
+Connection Pool Tests
+Health checks of idle connections run without holding the pool lock
+"""
+
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Needs the Snowflake connector and SQLAlchemy to import
+connection_pool = pytest.importorskip('src.database.connection_pool')
+
+class SlowConnection:
+    """Connection whose SELECT 1 takes a while (or fails)"""
+
+    def __init__(self, delay: float = 0.0, healthy: bool = True):
+        self.delay = delay
+        self.healthy = healthy
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    def cursor(self):
+        return self
+
+    def execute(self, query):
+        time.sleep(self.delay)
+        if not self.healthy:
+            raise ConnectionError('session expired')
+
+    def fetchone(self):
+        return (1,)
+
+    def close(self):
+        self.closed = True
+
+def pool_with_idle(*connections):
+    """Pool of max size 2 holding idle connections due a health check"""
+    pool = connection_pool.SnowflakeConnectionPool(dict, max_size=2, health_check_interval=0)
+    for connection in connections:
+        pool.release(connection)
+    return pool
+
+def test_health_check_does_not_hold_the_lock():
+    """Other threads can use the pool while an idle connection is being checked"""
+    slow = SlowConnection(delay=0.5)
+    pool = pool_with_idle(slow)
+
+    acquired = []
+    thread = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+    thread.start()
+    time.sleep(0.1)
+
+    start = time.perf_counter()
+    metrics = pool.metrics()
+    assert time.perf_counter() - start < 0.2
+    assert metrics['in_use'] == 1
+
+    thread.join()
+    assert acquired == [slow]
+    assert pool.metrics()['reuses'] == 1
+
+def test_unhealthy_idle_connection_is_replaced_by_another_idle_one():
+    """A failed check closes the connection and hands out the next idle one"""
+    healthy, broken = SlowConnection(), SlowConnection(healthy=False)
+    pool = pool_with_idle(healthy, broken)
+
+    assert pool.acquire() is healthy
+    assert broken.closed
+    metrics = pool.metrics()
+    assert metrics['health_check_failures'] == 1
+    assert metrics['in_use'] == 1
@@ -0,0 +1,186 @@
+"""
+DuckDB Backend Smoke Test
+Setup, upserts, summary/rollup refresh and the dashboard reads against an in-memory database
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('duckdb')
+
+from src.database.duckdb_manager import DuckDBManager
+from src.models.news_article import NewsArticle, SentimentAnalysis, SentimentEngine, SentimentLabel
+
+COMPANIES = [
+    {'rank': 1, 'name': 'Apple Inc.', 'ticker': 'AAPL', 'sector': 'Technology'},
+    {'rank': 2, 'name': 'Exxon Mobil', 'ticker': 'XOM', 'sector': 'Energy'},
+]
+
+@pytest.fixture
+def db():
+    """Migrated in-memory DuckDB backend"""
+    manager = DuckDBManager(':memory:')
+    assert manager.connect()
+    assert manager.setup_database()
+    yield manager
+    manager.disconnect()
+
+def label(score: float) -> SentimentLabel:
+    """Label matching a score"""
+    if score > 0.1:
+        return SentimentLabel.POSITIVE
+    if score < -0.1:
+        return SentimentLabel.NEGATIVE
+    return SentimentLabel.NEUTRAL
+
+def load_articles(db, scores):
+    """Store one article per (ticker, hours ago, source, score) with a VADER result; returns article ids"""
+    companies = db.insert_companies(COMPANIES)
+    now = datetime.utcnow()
+    articles = [
+        NewsArticle(title=f"{ticker} story {i}", url=f"https://example.com/{ticker}/{i}", source=source,
+                    published_date=now - timedelta(hours=hours_ago), company_id=companies[ticker], ticker=ticker)
+        for i, (ticker, hours_ago, source, _) in enumerate(scores)
+    ]
+    article_ids = db.upsert_news_articles(articles)
+    assert None not in article_ids
+
+    sentiment_ids = db.upsert_sentiment_analyses([
+        SentimentAnalysis(engine=SentimentEngine.VADER, sentiment_score=score, sentiment_label=label(score),
+                          article_id=article_id, company_id=article.company_id)
+        for article, article_id, (_, _, _, score) in zip(articles, article_ids, scores)
+    ])
+    assert None not in sentiment_ids
+
+    keys = db.get_rollup_keys()
+    assert db.refresh_daily_summaries(keys) > 0
+    assert db.refresh_rollups(keys) > 0
+    return article_ids
+
+def test_setup_is_idempotent_and_versioned(db):
+    """A second setup is a no-op and the version table records every local migration"""
+    assert db.setup_database()
+    versions = db.execute_query("SELECT version FROM SCHEMA_VERSION ORDER BY version")
+    assert not versions.empty
+    assert list(versions['version']) == list(range(1, len(versions) + 1))
+
+def test_separate_memory_databases_are_migrated(db):
+    """Verification is per database, so another in-memory database still gets its schema"""
+    other = DuckDBManager(':memory:')
+    assert other.connect()
+    try:
+        assert other.setup_database()
+        assert other.insert_companies(COMPANIES[:1])['AAPL']
+    finally:
+        other.disconnect()
+
+def test_upsert_is_idempotent(db):
+    """Re-upserting the same url keeps the article id"""
+    first = load_articles(db, [('AAPL', 1, 'Reuters', 0.5)])
+    second = load_articles(db, [('AAPL', 1, 'Reuters', 0.5)])
+    assert first == second
+    assert db.execute_query("SELECT COUNT(*) AS n FROM NEWS_ARTICLES")['n'][0] == 1
+
+def test_dashboard_reads(db):
+    """Dashboard datasets read back the stored scores from the rollup cube"""
+    # One article per company per day over five days (top companies need five scored days)
+    load_articles(db, [
+        (ticker, day * 24 + 1, 'Reuters' if day % 2 else 'Bloomberg', score)
+        for ticker, scores in (('AAPL', [0.6, 0.2, 0.6, 0.2, 0.4]), ('XOM', [-0.4, -0.2, -0.4, -0.2, -0.3]))
+        for day, score in enumerate(scores)
+    ])
+
+    data = db.get_dashboard_data(days=7)
+    assert set(data) == {'daily_data', 'top_companies', 'sector_data', 'source_data'}
+    assert all(not df.empty for df in data.values())
+
+    top = data['top_companies'].set_index('ticker')
+    assert top.loc['AAPL', 'avg_sentiment'] == pytest.approx(0.4)
+    assert top.loc['XOM', 'avg_sentiment'] == pytest.approx(-0.3)
+    assert top.loc['AAPL', 'total_articles'] == 5
+    assert list(top.index) == ['AAPL', 'XOM']
+
+    sectors = data['sector_data'].set_index('sector')
+    assert sectors.loc['Energy', 'sector_sentiment'] == pytest.approx(-0.3)
+
+    sources = data['source_data'].set_index('source')
+    assert sources.loc['Bloomberg', 'article_count'] == 6
+    assert sources.loc['Reuters', 'article_count'] == 4
+
+    assert not db.get_daily_sentiment_data(2, 'hour').empty
+
+def test_version_query_errors_are_not_treated_as_empty_schema(db):
+    """A failing version query raises instead of re-applying every migration"""
+    from src.database.duckdb_manager import local_migration_runner
+
+    class FailingConnection:
+        """Connection whose version query fails after the existence check"""
+        def __init__(self, connection):
+            self.connection = connection
+
+        def cursor(self):
+            cursor = self.connection.cursor()
+            execute = cursor.execute
+
+            def failing_execute(query, *args):
+                if 'MAX(version)' in query:
+                    raise RuntimeError('warehouse unavailable')
+                return execute(query, *args)
+
+            cursor.execute = failing_execute
+            return cursor
+
+    with pytest.raises(RuntimeError):
+        local_migration_runner.current_version(FailingConnection(db.connection))
+    assert local_migration_runner.current_version(db.connection) == local_migration_runner.latest_version
+
+def test_article_contents_with_and_without_archive(db, tmp_path):
+    """Hot, archived and content-less articles read back together"""
+    pytest.importorskip('pyarrow')
+    db.archive_dir = str(tmp_path / 'archive')
+    hot, archived, empty = load_articles(db, [
+        ('AAPL', 1, 'Reuters', 0.5),
+        ('AAPL', 2, 'Reuters', 0.3),
+        ('XOM', 3, 'Reuters', -0.2),
+    ])
+    cursor = db.connection.cursor()
+    cursor.execute("UPDATE NEWS_ARTICLES SET content = 'old news', scraped_date = scraped_date - INTERVAL 400 DAY "
+                   "WHERE article_id = ?", (archived,))
+    cursor.execute("UPDATE NEWS_ARTICLES SET content = 'fresh news' WHERE article_id = ?", (hot,))
+    cursor.close()
+
+    assert db.archive_article_content(365) == 1
+    assert db.get_article_contents([hot, archived, empty]) == {hot: 'fresh news', archived: 'old news'}
+
+def test_rollup_keys_respect_day_bounds(db):
+    """since/until select whole days by publication date, or scrape date for unpublished articles"""
+    companies = db.insert_companies(COMPANIES)
+    today = datetime.utcnow().date()
+    midnight = datetime.combine(today, datetime.min.time())
+    articles = [
+        NewsArticle(title=f"story {i}", url=f"https://example.com/{i}", source='Reuters',
+                    published_date=published, company_id=companies['AAPL'], ticker='AAPL')
+        for i, published in enumerate([
+            midnight - timedelta(days=3, seconds=1),
+            midnight - timedelta(days=3),
+            midnight - timedelta(days=2) - timedelta(seconds=1),
+            midnight - timedelta(hours=12),
+        ])
+    ]
+    articles.append(NewsArticle(title='unpublished', url='https://example.com/unpublished', source='Reuters',
+                                company_id=companies['XOM'], ticker='XOM'))
+    assert None not in db.upsert_news_articles(articles)
+
+    def days(*args):
+        return sorted((today - day).days for _, day in db.get_rollup_keys(*args))
+
+    assert days() == [0, 1, 3, 4]
+    assert days(today - timedelta(days=3)) == [0, 1, 3]
+    assert days(None, today - timedelta(days=3)) == [3, 4]
+    assert days(today - timedelta(days=3), today - timedelta(days=3)) == [3]
+    assert days(today, today) == [0]
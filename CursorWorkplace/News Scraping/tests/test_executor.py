@@ -0,0 +1,126 @@
+"""
+Concurrent Pipeline Tests
+ConcurrentPipeline.run with stub fetch, score and store stages
+"""
+
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('pydantic')
+
+from src.pipeline.executor import ConcurrentPipeline
+from src.models.news_article import NewsArticle, NewsArticleWithSentiment
+
+FEEDS = [{'name': f"feed{i}", 'url': f"https://example.com/feed{i}.xml"} for i in range(4)]
+
+def stub_score(articles, target_company_sentences):
+    """Process-pool task: wrap articles without scoring them (spawned workers import it from this module)"""
+    return [NewsArticleWithSentiment(article=article) for article in articles], 0.0
+
+def failing_score(articles, target_company_sentences):
+    """Process-pool task that fails every batch"""
+    raise RuntimeError('model not loaded')
+
+def articles_for(feed, count: int = 5):
+    """Matched articles of one feed"""
+    return [NewsArticle(title=f"{feed['name']} story {i}", source=feed['name'],
+                        url=f"https://example.com/{feed['name']}/{i}") for i in range(count)]
+
+def pipeline(score_task=stub_score, **kwargs) -> ConcurrentPipeline:
+    """Small pipeline with one scoring process and no feed delay"""
+    options = dict(fetch_workers=2, score_workers=1, queue_size=2, score_batch_size=4, store_batch_size=6,
+                   flush_seconds=0.2, feed_delay=0)
+    options.update(kwargs)
+    return ConcurrentPipeline(score_task=score_task, score_initializer=None, **options)
+
+def pipeline_threads():
+    """Threads the pipeline started that are still alive"""
+    return [thread for thread in threading.enumerate() if thread.name.startswith('pipeline-')]
+
+def test_every_article_is_stored_and_threads_exit():
+    """All fetched articles reach storage and the stage threads are gone when run returns"""
+    stored = []
+
+    def store(batch):
+        stored.extend(item.article.url for item in batch)
+        return True
+
+    report = pipeline().run(FEEDS, articles_for, store)
+
+    stages = report['stages']
+    assert sorted(stored) == sorted(article.url for feed in FEEDS for article in articles_for(feed))
+    assert stages['fetch']['items'] == stages['score']['items'] == stages['store']['items'] == 20
+    assert not any(stage['errors'] for stage in stages.values())
+    assert pipeline_threads() == []
+
+def test_store_failure_is_an_error_not_stored_items():
+    """A batch whose store fails counts one error and no stored items"""
+    calls = []
+
+    def store(batch):
+        calls.append(len(batch))
+        return len(calls) != 1
+
+    report = pipeline().run(FEEDS, articles_for, store)
+
+    store_stage = report['stages']['store']
+    assert store_stage['errors'] == 1
+    assert store_stage['items'] == sum(calls) - calls[0]
+    assert pipeline_threads() == []
+
+def test_store_exception_is_counted():
+    """An exception from store is caught by the writer and counted"""
+    def store(batch):
+        raise ConnectionError('warehouse unavailable')
+
+    report = pipeline().run(FEEDS, articles_for, store)
+
+    assert report['stages']['store']['items'] == 0
+    assert report['stages']['store']['errors'] >= 1
+    assert pipeline_threads() == []
+
+def test_fetch_exception_skips_only_that_feed():
+    """A feed whose fetch raises is counted as an error and the other feeds are still stored"""
+    stored = []
+
+    def fetch(feed):
+        if feed['name'] == 'feed1':
+            raise TimeoutError('feed host unreachable')
+        return articles_for(feed)
+
+    def store(batch):
+        stored.extend(batch)
+        return True
+
+    report = pipeline().run(FEEDS, fetch, store)
+
+    assert report['stages']['fetch']['errors'] == 1
+    assert report['stages']['fetch']['items'] == 15
+    assert len(stored) == 15
+    assert pipeline_threads() == []
+
+def test_scoring_failures_reach_no_store():
+    """Failed scoring batches are counted and nothing is stored"""
+    stored = []
+
+    report = pipeline(score_task=failing_score).run(FEEDS, articles_for, lambda batch: stored.extend(batch) or True)
+
+    assert report['stages']['score']['errors'] == 5
+    assert report['stages']['score']['items'] == 0
+    assert stored == []
+    assert pipeline_threads() == []
+
+def test_empty_feed_list_finishes_promptly():
+    """With nothing to fetch, the end-of-stream markers still shut every stage down"""
+    start = time.perf_counter()
+    report = pipeline().run([], articles_for, lambda batch: True)
+
+    assert all(stage['items'] == 0 for stage in report['stages'].values())
+    assert time.perf_counter() - start < 30
+    assert pipeline_threads() == []
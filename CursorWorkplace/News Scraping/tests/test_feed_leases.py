@@ -0,0 +1,125 @@
+"""
+Feed Lease Tests
+Concurrent claims, lease steals and the storage fence against a shared DuckDB file
+"""
+
+import os
+import sys
+import time
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('duckdb')
+
+from src.database.duckdb_manager import DuckDBManager
+from src.pipeline.leases import FeedLeaseManager
+from src.pipeline.worker import FeedWorker
+
+FEEDS = [{'name': f"feed{i}", 'url': f"https://example.com/feed{i}.xml"} for i in range(10)]
+
+@pytest.fixture
+def database(tmp_path):
+    """Path of a migrated DuckDB file with a lease row per feed"""
+    path = str(tmp_path / 'leases.duckdb')
+    manager = DuckDBManager(path)
+    assert manager.setup_database()
+    assert FeedLeaseManager(manager).sync_partitions(FEEDS)
+    manager.disconnect()
+    return path
+
+def lease_manager(path: str, worker_id: str, ttl_seconds: float = 60) -> FeedLeaseManager:
+    """Lease manager with its own connection, as on a separate worker"""
+    manager = DuckDBManager(path)
+    assert manager.connect()
+    return FeedLeaseManager(manager, worker_id=worker_id, ttl_seconds=ttl_seconds, renew_seconds=ttl_seconds / 3)
+
+def holders(path: str) -> dict:
+    """partition_key -> worker currently holding it"""
+    manager = DuckDBManager(path)
+    assert manager.connect()
+    try:
+        leases = manager.get_feed_leases()
+        return {key: worker for key, worker in zip(leases['partition_key'], leases['worker_id'])
+                if isinstance(worker, str)}
+    finally:
+        manager.disconnect()
+
+def due_before() -> datetime:
+    """Feeds not completed within the last hour are due"""
+    return datetime.utcnow() - timedelta(hours=1)
+
+def test_concurrent_claims_are_exclusive(database):
+    """Workers claiming at the same moment never hold the same partition"""
+    managers = [lease_manager(database, f"worker{i}") for i in range(4)]
+    start = threading.Barrier(len(managers))
+    claimed = {}
+
+    def claim(manager):
+        start.wait()
+        # A claim that loses a write conflict gets nothing; it simply tries again
+        for _ in range(20):
+            keys = manager.claim(3, due_before())
+            if keys:
+                claimed[manager.worker_id] = keys
+                return
+
+    threads = [threading.Thread(target=claim, args=(manager,)) for manager in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    keys = [key for worker_keys in claimed.values() for key in worker_keys]
+    assert keys
+    assert len(keys) == len(set(keys))
+    assert holders(database) == {key: worker for worker, worker_keys in claimed.items() for key in worker_keys}
+
+def test_expired_lease_is_stolen_and_fenced(database):
+    """A stalled worker loses its expired leases to another worker and its fence closes"""
+    stalled = lease_manager(database, 'stalled', ttl_seconds=0.2)
+    taker = lease_manager(database, 'taker')
+
+    keys = stalled.claim(2, due_before())
+    assert len(keys) == 2
+    # Unexpired leases cannot be claimed
+    assert not set(taker.claim(len(FEEDS), due_before())) & set(keys)
+    taker.finish(completed=False)
+
+    time.sleep(0.3)
+    stolen = taker.claim(len(FEEDS), due_before())
+    assert set(keys) <= set(stolen)
+
+    assert not stalled.renew()
+    assert not stalled.holds_all()
+
+    # The stalled worker's release must not free partitions the taker now holds
+    stalled.finish(completed=False)
+    assert all(holders(database)[key] == 'taker' for key in keys)
+
+def test_completed_partitions_are_not_due(database):
+    """A worker run completes its partitions, so no worker claims them again within the interval"""
+    calls = []
+
+    class Scraper:
+        """Pipeline stand-in: every run succeeds, even with no matched articles"""
+        class rss_scraper:
+            rss_feeds = FEEDS
+
+        def run_full_pipeline(self, run_id=None, feeds=None, fence=None):
+            calls.append(([feed['name'] for feed in feeds], fence()))
+            return True
+
+    worker = FeedWorker(Scraper(), lease_manager(database, 'worker'), partitions_per_claim=4, idle_seconds=0)
+    assert worker.run(max_cycles=3) == 3
+
+    processed = [name for names, _ in calls for name in names]
+    assert sorted(processed) == sorted(feed['name'] for feed in FEEDS)
+    assert all(fenced for _, fenced in calls)
+
+    other = lease_manager(database, 'other')
+    assert other.claim(len(FEEDS), due_before()) == []
+    assert holders(database) == {}
@@ -0,0 +1,116 @@
+"""
+Keyword Extractor Tests
+Hashed document frequencies, npz persistence and single vs batch extraction
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('scipy')
+pytest.importorskip('sklearn')
+
+from src.sentiment import keyword_extractor
+from src.sentiment.keyword_extractor import TfidfKeywordExtractor
+
+TEXTS = [
+    "Apple shares rallied after strong iPhone sales and record services revenue",
+    "Exxon Mobil profits fell as crude prices slipped and refining margins narrowed",
+    "Apple faces antitrust scrutiny over App Store payments in Europe",
+]
+
+@pytest.fixture
+def extractor(tmp_path):
+    """Small extractor persisting to a temporary directory"""
+    return TfidfKeywordExtractor(n_buckets=2 ** 12, state_path=str(tmp_path / 'state' / 'keyword_df.npz'))
+
+def test_document_frequencies_count_documents_not_occurrences(extractor):
+    """A token repeated in one document adds one to its bucket; empty documents are not counted"""
+    extractor.update([['apple', 'apple', 'shares'], ['apple'], []])
+
+    assert extractor.doc_count == 2
+    assert extractor.doc_freq[extractor._bucket('apple')] == 2
+    assert extractor.doc_freq[extractor._bucket('shares')] == 1
+    assert extractor.doc_freq.sum() == 3
+
+def test_buckets_are_stable_and_in_range(extractor):
+    """Buckets come from murmurhash, so they match across processes and instances"""
+    other = TfidfKeywordExtractor(n_buckets=extractor.n_buckets, state_path=None)
+    for token in ('apple', 'exxon', 'revenue'):
+        assert 0 <= extractor._bucket(token) < extractor.n_buckets
+        assert extractor._bucket(token) == other._bucket(token)
+
+def test_tokenize_drops_stop_words_and_short_words(extractor):
+    """Lowercased tokens without stop words or words under the minimum length"""
+    assert extractor.tokenize("The CEO of Apple and an AI lab") == ['ceo', 'apple', 'lab']
+    assert extractor.tokenize('') == []
+
+def test_corpus_frequency_lowers_common_terms(extractor):
+    """A term seen in every earlier document ranks below one that is rare in the corpus"""
+    extractor.update([extractor.tokenize("market update apple") for _ in range(50)])
+    assert extractor.extract("market antitrust", max_keywords=2) == ['antitrust', 'market']
+
+def test_save_and_load_round_trip(extractor):
+    """Frequencies, document count and bucket count survive an npz round trip"""
+    extractor.extract_batch(TEXTS)
+    assert extractor.save()
+
+    loaded = TfidfKeywordExtractor.load(extractor.state_path)
+    assert loaded.n_buckets == extractor.n_buckets
+    assert loaded.doc_count == extractor.doc_count == len(TEXTS)
+    assert loaded.doc_freq.dtype == np.uint32
+    assert np.array_equal(loaded.doc_freq, extractor.doc_freq)
+    assert loaded.extract_batch(TEXTS, update=False) == extractor.extract_batch(TEXTS, update=False)
+
+def test_load_without_state_starts_empty(tmp_path):
+    """A missing state file gives an empty corpus that saves to that path"""
+    path = str(tmp_path / 'missing.npz')
+    extractor = TfidfKeywordExtractor.load(path)
+    assert extractor.doc_count == 0
+    assert extractor.state_path == path
+
+def test_save_without_path_is_skipped():
+    """Extractors with no state path (scoring workers) never write"""
+    assert not TfidfKeywordExtractor(n_buckets=16, state_path=None).save()
+
+def test_failed_save_keeps_previous_state(extractor, monkeypatch):
+    """A failed write leaves the old file in place and no temporary file behind"""
+    extractor.extract_batch(TEXTS[:1])
+    assert extractor.save()
+    directory = os.path.dirname(extractor.state_path)
+
+    def failing_savez(handle, **arrays):
+        handle.write(b'partial')
+        raise OSError('disk full')
+
+    monkeypatch.setattr(keyword_extractor.np, 'savez_compressed', failing_savez)
+    extractor.extract_batch(TEXTS[1:])
+    assert not extractor.save()
+    monkeypatch.undo()
+
+    assert os.listdir(directory) == ['keyword_df.npz']
+    assert TfidfKeywordExtractor.load(extractor.state_path).doc_count == 1
+
+def test_extract_matches_batch_without_updating(extractor):
+    """extract scores like extract_batch against the same corpus but leaves the corpus alone"""
+    extractor.update([extractor.tokenize(text) for text in TEXTS])
+    before = extractor.doc_freq.copy()
+
+    single = [extractor.extract(text, max_keywords=5) for text in TEXTS]
+    assert extractor.doc_count == len(TEXTS)
+    assert np.array_equal(extractor.doc_freq, before)
+    assert single == extractor.extract_batch(TEXTS, max_keywords=5, update=False)
+
+def test_extract_batch_updates_before_scoring(extractor):
+    """extract_batch folds the batch into the corpus, and handles empty and stop-word-only texts"""
+    keywords = extractor.extract_batch(TEXTS + ['', 'the and of'], max_keywords=3)
+
+    assert extractor.doc_count == len(TEXTS)
+    assert keywords[-2:] == [[], []]
+    assert all(0 < len(row) <= 3 for row in keywords[:len(TEXTS)])
+    assert all(set(row) <= set(extractor.tokenize(text)) for row, text in zip(keywords, TEXTS))
+    assert extractor.extract_batch([]) == []
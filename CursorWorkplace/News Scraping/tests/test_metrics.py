@@ -0,0 +1,92 @@
+"""
+Metrics Sink Tests
+Label handling of the Prometheus sink, the sentiment step timers and per-subsystem flushes of the shared sink
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.metrics import InMemoryMetricsSink, LogMetricsSink, PrometheusMetricsSink
+from src.sentiment.instrumentation import SentimentInstrumentation
+from src.database.query_instrumentation import QueryInstrumentation
+
+@pytest.fixture
+def sink(monkeypatch):
+    """Prometheus sink registering into a private registry"""
+    prometheus_client = pytest.importorskip('prometheus_client')
+    registry = prometheus_client.CollectorRegistry()
+    for kind in ('Counter', 'Histogram'):
+        metric_class = getattr(prometheus_client, kind)
+        monkeypatch.setattr(prometheus_client, kind,
+                            lambda *args, _class=metric_class, **kwargs: _class(*args, registry=registry, **kwargs))
+    sink = PrometheusMetricsSink(namespace='test')
+    sink.registry = registry
+    return sink
+
+def test_step_timers_share_label_names(sink):
+    """Steps with and without an engine record into the same metrics"""
+    instrumentation = SentimentInstrumentation(sink=sink)
+    with instrumentation.timer('clean_text'):
+        pass
+    with instrumentation.timer('engine', 'vader'):
+        pass
+
+    calls = sink.registry.get_sample_value
+    assert calls('test_sentiment_step_calls_total', {'step': 'clean_text', 'engine': ''}) == 1
+    assert calls('test_sentiment_step_calls_total', {'step': 'engine', 'engine': 'vader'}) == 1
+    assert calls('test_sentiment_step_seconds_count', {'step': 'engine', 'engine': 'vader'}) == 1
+
+def test_mismatched_labels_are_normalized(sink):
+    """Later samples with missing or extra labels use the registered label names"""
+    sink.increment('events', 1, {'step': 'a', 'engine': 'x'})
+    sink.increment('events', 2, {'step': 'a'})
+    sink.increment('events', 3, {'step': 'a', 'engine': 'x', 'extra': 'y'})
+
+    calls = sink.registry.get_sample_value
+    assert calls('test_events_total', {'step': 'a', 'engine': ''}) == 2
+    assert calls('test_events_total', {'step': 'a', 'engine': 'x'}) == 4
+
+def test_sentiment_flush_keeps_other_subsystems_metrics():
+    """The sentiment analyzer's flush ends only its own window in the shared sink"""
+    shared = LogMetricsSink()
+    queries = QueryInstrumentation(sink=shared)
+    sentiment = SentimentInstrumentation(sink=shared)
+
+    queries.record("SELECT * FROM NEWS_ARTICLES WHERE article_id = 1", 0.02, rows=1)
+    shared.increment('pipeline_stage_items', 5, {'stage': 'store'})
+    with sentiment.timer('clean_text'):
+        pass
+    sentiment.flush()
+
+    snapshot = shared.snapshot()
+    assert not any(name.startswith('sentiment_') for name in snapshot['timings'])
+    assert any(name.startswith('db_query_seconds') for name in snapshot['timings'])
+    assert snapshot['counters']['pipeline_stage_items{stage=store}'] == 5
+
+    # The per-run query report keeps its own aggregates; logging it ends the query window
+    assert queries.report()['executions'] == 1
+    queries.log_report()
+    assert shared.snapshot('db_query_') == {'timings': {}, 'counters': {}, 'histograms': {}}
+    assert shared.snapshot()['counters'] == {'pipeline_stage_items{stage=store}': 5}
+
+def test_prefix_snapshot_and_reset():
+    """Snapshots and resets can be scoped to a name prefix; no prefix covers everything"""
+    sink = InMemoryMetricsSink()
+    sink.record_timing('db_query_seconds', 0.5)
+    sink.observe('sentiment_text_length_chars', 100)
+    sink.increment('sentiment_step_calls')
+
+    assert list(sink.snapshot('sentiment_')['counters']) == ['sentiment_step_calls']
+    assert list(sink.snapshot('sentiment_')['histograms']) == ['sentiment_text_length_chars']
+    assert sink.snapshot('sentiment_')['timings'] == {}
+
+    sink.reset('sentiment_')
+    assert list(sink.snapshot()['timings']) == ['db_query_seconds']
+    assert not sink.snapshot()['counters'] and not sink.snapshot()['histograms']
+
+    sink.reset()
+    assert sink.snapshot() == {'timings': {}, 'counters': {}, 'histograms': {}}
@@ -0,0 +1,117 @@
+"""
+Rollup Cover Tests
+cover_window tiles a window with day/week/month cells exactly once, and window_filter reads them back
+"""
+
+import os
+import sys
+from datetime import datetime, date, timedelta
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.database.rollup import bucket_start, bucket_end, cover_window, window_bounds, window_filter
+
+def covered_days(runs) -> list:
+    """Days read by the runs, one entry per cell day, checking every cell is aligned to its granularity"""
+    days = []
+    for granularity, start, end in runs:
+        position = start
+        while position < end:
+            assert bucket_start(granularity, position) == position
+            cell_end = bucket_end(granularity, position)
+            assert cell_end <= end
+            while position < cell_end:
+                days.append(position.date())
+                position += timedelta(days=1)
+    return days
+
+def expected_days(start: datetime, end: datetime) -> list:
+    """Every calendar day overlapping [start, end)"""
+    if end <= start:
+        return []
+    day, days = start.date(), []
+    while datetime.combine(day, datetime.min.time()) < end:
+        days.append(day)
+        day += timedelta(days=1)
+    return days
+
+def assert_tiles(start: datetime, end: datetime):
+    """No day is read twice or dropped and consecutive runs meet"""
+    runs = cover_window(start, end)
+    days = covered_days(runs)
+    assert days == expected_days(start, end)
+    assert all(previous[2] == run[1] for previous, run in zip(runs, runs[1:]))
+    return runs
+
+@pytest.mark.parametrize('start, end', [
+    (datetime(2026, 3, 4, 13, 30), datetime(2026, 3, 4, 14, 15)),    # inside one hour
+    (datetime(2026, 3, 4, 13, 30), datetime(2026, 3, 9, 9, 45)),     # mid-day to mid-day
+    (datetime(2026, 3, 4), datetime(2026, 3, 19)),                   # Wednesday to Thursday
+    (datetime(2026, 1, 15), datetime(2026, 4, 17)),                  # mid-month to mid-month
+    (datetime(2025, 12, 20, 6), datetime(2026, 2, 3, 18)),           # across a year boundary
+])
+def test_ragged_windows_are_tiled_exactly(start, end):
+    """Windows starting and ending mid-hour, mid-day, mid-week and mid-month"""
+    assert_tiles(start, end)
+
+@pytest.mark.parametrize('moment', [datetime(2026, 3, 4), datetime(2026, 3, 4, 13, 30)])
+def test_zero_length_window_reads_nothing(moment):
+    """An empty window has no cells, even inside a day"""
+    assert cover_window(moment, moment) == []
+    assert cover_window(moment, moment - timedelta(hours=1)) == []
+
+def test_every_start_and_length_tiles_exactly():
+    """Every start over a year and a spread of lengths, including ones not ending on a day boundary"""
+    first = datetime(2025, 11, 1)
+    for offset in range(400):
+        start = first + timedelta(days=offset)
+        for length in (timedelta(0), timedelta(hours=5), timedelta(days=1), timedelta(days=6),
+                       timedelta(days=7, hours=3), timedelta(days=31), timedelta(days=45), timedelta(days=92),
+                       timedelta(days=366)):
+            assert_tiles(start, start + length)
+
+def test_coarse_cells_are_used_when_they_fit():
+    """A calendar month is one month cell and a Monday-to-Monday span is one week cell"""
+    assert cover_window(datetime(2026, 2, 1), datetime(2026, 3, 1)) == [
+        ('month', datetime(2026, 2, 1), datetime(2026, 3, 1))]
+    assert cover_window(datetime(2026, 3, 9), datetime(2026, 3, 16)) == [
+        ('week', datetime(2026, 3, 9), datetime(2026, 3, 16))]
+
+    # A quarter reads a handful of cells, not ninety
+    assert len(covered_days(cover_window(datetime(2026, 1, 10), datetime(2026, 4, 10)))) == 90
+    assert len(cover_window(datetime(2026, 1, 10), datetime(2026, 4, 10))) <= 6
+
+def test_window_bounds_cover_today():
+    """The window is today and the N days before it, as with >= CURRENT_DATE - N"""
+    start, end = window_bounds(7, date(2026, 3, 4))
+    assert end == datetime(2026, 3, 5)
+    assert start == datetime(2026, 2, 25)
+
+@pytest.mark.parametrize('days', [1, 6, 7, 30, 45, 90, 365])
+def test_window_filter_counts_each_day_once(days):
+    """Summing one article per day through the chosen cells counts the window's days exactly once"""
+    duckdb = pytest.importorskip('duckdb')
+    start, end = window_bounds(days)
+
+    # Every cell of every granularity overlapping the window, counting its days
+    cells = []
+    for granularity in ('day', 'week', 'month'):
+        position = bucket_start(granularity, start)
+        while position < end:
+            cell_end = bucket_end(granularity, position)
+            cells.append((granularity, position, (cell_end - position).days))
+            position = cell_end
+
+    connection = duckdb.connect(':memory:')
+    try:
+        connection.execute("CREATE TABLE SENTIMENT_ROLLUP (granularity VARCHAR, bucket_start TIMESTAMP, "
+                           "article_count INTEGER)")
+        connection.executemany("INSERT INTO SENTIMENT_ROLLUP VALUES (?, ?, ?)", cells)
+        total = connection.execute(f"SELECT SUM(r.article_count) FROM SENTIMENT_ROLLUP r "
+                                   f"WHERE {window_filter(days)}").fetchone()[0]
+    finally:
+        connection.close()
+
+    assert total == (end - start).days
@@ -0,0 +1,33 @@
+"""
+Pipeline Run History Tests
+Peak memory is sampled per run rather than read from the process-lifetime peak
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('psutil')
+
+from src.pipeline.run_history import PipelineRunRecorder
+
+def test_peak_rss_is_per_run(tmp_path, monkeypatch):
+    """A later run does not inherit an earlier run's memory peak"""
+    monkeypatch.setenv('PIPELINE_RSS_SAMPLE_SECONDS', '0.02')
+    history_path = str(tmp_path / 'runs.jsonl')
+
+    first = PipelineRunRecorder('first', 'sequential', history_path=history_path)
+    block = bytearray(200 * 1024 * 1024)
+    time.sleep(0.2)
+    del block
+    first_run = first.finish('succeeded')
+
+    second = PipelineRunRecorder('second', 'sequential', history_path=history_path)
+    time.sleep(0.1)
+    second_run = second.finish('succeeded')
+
+    assert first_run['peak_rss_mb'] - second_run['peak_rss_mb'] > 150
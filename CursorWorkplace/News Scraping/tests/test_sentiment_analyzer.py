@@ -0,0 +1,111 @@
+"""
+Sentiment Analyzer Tests
+Keyword statistic save cadence and company-targeted sentence windows, without downloading NLTK data or loading models
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Needs textblob, vaderSentiment, nltk and scikit-learn to import
+sentiment_analyzer = pytest.importorskip('src.sentiment.sentiment_analyzer')
+
+from src.sentiment.instrumentation import SentimentInstrumentation
+from src.sentiment.keyword_extractor import TfidfKeywordExtractor
+from src.utils.metrics import InMemoryMetricsSink
+
+@pytest.fixture
+def analyzer(tmp_path):
+    """SentimentAnalyzer with a keyword extractor persisting to a temporary file"""
+    analyzer = sentiment_analyzer.SentimentAnalyzer.__new__(sentiment_analyzer.SentimentAnalyzer)
+    analyzer.instrumentation = SentimentInstrumentation(InMemoryMetricsSink())
+    analyzer.keyword_extractor = TfidfKeywordExtractor(n_buckets=2 ** 12, state_path=str(tmp_path / 'keyword_df.npz'))
+    analyzer.unsaved_keyword_batches = 0
+    return analyzer
+
+def test_keyword_state_is_saved_every_n_batches_and_at_run_end(analyzer, monkeypatch):
+    """Batches are saved every KEYWORD_SAVE_BATCHES and the remainder by save_keyword_state"""
+    monkeypatch.setattr(sentiment_analyzer, 'KEYWORD_SAVE_BATCHES', 3)
+    path = analyzer.keyword_extractor.state_path
+    batch = [("Apple shares rallied", "Record services revenue lifted the stock.")]
+
+    for _ in range(2):
+        assert analyzer.record_corpus(batch)
+    assert not os.path.exists(path)
+
+    analyzer.record_corpus(batch)
+    assert TfidfKeywordExtractor.load(path).doc_count == 3
+    assert analyzer.unsaved_keyword_batches == 0
+
+    analyzer.record_corpus(batch)
+    assert TfidfKeywordExtractor.load(path).doc_count == 3
+    assert analyzer.save_keyword_state()
+    assert TfidfKeywordExtractor.load(path).doc_count == 4
+
+    # Nothing new to write
+    assert not analyzer.save_keyword_state()
+
+TITLE = "Markets close mixed"
+CONTENT = ("Apple rose two percent on services growth. Oil prices fell. Banks were flat. "
+           "Retailers slipped on weak guidance. Apple later gave back part of its gain.")
+TEXT = TITLE + " " + CONTENT
+
+def sentences(spans, text=TEXT):
+    """Text of each selected span"""
+    return [text[start:end] for start, end in spans]
+
+def test_every_sentence_mentioning_the_company_is_selected(analyzer):
+    """Separate mentions give separate spans with no neighbours at window 0"""
+    spans = analyzer.select_company_spans(TITLE, CONTENT, ['Apple'], window=0)
+    assert sentences(spans) == ["Apple rose two percent on services growth.",
+                                "Apple later gave back part of its gain."]
+
+def test_neighbouring_sentences_merge_into_one_span(analyzer):
+    """Window sentences around each mention are merged where they touch"""
+    spans = analyzer.select_company_spans(TITLE, CONTENT, ['Apple'], window=1)
+    assert sentences(spans) == [
+        "Markets close mixed Apple rose two percent on services growth. Oil prices fell.",
+        "Retailers slipped on weak guidance. Apple later gave back part of its gain.",
+    ]
+
+def test_alias_and_ticker_match_case_insensitively(analyzer):
+    """Any search term matches, ignoring case"""
+    content = "Shares of XOM dipped. Chevron was unchanged. exxon mobil cut its outlook."
+    spans = analyzer.select_company_spans("Energy stocks", content, ['Exxon Mobil', 'XOM', ''], window=0)
+    assert sentences(spans, "Energy stocks " + content) == ["Shares of XOM dipped.", "exxon mobil cut its outlook."]
+
+def test_window_is_clipped_at_the_start_and_end(analyzer):
+    """A wide window around the title and the last sentence stays inside the article"""
+    title = "Apple beats estimates"
+    content = "Revenue rose. Margins held. Apple raised its dividend."
+    spans = analyzer.select_company_spans(title, content, ['apple'], window=5)
+    assert spans == [(0, len(title) + 1 + len(content))]
+
+    spans = analyzer.select_company_spans("Quarterly results", "Revenue rose. Margins held. Apple raised its dividend.",
+                                          ['apple'], window=1)
+    assert sentences(spans, "Quarterly results Revenue rose. Margins held. Apple raised its dividend.") == [
+        "Margins held. Apple raised its dividend."]
+
+def test_title_only_article(analyzer):
+    """Without content the title is the only sentence"""
+    assert analyzer.select_company_spans("Apple unveils a new phone", None, ['Apple']) == [(0, 25)]
+    assert analyzer.select_company_spans("Apple unveils a new phone", None, []) == []
+
+def test_targeted_text_scores_only_the_spans(analyzer):
+    """Targeted text joins the spans and records their offsets"""
+    text, span_data = analyzer._targeted_text(TITLE, CONTENT, ['Apple'], window=0)
+
+    assert text == "Apple rose two percent on services growth. Apple later gave back part of its gain."
+    assert sentences(span_data['scored_spans']) == ["Apple rose two percent on services growth.",
+                                                    "Apple later gave back part of its gain."]
+    assert span_data['sentence_window'] == 0
+    assert span_data['scored_chars'] == len(text) - 1
+    assert span_data['total_chars'] == len(TEXT)
+
+@pytest.mark.parametrize('search_terms', [None, [], ['Microsoft', 'MSFT']])
+def test_no_match_falls_back_to_the_full_text(analyzer, search_terms):
+    """Without terms, or when no sentence mentions the company, the whole article is scored"""
+    assert analyzer._targeted_text(TITLE, CONTENT, search_terms, window=1) == (TEXT, None)
@@ -0,0 +1,95 @@
+"""
+Snowflake Content Archive Tests
+Archive a row to the stage and read it back through a cursor emulating Parquet unload semantics
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Needs the Snowflake connector and config/ to import
+snowflake_manager = pytest.importorskip('src.database.snowflake_manager')
+
+from src.database.storage_backend import StorageBackend, content_hash
+
+ARTICLE_ID = 7
+CONTENT = 'Quarterly results beat expectations'
+
+def select_fields(select_list: str) -> list:
+    """Parquet field names Snowflake writes for an unload SELECT list (unquoted names are upper-cased)"""
+    items, depth, current = [], 0, ''
+    for char in select_list:
+        depth += (char == '(') - (char == ')')
+        if char == ',' and not depth:
+            items.append(current)
+            current = ''
+        else:
+            current += char
+    items.append(current)
+
+    fields = []
+    for item in items:
+        alias = re.search(r'\bAS\s+("?)(\w+)\1\s*$', item.strip(), re.IGNORECASE)
+        name = alias.group(2) if alias else item.strip()
+        fields.append(name if alias and alias.group(1) else name.upper())
+    return fields
+
+class StageCursor:
+    """Cursor over one NEWS_ARTICLES row and a stage; $1:field reads are case-sensitive, as in Snowflake"""
+
+    def __init__(self, database):
+        self.database = database
+        self.results = []
+        self.rowcount = 0
+
+    def execute(self, query, params=None):
+        if query.strip().startswith('COPY INTO'):
+            fields = select_fields(re.search(r'SELECT(.*?)FROM NEWS_ARTICLES', query, re.S).group(1))
+            values = [ARTICLE_ID, 'https://example.com/a', CONTENT, content_hash(CONTENT)]
+            self.database['stage'] = dict(zip(fields, values))
+            self.results = [(1, 0, 0)]
+        elif query.strip().startswith('UPDATE NEWS_ARTICLES'):
+            row = self.database['stage']
+            matched = row.get('article_id') == ARTICLE_ID and row.get('content_hash') == content_hash(CONTENT)
+            if matched:
+                self.database['article'] = (ARTICLE_ID, None, row['content_hash'], params[0])
+            self.rowcount = int(matched)
+        elif '$1:' in query:
+            row = self.database['stage']
+            self.results = ([(row['article_id'], row.get('content'))]
+                            if row.get('article_id') in params else [])
+        else:
+            self.results = [self.database['article']]
+
+    def fetchall(self):
+        return self.results
+
+    def close(self):
+        pass
+
+class StageConnection:
+    """Connection handing out StageCursors over shared state"""
+
+    def __init__(self):
+        self.database = {'article': (ARTICLE_ID, CONTENT, None, None)}
+
+    def cursor(self):
+        return StageCursor(self.database)
+
+@pytest.fixture
+def manager():
+    """SnowflakeManager bound to the emulated stage instead of a pooled connection"""
+    manager = snowflake_manager.SnowflakeManager.__new__(snowflake_manager.SnowflakeManager)
+    StorageBackend.__init__(manager)
+    manager.connection = StageConnection()
+    return manager
+
+def test_archived_content_reads_back(manager):
+    """An archived row is cleared from the hot table and read back from the stage"""
+    assert manager.archive_article_content(365) == 1
+    assert manager.connection.database['article'][1] is None
+    assert manager.get_article_contents([ARTICLE_ID]) == {ARTICLE_ID: CONTENT}
@@ -0,0 +1,94 @@
+"""
+Snowflake Fetch Tests
+Arrow fetches for SELECTs and row-tuple fetches for DML, DDL and SHOW through execute_query
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pd = pytest.importorskip('pandas')
+
+# Needs the Snowflake connector and config/ to import
+snowflake_manager = pytest.importorskip('src.database.snowflake_manager')
+
+from src.database.storage_backend import StorageBackend
+
+class ResultCursor:
+    """Cursor whose results are Arrow for queries and JSON rows otherwise, as in Snowflake"""
+
+    def __init__(self, results):
+        self.results = results
+        self.description = None
+        self.rowcount = None
+        self.rows = []
+        self.arrow = None
+
+    def execute(self, query, params=None):
+        self.arrow, columns, self.rows, self.rowcount = self.results[query.split()[0].upper()]
+        self.description = [(column,) for column in columns] or None
+
+    def fetch_pandas_all(self):
+        if not self.arrow:
+            raise TypeError('fetch_pandas_all is only supported for Arrow results')
+        return pd.DataFrame(self.rows, columns=[desc[0] for desc in self.description])
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+class ResultConnection:
+    """Connection handing out ResultCursors"""
+
+    results = {
+        'SELECT': (True, ['TICKER', 'ARTICLE_COUNT'], [('AAPL', 3), ('XOM', 1)], 2),
+        'WITH': (True, ['N'], [(1,)], 1),
+        'UPDATE': (False, ['number of rows updated', 'number of multi-joined rows updated'], [(4, 0)], 4),
+        'CREATE': (False, ['status'], [('Table T successfully created.',)], 1),
+        'SHOW': (False, ['created_on', 'name'], [('2026-01-01', 'NEWS_ARTICLES')], 1),
+        'ALTER': (False, [], [], 0),
+    }
+
+    def cursor(self):
+        return ResultCursor(self.results)
+
+@pytest.fixture
+def manager():
+    """SnowflakeManager bound to the stub connection"""
+    manager = snowflake_manager.SnowflakeManager.__new__(snowflake_manager.SnowflakeManager)
+    StorageBackend.__init__(manager)
+    manager.connection = ResultConnection()
+    return manager
+
+def test_selects_fetch_arrow_results(manager):
+    """SELECT and WITH queries (after comments or parentheses) come back through fetch_pandas_all"""
+    df = manager.execute_query("SELECT ticker, COUNT(*) AS article_count FROM NEWS_ARTICLES GROUP BY ticker")
+    assert list(df.columns) == ['ticker', 'article_count']
+    assert df.attrs['rowcount'] == 2
+    assert len(manager.execute_query("WITH t AS (SELECT 1 AS n) SELECT n FROM t")) == 1
+
+    for query in ("-- report\nSELECT 1", "/* report */ (SELECT 1)"):
+        assert snowflake_manager.ARROW_RESULT_PATTERN.match(query)
+
+@pytest.mark.parametrize('query, columns, rowcount', [
+    ("UPDATE NEWS_ARTICLES SET content = NULL", ['number of rows updated', 'number of multi-joined rows updated'], 4),
+    ("CREATE TABLE T (id INTEGER)", ['status'], 1),
+    ("SHOW TABLES", ['created_on', 'name'], 1),
+])
+def test_other_statements_keep_their_result_rows(manager, query, columns, rowcount):
+    """DML, DDL and SHOW results are row tuples with their columns and the cursor rowcount"""
+    df = manager.execute_query(query)
+    assert list(df.columns) == columns
+    assert len(df) == 1
+    assert df.attrs['rowcount'] == rowcount
+
+def test_statement_without_result_columns(manager):
+    """A statement with no result description gives an empty DataFrame, not an error"""
+    df = manager.execute_query("ALTER SESSION SET QUERY_TAG = 'x'")
+    assert df.empty
+    assert df.attrs['rowcount'] == 0
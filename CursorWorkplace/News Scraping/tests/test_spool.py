@@ -0,0 +1,118 @@
+"""
+Parquet Spool Tests
+Write/read round trips of scored batches and loading them into DuckDB
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+pytest.importorskip('pandas')
+pytest.importorskip('pyarrow')
+
+from src.database.spool import ParquetSpool
+from src.models.news_article import (
+    NewsArticle, NewsArticleWithSentiment, SentimentAnalysis, SentimentEngine, SentimentLabel
+)
+
+PUBLISHED = datetime(2026, 3, 4, 9, 30, 15, 123456)
+
+def scored(ticker, index, sentiments=()):
+    """Scored article with one (engine, score, keywords) analysis per sentiment"""
+    return NewsArticleWithSentiment(
+        article=NewsArticle(title=f"{ticker} story {index}", url=f"https://example.com/{ticker}/{index}",
+                            source='Reuters', content=None if index else 'Body text',
+                            published_date=PUBLISHED if not index else None, ticker=ticker),
+        sentiment_analyses=[
+            SentimentAnalysis(engine=engine, sentiment_score=score, keywords=keywords, confidence_score=0.5,
+                              sentiment_label=SentimentLabel.POSITIVE if score > 0.1 else SentimentLabel.NEUTRAL)
+            for engine, score, keywords in sentiments
+        ]
+    )
+
+@pytest.fixture
+def spool(tmp_path):
+    """Empty spool in a temporary directory"""
+    return ParquetSpool(str(tmp_path / 'spool'))
+
+def test_batch_round_trip(spool):
+    """Articles and sentiment rows read back as written, keyed by ticker and url"""
+    batch = [
+        scored('aapl', 0, [(SentimentEngine.VADER, 0.6, ['iphone', 'services']), (SentimentEngine.TEXTBLOB, 0.0, None)]),
+        scored('XOM', 1),
+        NewsArticleWithSentiment(article=NewsArticle(title='No url', source='Reuters', ticker='XOM')),
+    ]
+    batch_id = spool.write_batch(batch)
+
+    assert spool.pending_batches() == [batch_id]
+    assert not [name for name in os.listdir(spool.spool_dir) if name.endswith('.tmp')]
+
+    articles_df, sentiment_df = spool.read_batch(batch_id)
+    articles = spool.records(articles_df)
+    assert [row['ticker'] for row in articles] == ['AAPL', 'XOM']
+    assert [row['url'] for row in articles] == [item.article.url for item in batch[:2]]
+    assert articles[0]['content'] == 'Body text' and articles[1]['content'] is None
+    assert articles[0]['published_date'] == PUBLISHED
+    assert articles[1]['published_date'] is None
+    assert articles[1]['scraped_date'] == batch[1].article.scraped_date
+
+    sentiments = spool.records(sentiment_df)
+    assert [(row['url'], row['engine'], row['sentiment_label']) for row in sentiments] == [
+        (batch[0].article.url, 'vader', 'positive'), (batch[0].article.url, 'textblob', 'neutral')]
+    assert sentiments[0]['keywords'] == '["iphone", "services"]'
+    assert sentiments[1]['keywords'] is None
+    assert sentiments[0]['sentiment_score'] == pytest.approx(0.6)
+
+def test_batch_without_storable_articles_is_not_written(spool):
+    """Articles need a url and a ticker to be spooled"""
+    batch = [NewsArticleWithSentiment(article=NewsArticle(title='No ticker', source='Reuters',
+                                                          url='https://example.com/x'))]
+    assert spool.write_batch(batch) is None
+    assert spool.write_batch([]) is None
+    assert os.listdir(spool.spool_dir) == []
+
+def test_pending_batches_and_mark_loaded(spool):
+    """Batches are pending oldest first until loaded; a sentiment file alone is not a batch"""
+    first = spool.write_batch([scored('AAPL', 1)])
+    second = spool.write_batch([scored('XOM', 1)])
+    open(os.path.join(spool.spool_dir, 'orphan.sentiment.parquet'), 'wb').close()
+
+    assert spool.pending_batches() == [first, second]
+
+    spool.mark_loaded([first])
+    assert spool.pending_batches() == [second]
+    assert not any(name.startswith(first) for name in os.listdir(spool.spool_dir))
+
+def test_spooled_batches_load_into_storage(spool):
+    """Loading resolves tickers to companies, stores the sentiment rows and can be repeated"""
+    pytest.importorskip('duckdb')
+    from src.database.duckdb_manager import DuckDBManager
+
+    db = DuckDBManager(':memory:')
+    assert db.connect() and db.setup_database()
+    try:
+        db.insert_companies([{'rank': 1, 'name': 'Apple Inc.', 'ticker': 'AAPL', 'sector': 'Technology'}])
+        batch = [
+            scored('AAPL', 0, [(SentimentEngine.VADER, 0.6, ['iphone'])]),
+            scored('AAPL', 1, [(SentimentEngine.VADER, 0.0, None)]),
+            scored('MSFT', 1, [(SentimentEngine.VADER, 0.3, None)]),
+        ]
+        batch_id = spool.write_batch(batch)
+
+        # Unknown tickers are skipped; unpublished articles are keyed by scrape date
+        keys = db.load_spooled_batches(spool, [batch_id])
+        company_id = db.get_company_id('AAPL')
+        assert keys == sorted({(company_id, PUBLISHED.date()), (company_id, batch[1].article.scraped_date.date())})
+
+        # Reloading a batch (after a crash before mark_loaded) upserts the same rows
+        assert db.load_spooled_batches(spool, [batch_id]) == keys
+        counts = db.execute_query("SELECT (SELECT COUNT(*) FROM NEWS_ARTICLES) AS articles, "
+                                  "(SELECT COUNT(*) FROM SENTIMENT_ANALYSIS) AS sentiments")
+        assert counts['articles'][0] == 2
+        assert counts['sentiments'][0] == 2
+    finally:
+        db.disconnect()